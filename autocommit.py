@@ -12,16 +12,30 @@ exit 1
 
 import os
 import sys
+import asyncio
 import subprocess
 from dotenv import load_dotenv
 import openai
 
+try:
+    from llm.llm_config import create_llm_backend, load_model_config
+except ImportError:
+    # Installed standalone (see AUTOCOMMIT-SETUP.md) without the bot's llm package
+    create_llm_backend = None
+
 # Load environment variables from the .env file
 load_dotenv()
 
 # Initialize the OpenAI API
 openai.api_key = os.getenv('OPENAI_API_KEY')
 
+if create_llm_backend:
+    llm_backend = create_llm_backend()
+    COMMIT_MESSAGE_MODEL = load_model_config()['commit_message']
+else:
+    llm_backend = None
+    COMMIT_MESSAGE_MODEL = os.getenv('LLM_MODEL_COMMIT_MESSAGE', 'gpt-3.5-turbo-16k-0613')
+
 def get_staged_diff():
     """Get the git diff of the staged changes in the current repository."""
     return os.popen('git diff --cached').read()
@@ -56,8 +70,11 @@ def generate_commit_message(diff):
         "content": diff
     }
 
+    if llm_backend:
+        return asyncio.run(llm_backend.complete(COMMIT_MESSAGE_MODEL, [system_message, user_message]))
+
     response = openai.ChatCompletion.create(
-        model="gpt-3.5-turbo-16k-0613",
+        model=COMMIT_MESSAGE_MODEL,
         messages=[system_message, user_message]
     )
 
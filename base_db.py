@@ -38,6 +38,26 @@ class BaseDB:
         """
         self.conn.close()
 
+    def ping(self, timeout: int = 3) -> bool:
+        """
+        Checks that the MySQL database accepts connections, e.g. for a readiness check.
+
+        The check opens its own short-lived connection, so it can run in another thread
+        without touching the connection used by the queries.
+
+        :param timeout: The number of seconds to wait for the connection.
+        :return: True if a connection could be opened.
+        """
+        try:
+            conn = mysql.connector.connect(**self.config, connection_timeout=timeout)
+            try:
+                return conn.is_connected()
+            finally:
+                conn.close()
+        except Exception as e:
+            print(f"MySQL ping failed: {e}")
+            return False
+
     def execute_query(self, query, params=None):
         if not self.conn.is_connected():
             print("Reconnecting to MySQL")
@@ -52,3 +72,25 @@ class BaseDB:
             self.conn.rollback()
         finally:
             cursor.close()
+
+    def add_column_if_missing(self, table: str, column: str, definition: str):
+        """
+        Adds a column to a table created before the column existed.
+
+        :param table: The name of the table.
+        :param column: The name of the column.
+        :param definition: The column definition, e.g. "INT NOT NULL DEFAULT 0 AFTER post_id".
+        """
+        if not self.conn.is_connected():
+            print("Reconnecting to MySQL")
+            self.connect()
+
+        c = self.conn.cursor()
+        try:
+            c.execute(f"SHOW COLUMNS FROM {table} LIKE %s", (column,))
+            exists = c.fetchone() is not None
+        finally:
+            c.close()
+
+        if not exists:
+            self.execute_query(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
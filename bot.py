@@ -1,43 +1,64 @@
 # Import required modules
 import os
+import socket
 import pytz
 import asyncio
-from typing import List
+import math
+from collections import Counter
+from typing import List, Optional, Tuple
 from dotenv import load_dotenv
 from datetime import datetime, timedelta
-from multiprocessing import Process
 
 from streaks.streaks_db import StreaksDB
 from team_members.team_member_db import TeamMemberDB
 from updates.updates_db import UpdatesDB
 from weekly_posts.weekly_posts_db import WeeklyPostsDB
+from weekly_summaries.weekly_summaries_db import WeeklySummariesDB
+from scheduled_jobs.scheduled_jobs_db import ScheduledJobsDB
+from status_sessions.status_sessions_db import StatusSessionsDB
+from leases.leases_db import LeasesDB
 
 from streaks.streaks_manager import StreaksManager
 from team_members.team_member_manager import TeamMemberManager
 from updates.updates_manager import UpdatesManager
 from weekly_posts.weekly_post_manager import WeeklyPostManager
+from weekly_summaries.weekly_summary_manager import WeeklySummaryManager
+from status_sessions.status_session_manager import StatusSessionManager
+from status_sessions.status_session import StatusSession
+from leases.lease_manager import LeaseManager
+
+from llm.llm_config import create_llm_backend
 
 from scheduler import Scheduler
+from scheduler_telemetry import SchedulerTelemetry
+from scheduled_jobs.mysql_job_store import MySQLJobStore
+from message_streamer import MessageStreamer
+from report_review_view import ReportReviewView, CONFIRM, REVISE, SUBMIT
+from discord_outbox import OutboundDispatcher
+from health_server import HealthServer
+from stage_tracer import StageTracer
 from team_members.team_member import TeamMember
+from tenants.tenant import Tenant, DEFAULT_TEAM
+from tenants.tenant_registry import TenantRegistry, load_tenants
+from worker_partition import member_partition
 
 from discord.ext import commands, tasks
 from discord import Intents, DMChannel
 
-from flask import Flask
-import openai
 from asyncio import Task, ensure_future, CancelledError
 import requests
 
-app = Flask(__name__)
-
 # Load environment variables from the .env file
 load_dotenv()
 
 # Retrieve bot, guild, and channel tokens from environment variables
 BOT_TOKEN = os.getenv('DISCORD_BOT_TOKEN')
-GUILD_TOKEN = int(os.getenv('DISCORD_GUILD_TOKEN'))
-CHANNEL_TOKEN = int(os.getenv('DISCORD_CHANNEL_TOKEN'))
-ADMIN_DISCORD_ID = int(os.getenv('ADMIN_DISCORD_ID'))
+GUILD_TOKEN = int(os.getenv('DISCORD_GUILD_TOKEN', 0))
+CHANNEL_TOKEN = int(os.getenv('DISCORD_CHANNEL_TOKEN', 0))
+ADMIN_DISCORD_ID = int(os.getenv('ADMIN_DISCORD_ID', 0))
+
+# JSON file listing the teams served by the bot; without it the bot serves the single team configured above
+TENANTS_FILE = os.getenv('TENANTS_FILE')
 
 # Retrieve database credentials from environment variables
 MYSQL_HOST = os.getenv('MYSQL_HOST')
@@ -49,46 +70,169 @@ MYSQL_PORT = os.getenv('MYSQL_PORT')
 ORG_NAME = os.getenv('GITHUB_ORG_NAME')
 ORG_TOKEN = os.getenv('GITHUB_ORG_TOKEN')
 
-OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
+# Maximum number of member summaries generated at the same time by !teamdigest
+TEAM_DIGEST_CONCURRENCY = int(os.getenv('TEAM_DIGEST_CONCURRENCY', 4))
+
+# Minutes before each status request to harvest commits and build the technical report (0 disables)
+PREWARM_LEAD_MINUTES = int(os.getenv('PREWARM_LEAD_MINUTES', 10))
+# Pre-warmed reports older than this are rebuilt from scratch
+PREWARM_MAX_AGE = timedelta(hours=2)
+
+# Stream LLM output into DMs by progressively editing a message, at most once per STREAM_EDIT_INTERVAL seconds
+STREAM_LLM_OUTPUT = os.getenv('STREAM_LLM_OUTPUT', 'true').lower() == 'true'
+STREAM_EDIT_INTERVAL = float(os.getenv('STREAM_EDIT_INTERVAL', 1.0))
+
+# Minutes a status conversation waits for the member's answer at each stage before it is recorded
+# as missed; STATUS_TIMEOUT_<STAGE> (e.g. STATUS_TIMEOUT_GOALS) overrides the default for one stage
+STATUS_STAGE_TIMEOUT_MINUTES = int(os.getenv('STATUS_STAGE_TIMEOUT_MINUTES', 240))
+STATUS_STAGE_TIMEOUTS = {
+    stage: 60 * int(os.getenv(f'STATUS_TIMEOUT_{stage.upper()}', STATUS_STAGE_TIMEOUT_MINUTES))
+    for stage in StatusSession.WAITING_STAGES
+}
+# How often persisted conversations that are no longer running are checked for expiry
+STATUS_REAPER_INTERVAL_MINUTES = int(os.getenv('STATUS_REAPER_INTERVAL_MINUTES', 15))
+# Seconds before a conversation interrupted by a Discord, GitHub or LLM timeout is resumed
+STATUS_RETRY_SECONDS = int(os.getenv('STATUS_RETRY_SECONDS', 60))
+
+# Scheduled runs missed while the bot was down are still executed if at most this many seconds late
+SCHEDULER_MISFIRE_GRACE_SECONDS = int(os.getenv('SCHEDULER_MISFIRE_GRACE_SECONDS', 3600))
+
+# Members sharing a time zone are spread over this many seconds after their trigger,
+# with at most STATUS_DISPATCH_MAX_IN_FLIGHT dispatches running at the same time (0 is unlimited)
+STATUS_DISPATCH_WINDOW_SECONDS = int(os.getenv('STATUS_DISPATCH_WINDOW_SECONDS', 300))
+STATUS_DISPATCH_MAX_IN_FLIGHT = int(os.getenv('STATUS_DISPATCH_MAX_IN_FLIGHT', 5))
+
+# Check-ins and roster changes rebuild the weekly post at most once per this many seconds
+WEEKLY_POST_FLUSH_SECONDS = float(os.getenv('WEEKLY_POST_FLUSH_SECONDS', 10))
+# The weekly post is split into one message per this many members to stay under Discord's length limit
+WEEKLY_POST_SHARD_SIZE = int(os.getenv('WEEKLY_POST_SHARD_SIZE', 20))
+
+# Number of recent status conversations whose stage timings are kept for !slowstandups
+STAGE_TRACE_CAPACITY = int(os.getenv('STAGE_TRACE_CAPACITY', 200))
+
+# Worker mode: WORKER_COUNT processes split the members' conversations by a hash of their Discord ID,
+# and the one holding the leader lease runs the weekly posts and the database side of the rollovers
+WORKER_COUNT = int(os.getenv('WORKER_COUNT', 1))
+WORKER_INDEX = int(os.getenv('WORKER_INDEX', 0))
+WORKER_MODE = WORKER_COUNT > 1
+# The leader lease runs out this many seconds after the leader stopped renewing it
+LEADER_LEASE_SECONDS = int(os.getenv('LEADER_LEASE_SECONDS', 30))
+# Workers pick up the roster changes and check-ins of the other workers this often
+WORKER_SYNC_SECONDS = int(os.getenv('WORKER_SYNC_SECONDS', 30))
+
+# Teams that failed to start, e.g. because their guild was not cached yet, are retried this often
+TENANT_RETRY_SECONDS = int(os.getenv('TENANT_RETRY_SECONDS', 60))
 
 # Initialize bot with default intents
 intents = Intents.default()
 intents.members = True
 intents.message_content = True
 bot = commands.Bot(command_prefix='!', intents=intents)
-openai.api_key = OPENAI_API_KEY
+
+# LLM backend (OpenAI or the local stub) selected through LLM_BACKEND
+llm_backend = create_llm_backend()
+
+# Each team's members, weekly post and schedule; the managers below are shared by all teams
+if TENANTS_FILE:
+    tenant_registry = TenantRegistry(load_tenants(TENANTS_FILE))
+else:
+    tenant_registry = TenantRegistry([Tenant(DEFAULT_TEAM, GUILD_TOKEN, CHANNEL_TOKEN, [ADMIN_DISCORD_ID])])
 
 # TODO: Remove these globals
 streaks_manager = None
-weekly_post_manager = None
-team_member_manager = None
 updates_manager = None
-scheduler = None
+weekly_summary_manager = None
+status_session_manager = None
+# Scheduled runs of every team are recorded in one telemetry
+scheduler_telemetry = None
+# The task running each member's status conversation, so a newer request can cancel it
 ongoing_status_requests = {}
+resumed_status_sessions = set()
+# The status conversations currently running, indexed by Discord ID
+live_status_sessions = {}
+prewarmed_reports = {}
+# Number of status conversations started, resumed, completed and missed since startup
+status_session_counts = Counter()
+# Serves the health checks and metrics from the bot's event loop, started by setup_hook
+health_server = None
+# The lease that makes one worker the leader, set once the bot is ready in worker mode
+leader_lease = None
+
+def owns_member(discord_id: int) -> bool:
+    """Returns whether this worker runs the member's status conversations."""
+    return member_partition(discord_id, WORKER_COUNT) == WORKER_INDEX
+
+def is_leader() -> bool:
+    """Returns whether this worker runs the singleton duties, such as the weekly posts."""
+    return not WORKER_MODE or (leader_lease is not None and leader_lease.is_held)
+
+def request_post_rebuild(tenant: Tenant, discord_id: Optional[int] = None) -> Optional[asyncio.Future]:
+    """Schedules an update of a team's weekly post on the leader; other workers' changes reach it through sync_workers.
+
+    Returns a future resolved with the seconds the update took, or None on the other workers.
+    """
+    if is_leader():
+        return tenant.weekly_post_manager.request_rebuild(tenant.team_member_manager.team_members, discord_id)
+    return None
 
-THUMBS_UP_EMOJI = "👍"
-PENCIL_EMOJI = "✏️"
-REPORT_SUBMISSION_EMOJI = '📝'
-
-async def weekly_state_reset(weekly_post_manager: WeeklyPostManager, streaks_manager: StreaksManager, team_members: List[TeamMember]):
-    # Reset streaks for the previous week
-    for member in team_members:
-        if not member.on_vacation and member.weekly_checkins < 5:
-            streaks_manager.reset_streak(member.discord_id)
-            member.reset_streak()
+def refresh_member_stats(members: List[TeamMember]) -> List[int]:
+    """Reloads the members' streaks and weekly check-ins from the database in two batched queries.
+
+    Returns the Discord IDs of the members whose streak or check-ins changed.
+    """
+    streaks = streaks_manager.get_streaks([member.discord_id for member in members])
+    checkins = updates_manager.get_weekly_checkins_counts([(member.discord_id, member.time_zone) for member in members])
+    changed_ids = []
+    for member in members:
+        streak = streaks.get(member.discord_id, 0)
+        weekly_checkins = checkins.get(member.discord_id, 0)
+        if streak != member.current_streak or weekly_checkins != member.weekly_checkins:
+            member.update_streak(streak)
+            member.update_weekly_checkins(weekly_checkins)
+            changed_ids.append(member.discord_id)
+    return changed_ids
+
+# All messages sent by the bot are queued per channel through this dispatcher
+outbox = OutboundDispatcher()
+
+# Stage timings of recent status conversations
+stage_tracer = StageTracer(STAGE_TRACE_CAPACITY)
+
+# Review choices waiting for a button click, indexed by the report message ID
+pending_review_choices = {}
+# The persistent view that handles the review buttons of every report, created once the loop runs
+review_view = None
+# The database connections the teams are started on, created once by setup_hook
+team_member_db = None
+weekly_posts_db = None
+scheduled_jobs_db = None
+# Set once on_ready started the teams, so a reconnect does not start them again;
+# the teams that failed to start are retried by retry_tenants
+tenants_started = False
+
+async def weekly_rollover(members: List[TeamMember], weekly_post_manager: WeeklyPostManager, streaks_manager: StreaksManager, team_members: List[TeamMember]):
+    """Start the new week for the members of one time zone at their local Monday."""
+    # Reset streaks for the previous week in one batched write; every worker resets its copy of the members
+    missed_members = [member for member in members if not member.on_vacation and member.weekly_checkins < 5]
+    if is_leader():
+        streaks_manager.reset_streaks([member.discord_id for member in missed_members])
+    for member in missed_members:
+        member.reset_streak()
+    for member in members:
         member.reset_weekly_checkins()
-    
-    # Initialize new weekly post
-    await weekly_post_manager.initialize_post(team_members)
 
-def get_all_commit_messages_for_user(org_name: str, token: str, member: TeamMember) -> list:
-    """Retrieve all commit messages for a user across all repos in an organization from the last 24 hours."""
-    
-    headers = {
-        "Authorization": f"token {token}",
-        "Accept": "application/vnd.github.v3+json"
-    }
-    
+    if not is_leader():
+        return
+
+    # The first time zone to reach Monday starts the new weekly post, the others update their lines on it.
+    # Members whose time zone has not reached Monday yet are shown without check-ins on the new post.
+    week_start = datetime.now(pytz.timezone(members[0].time_zone))
+    if not await weekly_post_manager.initialize_post(team_members, week_start):
+        for member in members:
+            weekly_post_manager.request_rebuild(team_members, member.discord_id)
+
+def get_commit_since_date(member: TeamMember) -> str:
+    """Return the GitHub 'since' timestamp for a member: their last update, or 24 hours ago if they have none."""
     last_update_timestamp, user_time_zone = updates_manager.get_last_update_timestamp(member.discord_id)
     if last_update_timestamp:
         # Convert the timestamp to UTC
@@ -103,7 +247,24 @@ def get_all_commit_messages_for_user(org_name: str, token: str, member: TeamMemb
         # If no updates found, default to last 24 hours
         since_date = (datetime.utcnow() - timedelta(days=1)).isoformat() + 'Z'
 
-    all_commit_messages = []
+    return since_date
+
+def get_all_commit_messages_for_user(org_name: str, token: str, member: TeamMember, since_date: str = None) -> list:
+    """Retrieve all commit messages for a user across all repos in an organization since their last update."""
+    return list(get_all_commits_for_user(org_name, token, member, since_date).values())
+
+def get_all_commits_for_user(org_name: str, token: str, member: TeamMember, since_date: str = None) -> dict:
+    """Retrieve the messages of all commits of a user across all repos in an organization, indexed by SHA."""
+    
+    headers = {
+        "Authorization": f"token {token}",
+        "Accept": "application/vnd.github.v3+json"
+    }
+    
+    if since_date is None:
+        since_date = get_commit_since_date(member)
+
+    all_commits = {}
 
     # Paginate through all repositories in the organization
     repos_url = f"https://api.github.com/orgs/{org_name}/repos?type=all&per_page=100"
@@ -129,8 +290,8 @@ def get_all_commit_messages_for_user(org_name: str, token: str, member: TeamMemb
                     break
                 
                 commits = response.json()
-                repo_commit_messages = [commit["commit"]["message"] for commit in commits]
-                all_commit_messages.extend(repo_commit_messages)
+                for commit in commits:
+                    all_commits[commit["sha"]] = commit["commit"]["message"]
 
                 # Check for the 'next' link for commits pagination
                 commits_url = get_pagination_link(response.headers, 'next')
@@ -138,7 +299,7 @@ def get_all_commit_messages_for_user(org_name: str, token: str, member: TeamMemb
         # Check for the 'next' link for repositories pagination
         repos_url = get_pagination_link(response.headers, 'next')
 
-    return all_commit_messages
+    return all_commits
 
 def get_pagination_link(headers, rel):
     """Extract pagination link for the 'rel' type from the Link header."""
@@ -151,175 +312,449 @@ def get_pagination_link(headers, rel):
 
     return None
 
-async def send_status_request(member: TeamMember, 
-                              weekly_post_manager: WeeklyPostManager, 
-                              streaks_manager: StreaksManager, 
-                              updates_manager: UpdatesManager):
+async def harvest_technical_report(member: TeamMember, since_date: str = None, on_delta=None) -> dict:
+    """Harvest a member's commits and summarize them into a technical report.
+
+    The GitHub scan runs in a worker thread so it does not block the event loop.
+    """
+    with stage_tracer.span('commit_harvest'):
+        if since_date is None:
+            since_date = get_commit_since_date(member)
+        harvested_at = datetime.utcnow()
+        commits = await asyncio.to_thread(get_all_commits_for_user, ORG_NAME, ORG_TOKEN, member, since_date)
+    commit_messages = list(commits.values())
+    summary = None
+    if commit_messages:
+        with stage_tracer.span('llm_technical_summary'):
+            summary = await updates_manager.summarize_technical_updates(commit_messages, on_delta)
+    return {'commits': commits, 'commit_messages': commit_messages, 'summary': summary,
+            'since_date': since_date, 'harvested_at': harvested_at}
+
+async def prewarm_status_request(member: TeamMember):
+    """Prepare a member's technical report ahead of their scheduled status request."""
     if member.weekly_checkins == 5:
-        return  # If already completed 5 check-ins, do nothing
+        return  # No status request will be sent
 
-    user = bot.get_user(member.discord_id)
-    if user:
-        # Notify the admin that a status request is being sent
-        admin_user = bot.get_user(ADMIN_DISCORD_ID)
-        if admin_user:
-            await admin_user.send(f"Status request sent to {member.name}.")
-
-        # Cancel the previous task if it exists
-        ongoing_task: Task = ongoing_status_requests.get(member.discord_id)
-        if ongoing_task:
-            ongoing_task.cancel()
-
-        # Retrieve all commit messages for the member
-        commit_messages = get_all_commit_messages_for_user(ORG_NAME, ORG_TOKEN, member)
+    prewarm_task = ensure_future(harvest_technical_report(member))
+    prewarmed_reports[member.discord_id] = prewarm_task
+    try:
+        await prewarm_task
+    except Exception as e:
+        print(f"Failed to pre-warm the report for {member.name}: {e}")
+
+async def get_technical_report(member: TeamMember, on_delta=None):
+    """Return (commit_messages, summarized_report) for a member, reusing a pre-warmed report when available.
+
+    on_delta is only called when the summary has to be generated now, so a pre-warmed report is never streamed.
+    """
+    report = None
+    prewarm_task = prewarmed_reports.pop(member.discord_id, None)
+    if prewarm_task:
+        try:
+            # Waits for the pre-warm if it is still running
+            report = await prewarm_task
+        except Exception:
+            report = None
+
+    if report is None or datetime.utcnow() - report['harvested_at'] > PREWARM_MAX_AGE:
+        report = await harvest_technical_report(member, on_delta=on_delta)
+        return report['commit_messages'], report['summary']
+
+    # Cheap refresh: GitHub filters by commit date, not push time, so a commit made before the
+    # pre-warm can still be pushed after it. Scan the pre-warm's window again and only
+    # summarize again if a commit the pre-warm did not see turned up.
+    with stage_tracer.span('commit_harvest'):
+        commits = await asyncio.to_thread(get_all_commits_for_user, ORG_NAME, ORG_TOKEN, member, report['since_date'])
+    new_commit_messages = [message for sha, message in commits.items() if sha not in report['commits']]
+    if not new_commit_messages:
+        return report['commit_messages'], report['summary']
+
+    commit_messages = report['commit_messages'] + new_commit_messages
+    with stage_tracer.span('llm_technical_summary'):
+        return commit_messages, await updates_manager.summarize_technical_updates(commit_messages, on_delta)
+
+def make_streamer(destination, header: str = "") -> Optional[MessageStreamer]:
+    """Return a MessageStreamer for LLM output sent to the destination, or None if streaming is disabled."""
+    if not STREAM_LLM_OUTPUT:
+        return None
+    return MessageStreamer(destination, header, edit_interval=STREAM_EDIT_INTERVAL, outbox=outbox)
+
+REVIEW_PROMPT = "Press **Confirm** to accept the report, **Revise with AI** to iterate on it, or **Submit my own** to write your own report."
+
+async def handle_review_choice(interaction, choice: str):
+    """Handles a click on the review buttons of any report message."""
+    pending = pending_review_choices.get(interaction.message.id)
+    # Every worker receives the click; the one running the member's conversation answers it
+    if pending is None and not owns_member(interaction.user.id):
+        return
+    if pending is None or pending[0] != interaction.user.id or pending[1].done():
+        await interaction.response.send_message("This report is no longer waiting for an answer.", ephemeral=True)
+        return
 
-        if not commit_messages:
-            summarized_report = "You have no commits for the previous working day."
-            msg = f"{summarized_report}\nReact with {THUMBS_UP_EMOJI} to confirm, {PENCIL_EMOJI} to iterate with AI, or {REPORT_SUBMISSION_EMOJI} to submit your own report."
-        else:
-            summarized_report = await updates_manager.summarize_technical_updates(commit_messages)
-            msg = f"Here's your summarized report based on your commits:\n{summarized_report}\nReact with {THUMBS_UP_EMOJI} to confirm, {PENCIL_EMOJI} to iterate with AI, or {REPORT_SUBMISSION_EMOJI} to submit your own report."
-
-        raw_updates = summarized_report
-
-        # Send initial message and wait for reaction
-        await user.send(
-            f"# Good morning {member.name}, time for your daily status update!\n"
-            f"### I'm first going to check your commit messages and try to build a technical report for you.\n"
-            f"### Next I will ask you for any non-technical updates from your previous work day.\n"
-            f"### Finally I will ask you what you plan to work on today."
-        )
-        sent_message = await user.send(msg)
-        await sent_message.add_reaction(THUMBS_UP_EMOJI)
-        await sent_message.add_reaction(PENCIL_EMOJI)
-        await sent_message.add_reaction(REPORT_SUBMISSION_EMOJI)
-        
-        def check(m) -> bool:
-            return m.author == user and isinstance(m.channel, DMChannel)
-
-        # Store the new wait_for reaction task in the global dictionary
-        ongoing_task = ensure_future(bot.wait_for('reaction_add', check=lambda r, u: u == user and r.message.id == sent_message.id and isinstance(r.message.channel, DMChannel) and str(r.emoji) in [THUMBS_UP_EMOJI, PENCIL_EMOJI, REPORT_SUBMISSION_EMOJI]))
-        ongoing_status_requests[member.discord_id] = ongoing_task
-        reaction, reactor = await ongoing_task
-        ongoing_status_requests.pop(member.discord_id, None)  # Remove the task once we get the reaction
-        
-        for emoji in [THUMBS_UP_EMOJI, PENCIL_EMOJI, REPORT_SUBMISSION_EMOJI]:
-            await sent_message.remove_reaction(emoji, bot.user)
-        
-        while str(reaction.emoji) in [PENCIL_EMOJI, REPORT_SUBMISSION_EMOJI]:
-            if str(reaction.emoji) == PENCIL_EMOJI:
-                await user.send("What would you like me to change?")
-                
-                # Store the new wait_for message (feedback) task in the global dictionary
-                ongoing_task = ensure_future(bot.wait_for('message', check=check))
-                ongoing_status_requests[member.discord_id] = ongoing_task
-                feedback = await ongoing_task
-                ongoing_status_requests.pop(member.discord_id, None)  # Remove the task once we get the feedback
-                    
-                # Send original + feedback to LLM for reformatting
-                summarized_report = await updates_manager.summarize_feedback_and_revisions(summarized_report, feedback.content)
-
-            elif str(reaction.emoji) == REPORT_SUBMISSION_EMOJI:
-                await user.send("Please submit your technical report directly.")
-                
-                # Store the new wait_for message (report submission) task in the global dictionary
-                ongoing_task = ensure_future(bot.wait_for('message', check=check))
-                ongoing_status_requests[member.discord_id] = ongoing_task
-                direct_report = await ongoing_task
-                ongoing_status_requests.pop(member.discord_id, None)  # Remove the task once we get the report
-
-                summarized_report = direct_report.content
-                break  # Exit the while loop as the user has submitted their report directly
-
-            msg = f"Here's the revised report:\n{summarized_report}\nReact with {THUMBS_UP_EMOJI} to confirm, {PENCIL_EMOJI} to iterate with AI, or {REPORT_SUBMISSION_EMOJI} to submit your own report."
-            
-            last_sent_message = await send_long_message(user, msg)
-            if last_sent_message:
-                await last_sent_message.add_reaction(THUMBS_UP_EMOJI)
-                await last_sent_message.add_reaction(PENCIL_EMOJI)
-                await last_sent_message.add_reaction(REPORT_SUBMISSION_EMOJI)
-            
-            # Store the new wait_for reaction task in the global dictionary
-            ongoing_task = ensure_future(bot.wait_for('reaction_add', check=lambda r, u: u == user and r.message.id == last_sent_message.id and isinstance(r.message.channel, DMChannel) and str(r.emoji) in [THUMBS_UP_EMOJI, PENCIL_EMOJI, REPORT_SUBMISSION_EMOJI]))
-            ongoing_status_requests[member.discord_id] = ongoing_task
-            reaction, user = await ongoing_task
-            ongoing_status_requests.pop(member.discord_id, None)  # Remove the task once we get the reaction
-
-            for emoji in [THUMBS_UP_EMOJI, PENCIL_EMOJI, REPORT_SUBMISSION_EMOJI]:
-                await last_sent_message.remove_reaction(emoji, bot.user)
-                
-        # Prompt user for non-technical updates from the previous day
-        non_technical_msg_prompt = "Please provide any non-technical updates from your previous working day, e.g., important meetings, interviews, etc."
-        await user.send(non_technical_msg_prompt)
+    # Take the choice before responding, so a second click or a timeout during the response can not resolve it again
+    pending[1].set_result(choice)
+    # Acknowledge the click and remove the buttons in a single call
+    await interaction.response.edit_message(view=None)
+
+def claim_status_conversation(discord_id: int) -> Task:
+    """Makes the current task the member's status conversation, cancelling the one it replaces."""
+    task = asyncio.current_task()
+    ongoing_task: Task = ongoing_status_requests.get(discord_id)
+    if ongoing_task and ongoing_task is not task:
+        ongoing_task.cancel()
+    ongoing_status_requests[discord_id] = task
+    return task
+
+def release_status_conversation(discord_id: int, task: Task):
+    """Forgets the member's status conversation once it ended, unless a newer request already replaced it."""
+    if ongoing_status_requests.get(discord_id) is task:
+        ongoing_status_requests.pop(discord_id, None)
+
+class MemberTimedOut(Exception):
+    """Raised when a member does not answer within their conversation stage's timeout."""
+
+async def wait_for_member(member: TeamMember, session: StatusSession, answer: asyncio.Future):
+    """Waits for the member's answer.
+
+    Raises MemberTimedOut if the member does not answer within the stage's timeout, and
+    CancelledError if a newer request replaced the conversation while the answer arrived.
+    """
+    try:
+        result = await asyncio.wait_for(answer, STATUS_STAGE_TIMEOUTS.get(session.stage))
+    except asyncio.TimeoutError:
+        raise MemberTimedOut()
+    if ongoing_status_requests.get(member.discord_id) is not asyncio.current_task():
+        raise CancelledError()
+    return result
+
+async def wait_for_dm(member: TeamMember, user, session: StatusSession):
+    """Waits for the member's next DM."""
+    return await wait_for_member(member, session, ensure_future(bot.wait_for('message', check=lambda m: m.author == user and isinstance(m.channel, DMChannel))))
+
+async def wait_for_review_choice(member: TeamMember, session: StatusSession) -> str:
+    """Waits for the member to click one of the review buttons under the report and returns the choice."""
+    message_id = session.prompt_message_id
+    choice = asyncio.get_running_loop().create_future()
+    pending_review_choices[message_id] = (member.discord_id, choice)
+    try:
+        return await wait_for_member(member, session, choice)
+    finally:
+        if pending_review_choices.get(message_id, (None, None))[1] is choice:
+            pending_review_choices.pop(message_id, None)
+
+async def send_prompt(session: StatusSession, user, text: str):
+    """Sends the prompt of the session's stage unless it was already sent, and persists its message ID."""
+    if session.prompt_message_id is None:
+        prompt = await outbox.send(user, text)
+        status_session_manager.advance(session, session.stage, prompt.id)
+
+async def send_review_prompt(session: StatusSession, last_message):
+    """Moves the session to the review stage, waiting on the report message that carries the buttons."""
+    status_session_manager.advance(session, StatusSession.REVIEW, last_message.id if last_message else None)
+
+async def run_report_stage(member: TeamMember, user, session: StatusSession):
+    # Retrieve the member's commits and technical summary, pre-warmed if possible,
+    # streaming the summary into the DM if it has to be generated now
+    report_streamer = make_streamer(user, "Here's your summarized report based on your commits:\n")
+    commit_messages, summarized_report = await get_technical_report(member, report_streamer.append if report_streamer else None)
+
+    if not commit_messages:
+        summarized_report = "You have no commits for the previous working day."
+        msg = f"{summarized_report}\n{REVIEW_PROMPT}"
+    else:
+        msg = f"Here's your summarized report based on your commits:\n{summarized_report}\n{REVIEW_PROMPT}"
 
-        # Store the new wait_for message (non-technical update) task in the global dictionary
-        ongoing_task = ensure_future(bot.wait_for('message', check=check))
-        ongoing_status_requests[member.discord_id] = ongoing_task
-        non_technical_update_raw = await ongoing_task
-        ongoing_status_requests.pop(member.discord_id, None)  # Remove the task once we get the non-technical update
+    session.summarized_report = summarized_report
+    session.raw_updates = summarized_report
 
-        raw_updates += f"\n\n{non_technical_update_raw.content}"
-        
-        # Summarize non-technical update with LLM
-        non_technical_update = await updates_manager.summarize_non_technical_updates(non_technical_update_raw.content)
+    # Send the report with the review buttons
+    if report_streamer and report_streamer.started:
+        sent_message = await report_streamer.finish(f"\n{REVIEW_PROMPT}", view=review_view, text=summarized_report)
+    else:
+        sent_message = await send_long_message(user, msg, view=review_view)
+    await send_review_prompt(session, sent_message)
+
+async def run_review_stage(member: TeamMember, user, session: StatusSession):
+    if session.prompt_message_id is None:
+        # The report was never shown with its buttons
+        last_message = await send_long_message(user, f"Here's your current report:\n{session.summarized_report}\n{REVIEW_PROMPT}", view=review_view)
+        await send_review_prompt(session, last_message)
+
+    choice = await wait_for_review_choice(member, session)
+    next_stage = {
+        CONFIRM: StatusSession.NON_TECHNICAL,
+        REVISE: StatusSession.FEEDBACK,
+        SUBMIT: StatusSession.DIRECT_REPORT,
+    }[choice]
+    status_session_manager.advance(session, next_stage)
+
+async def run_feedback_stage(member: TeamMember, user, session: StatusSession):
+    await send_prompt(session, user, "What would you like me to change?")
+    feedback = await wait_for_dm(member, user, session)
+
+    # Send original + feedback to LLM for reformatting, streaming the revision into the DM
+    revision_streamer = make_streamer(user, "Here's the revised report:\n")
+    with stage_tracer.span('llm_revision'):
+        session.summarized_report = await updates_manager.summarize_feedback_and_revisions(session.summarized_report, feedback.content, revision_streamer.append if revision_streamer else None)
+
+    if revision_streamer and revision_streamer.started:
+        last_sent_message = await revision_streamer.finish(f"\n{REVIEW_PROMPT}", view=review_view, text=session.summarized_report)
+    else:
+        last_sent_message = await send_long_message(user, f"Here's the revised report:\n{session.summarized_report}\n{REVIEW_PROMPT}", view=review_view)
+    await send_review_prompt(session, last_sent_message)
+
+async def run_direct_report_stage(member: TeamMember, user, session: StatusSession):
+    await send_prompt(session, user, "Please submit your technical report directly.")
+    direct_report = await wait_for_dm(member, user, session)
+
+    session.summarized_report = direct_report.content
+    status_session_manager.advance(session, StatusSession.NON_TECHNICAL)
+
+async def run_non_technical_stage(member: TeamMember, user, session: StatusSession):
+    # Prompt user for non-technical updates from the previous day
+    await send_prompt(session, user, "Please provide any non-technical updates from your previous working day, e.g., important meetings, interviews, etc.")
+    non_technical_update_raw = await wait_for_dm(member, user, session)
+
+    # Summarize non-technical update with LLM
+    session.raw_updates += f"\n\n{non_technical_update_raw.content}"
+    with stage_tracer.span('llm_non_technical_summary'):
+        session.non_technical_update = await updates_manager.summarize_non_technical_updates(non_technical_update_raw.content)
+    status_session_manager.advance(session, StatusSession.GOALS)
+
+async def run_goals_stage(member: TeamMember, user, session: StatusSession):
+    # Prompt user for their goals for the day
+    await send_prompt(session, user, "What do you plan to work on or accomplish today?")
+    goals_for_today_raw = await wait_for_dm(member, user, session)
+
+    # Summarize goals for the day with LLM
+    with stage_tracer.span('llm_goals_summary'):
+        session.goals_for_today = await updates_manager.summarize_goals_for_the_day(goals_for_today_raw.content)
+    session.raw_updates += f"\n\n{goals_for_today_raw.content}"
+    status_session_manager.advance(session, StatusSession.RECORD)
+
+async def run_record_stage(member: TeamMember, user, session: StatusSession):
+    with stage_tracer.span('db_write'):
+        # The stage is run again if the bot stops before it is done, so the new streak is
+        # persisted before anything is written and the inserted update is marked in the session
+        if session.recorded_streak is None:
+            session.recorded_streak = streaks_manager.get_streak(member.discord_id) + 1
+            status_session_manager.save(session)
 
-        # Prompt user for their goals for the day
-        goals_msg_prompt = "What do you plan to work on or accomplish today?"
-        await user.send(goals_msg_prompt)
+        # Update the streak for this member
+        streaks_manager.update_streak(member.discord_id, session.recorded_streak)
+        member.update_streak(session.recorded_streak)
+
+        final_updates = f"{session.summarized_report}\n\n{session.non_technical_update}\n\n{session.goals_for_today}"
+
+        # The weekly check-ins are reloaded from the updates on restart, so they already count an inserted update
+        if session.inserted_update_id is None:
+            member.increment_weekly_checkins()
+            session.inserted_update_id = updates_manager.insert_status(member.discord_id, session.raw_updates, member.time_zone, final_updates)
+        status_session_manager.advance(session, StatusSession.PUBLISH)
+
+    # Update the member's shard of their team's Discord post using WeeklyPostManager;
+    # the rebuild is debounced, so its span is the batched rebuild, without the wait for it
+    tenant = tenant_registry.find_member_tenant(member.discord_id)
+    if tenant:
+        rebuilt = request_post_rebuild(tenant, member.discord_id)
+        trace = stage_tracer.current()
+        if trace and rebuilt:
+            trace.track('board_rebuild', rebuilt)
+
+async def run_publish_stage(member: TeamMember, user, session: StatusSession):
+    # Member name update as a header
+    member_update_header = f"## {member.name}'s Update:"
+
+    # Compile the final report with Markdown formatting
+    final_report = (
+        f"\n### Technical Update:\n"
+        f"{session.summarized_report}\n"
+        f"### Non-Technical Update:\n"
+        f"{session.non_technical_update}\n"
+        f"### Goals for Today:\n"
+        f"{session.goals_for_today}"
+    )
+
+    feedback_streamer = make_streamer(user)
+    with stage_tracer.span('llm_performance_evaluation'):
+        stand_up_feedback = await updates_manager.evaluate_performance(final_report, feedback_streamer.append if feedback_streamer else None)
+
+    # Concatenate the member name update with the final report and send to their team's Discord channel
+    complete_message = f"{member_update_header}{final_report}"
+    tenant = tenant_registry.find_member_tenant(member.discord_id)
+    if feedback_streamer and feedback_streamer.started:
+        await feedback_streamer.finish(text=stand_up_feedback)
+    else:
+        await outbox.send(user, stand_up_feedback)
+    if tenant:
+        with stage_tracer.span('channel_post'):
+            await send_long_message(tenant.channel, complete_message)
+    status_session_manager.advance(session, StatusSession.DONE)
+
+    # Fold today's update into the member's rolling weekly summary
+    with stage_tracer.span('llm_weekly_summary'):
+        await weekly_summary_manager.refresh_current_week(member.discord_id, member.time_zone)
+
+STATUS_STAGE_HANDLERS = {
+    StatusSession.REPORT: run_report_stage,
+    StatusSession.REVIEW: run_review_stage,
+    StatusSession.FEEDBACK: run_feedback_stage,
+    StatusSession.DIRECT_REPORT: run_direct_report_stage,
+    StatusSession.NON_TECHNICAL: run_non_technical_stage,
+    StatusSession.GOALS: run_goals_stage,
+    StatusSession.RECORD: run_record_stage,
+    StatusSession.PUBLISH: run_publish_stage,
+}
+
+async def run_status_session(member: TeamMember, user, session: StatusSession):
+    """Drives a status conversation through its stages until it is done.
+
+    Every stage persists the session before moving on, so the conversation can be
+    resumed from the stage it was in. If the member does not answer within the stage's
+    timeout, the conversation is recorded as missed. If a Discord, GitHub or LLM call
+    times out instead, it is resumed from its persisted stage after STATUS_RETRY_SECONDS.
+    """
+    live_status_sessions[member.discord_id] = session
+    try:
+        while session.stage != StatusSession.DONE:
+            await STATUS_STAGE_HANDLERS[session.stage](member, user, session)
+        status_session_counts['completed'] += 1
+    except MemberTimedOut:
+        await expire_status_session(member, session)
+    except asyncio.TimeoutError as e:
+        print(f"Status conversation of {member.name} timed out at the '{session.stage}' stage: {e!r}. Resuming it in {STATUS_RETRY_SECONDS} seconds.")
+        schedule_status_resume(member, STATUS_RETRY_SECONDS)
+    finally:
+        if live_status_sessions.get(member.discord_id) is session:
+            live_status_sessions.pop(member.discord_id, None)
+
+def schedule_status_resume(member: TeamMember, delay: float):
+    """Resumes the member's persisted conversation after delay seconds, unless it ended or was replaced meanwhile."""
+    async def resume_later():
+        await asyncio.sleep(delay)
+        session = status_session_manager.get_session(member.discord_id)
+        if session is not None and session.stage != StatusSession.MISSED:
+            await resume_status_session(member, session)
+
+    task = ensure_future(resume_later())
+    resumed_status_sessions.add(task)
+    task.add_done_callback(resumed_status_sessions.discard)
+
+async def expire_status_session(member: TeamMember, session: StatusSession):
+    """Records a conversation the member did not finish in time as missed and lets them and the admin know."""
+    expired_stage = session.stage
+    status_session_manager.mark_missed(session)
+    status_session_counts['missed'] += 1
+    print(f"Status request for {member.name} expired at the '{expired_stage}' stage.")
 
-        # Store the new wait_for message (goals for the day) task in the global dictionary
-        ongoing_task = ensure_future(bot.wait_for('message', check=check))
-        ongoing_status_requests[member.discord_id] = ongoing_task
-        goals_for_today_raw = await ongoing_task
-        ongoing_status_requests.pop(member.discord_id, None)  # Remove the task once we get the goals
+    user = bot.get_user(member.discord_id)
+    if user:
+        await outbox.send(user, "Your status update has expired. I'll check in with you again at your next scheduled time.")
+    tenant = tenant_registry.find_member_tenant(member.discord_id)
+    if tenant:
+        await notify_admins(tenant, f"Status request for {member.name} expired at the '{expired_stage}' stage.")
+
+@tasks.loop(minutes=STATUS_REAPER_INTERVAL_MINUTES)
+async def reap_status_sessions():
+    """Expires persisted conversations that are no longer running and have waited past their stage's timeout.
+
+    Running conversations expire through their own timeouts; this catches the ones that were
+    interrupted and could not be resumed, so no session is kept forever.
+    """
+    min_timeout = min(STATUS_STAGE_TIMEOUTS.values())
+    for session in status_session_manager.get_stale_sessions(min_timeout):
+        if session.discord_id in live_status_sessions or not owns_member(session.discord_id):
+            continue
+        if session.age_seconds < STATUS_STAGE_TIMEOUTS.get(session.stage, STATUS_STAGE_TIMEOUT_MINUTES * 60):
+            continue
+
+        member = tenant_registry.find_member(session.discord_id)
+        if member is None:
+            # The member may be in a team that is not started yet
+            if all(tenant.started for tenant in tenant_registry.all_tenants()):
+                status_session_manager.end_session(session.discord_id)
+            continue
+        await expire_status_session(member, session)
 
-        # Summarize goals for the day with LLM
-        goals_for_today = await updates_manager.summarize_goals_for_the_day(goals_for_today_raw.content)
+async def send_status_request(member: TeamMember, 
+                              weekly_post_manager: WeeklyPostManager, 
+                              streaks_manager: StreaksManager, 
+                              updates_manager: UpdatesManager):
+    if member.weekly_checkins == 5:
+        return  # If already completed 5 check-ins, do nothing
 
-        # Update the streak for this member
-        streak = streaks_manager.get_streak(member.discord_id)
-        streaks_manager.update_streak(member.discord_id, streak + 1)
-        member.update_streak(streaks_manager.get_streak(member.discord_id))
-        member.increment_weekly_checkins()
-
-        raw_updates += f"\n\n{goals_for_today_raw.content}"
-        final_updates = f"{summarized_report}\n\n{non_technical_update}\n\n{goals_for_today}"
-
-        updates_manager.insert_status(member.discord_id, raw_updates, member.time_zone)
-        updates_manager.update_summarized_status(member.discord_id, final_updates)
-
-        # Update the Discord post using WeeklyPostManager
-        await weekly_post_manager.rebuild_post(team_member_manager.team_members)
-
-        # Member name update as a header
-        member_update_header = f"## {member.name}'s Update:"
-
-        # Compile the final report with Markdown formatting
-        final_report = (
-            f"\n### Technical Update:\n"
-            f"{summarized_report}\n"
-            f"### Non-Technical Update:\n"
-            f"{non_technical_update}\n"
-            f"### Goals for Today:\n"
-            f"{goals_for_today}"
-        )
-
-        stand_up_feedback = await updates_manager.evaluate_performance(final_report)
-
-        # Concatenate the member name update with the final report and send to the designated Discord channel
-        complete_message = f"{member_update_header}{final_report}"
-        guild = bot.get_guild(GUILD_TOKEN)
-        channel_to_post_in = guild.get_channel(CHANNEL_TOKEN)
-        await user.send(stand_up_feedback)
-        await send_long_message(channel_to_post_in, complete_message)
-
-async def send_long_message(destination, msg):
+    user = bot.get_user(member.discord_id)
+    if user:
+        # Notify the team's admins that a status request is being sent
+        tenant = tenant_registry.find_member_tenant(member.discord_id)
+        if tenant:
+            await notify_admins(tenant, f"Status request sent to {member.name}.")
+
+        # Cancel the previous conversation if it is still running, so it can not write over this one
+        task = claim_status_conversation(member.discord_id)
+
+        session = status_session_manager.start_session(member.discord_id)
+        live_status_sessions[member.discord_id] = session
+        status_session_counts['started'] += 1
+
+        # Time the stages of this run for !slowstandups
+        trace = stage_tracer.start(member.discord_id, 'request')
+        try:
+            # Send the greeting right away, before the report is ready
+            await outbox.send(user, 
+                f"# Good morning {member.name}, time for your daily status update!\n"
+                f"### I'm first going to check your commit messages and try to build a technical report for you.\n"
+                f"### Next I will ask you for any non-technical updates from your previous work day.\n"
+                f"### Finally I will ask you what you plan to work on today."
+            )
+
+            await run_status_session(member, user, session)
+        except CancelledError:
+            pass  # A newer status request replaced this conversation
+        finally:
+            stage_tracer.finish(trace, session.stage)
+            release_status_conversation(member.discord_id, task)
+
+async def resume_status_session(member: TeamMember, session: StatusSession):
+    """Resumes a conversation that was interrupted by a restart at the stage it was in."""
+    if member.discord_id in ongoing_status_requests:
+        return  # A newer status request already replaced it
+    task = claim_status_conversation(member.discord_id)
+    try:
+        user = bot.get_user(member.discord_id)
+        if not user:
+            status_session_manager.end_session(member.discord_id)
+            return
+
+        # Answers sent while the bot was down were missed, so ask again for the current stage.
+        # The review buttons are persistent, so a report that is waiting for a click is kept.
+        if session.stage != StatusSession.REVIEW:
+            session.prompt_message_id = None
+        if session.stage not in (StatusSession.RECORD, StatusSession.PUBLISH):
+            await outbox.send(user, "Sorry, I was interrupted. Let's pick up your status update where we left off.")
+        status_session_counts['resumed'] += 1
+
+        trace = stage_tracer.start(member.discord_id, 'resume')
+        try:
+            await run_status_session(member, user, session)
+        finally:
+            stage_tracer.finish(trace, session.stage)
+    except CancelledError:
+        pass  # A newer status request replaced this conversation
+    finally:
+        release_status_conversation(member.discord_id, task)
+
+async def send_long_message(destination, msg, view=None):
     max_length = 2000  # Discord's max character limit for a message
     sent_messages = []  # Keep track of all messages sent
     while len(msg) > 0:
         # If the message is shorter than the max length, send it as is
         if len(msg) <= max_length:
-            sent_message = await destination.send(msg)
+            # Attach the view, e.g. buttons, to the last part only
+            if view is not None:
+                sent_message = await outbox.send(destination, msg, view=view)
+            else:
+                sent_message = await outbox.send(destination, msg)
             sent_messages.append(sent_message)
             break  # The message is sent, so break out of the loop
         
@@ -332,91 +767,160 @@ async def send_long_message(destination, msg):
         
         # Split the message at the found index and send the first part
         part_to_send = msg[:split_index].strip()
-        sent_message = await destination.send(part_to_send)
+        sent_message = await outbox.send(destination, part_to_send)
         sent_messages.append(sent_message)
         
-        # Wait a bit to respect Discord's rate limits
-        await asyncio.sleep(1)
-        
         # Remove the part that was sent from the message
         msg = msg[split_index:].strip()
     
-    # Return the last message sent for reaction addition
+    # Return the last message sent
     return sent_messages[-1] if sent_messages else None
 
+def format_table(headers: List[str], rows: List[List[str]], max_cell_width: int = 40) -> List[str]:
+    """Formats rows as fixed-width table lines, the first two lines being the header and a separator."""
+    def clip(cell) -> str:
+        cell = str(cell)
+        return cell if len(cell) <= max_cell_width else cell[:max_cell_width - 1] + '…'
+
+    cells = [[clip(cell) for cell in row] for row in [headers] + rows]
+    widths = [max(len(row[i]) for row in cells) for i in range(len(headers))]
+    lines = [' | '.join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip() for row in cells]
+    lines.insert(1, '-+-'.join('-' * width for width in widths))
+    return lines
+
+async def send_table(destination, headers: List[str], rows: List[List[str]], max_length: int = 2000):
+    """Sends a table in as few code-block messages as possible, repeating the header on each page."""
+    lines = format_table(headers, rows)
+    header_lines, row_lines = lines[:2], lines[2:]
+    page_overhead = len('```\n\n```') + len('Page 999/999\n') + sum(len(line) + 1 for line in header_lines)
+
+    pages = [[]]
+    page_length = page_overhead
+    for line in row_lines:
+        if pages[-1] and page_length + len(line) + 1 > max_length:
+            pages.append([])
+            page_length = page_overhead
+        pages[-1].append(line)
+        page_length += len(line) + 1
+
+    for number, page in enumerate(pages, start=1):
+        table = '\n'.join(header_lines + page)
+        await outbox.send(destination, f"Page {number}/{len(pages)}\n```\n{table}\n```")
+
+async def notify_admins(tenant: Tenant, text: str):
+    """Sends a message to every admin of a team."""
+    for admin_id in tenant.admin_ids:
+        admin_user = bot.get_user(admin_id)
+        if admin_user:
+            await outbox.send(admin_user, text)
+
+async def get_admin_tenant(ctx, denial: str) -> Optional[Tenant]:
+    """Returns the team an admin command in a DM applies to, or sends the denial and returns None."""
+    tenant = tenant_registry.get_admin_tenant(ctx.message.author.id) if isinstance(ctx.channel, DMChannel) else None
+    if tenant is None:
+        await ctx.send(denial)
+    return tenant
+
+def gateway_ready() -> bool:
+    """Returns whether the gateway session is ready and its heartbeat is acknowledged."""
+    return bot.is_ready() and not bot.is_closed() and math.isfinite(bot.latency)
+
+async def database_reachable() -> bool:
+    """Returns whether MySQL accepts connections, checked in a thread so a slow database does not block the bot."""
+    return team_member_db is not None and await asyncio.to_thread(team_member_db.ping)
+
+def schedulers_running() -> bool:
+    """Returns whether every team's scheduler is started and dispatching jobs."""
+    return all(tenant.scheduler is not None and tenant.scheduler.is_running() for tenant in tenant_registry.all_tenants())
+
+def status_session_metrics() -> dict:
+    """Returns the number of live status conversations and the conversation counters."""
+    return {'live': len(live_status_sessions), **status_session_counts}
+
+def outbox_metrics_summary() -> dict:
+    """Returns the outbound queue counters, wait percentiles and latency histograms."""
+    return {**outbox.metrics(), 'histograms': outbox.histograms()}
+
+def scheduler_metrics_summary() -> dict:
+    """Returns the scheduler telemetry percentiles and latency histograms."""
+    return {**scheduler_telemetry.summary(), 'histograms': scheduler_telemetry.histograms()}
+
+def llm_metrics_summary() -> dict:
+    """Returns the LLM backend counters and the completion latency histograms per model."""
+    return {'backend': llm_backend.metrics(), 'completions': updates_manager.completion_metrics()}
+
 @bot.command(name='viewscheduledjobs')
 async def view_scheduled_jobs(ctx):
-    if ctx.message.author.id != ADMIN_DISCORD_ID or not isinstance(ctx.channel, DMChannel):
-        await ctx.send("You're not authorized to view scheduled jobs.")
+    tenant = await get_admin_tenant(ctx, "You're not authorized to view scheduled jobs.")
+    if tenant is None:
         return
 
     # Get all scheduled jobs using the Scheduler's method
-    scheduled_jobs = scheduler.get_all_scheduled_jobs(team_member_manager)
+    scheduled_jobs = tenant.scheduler.get_all_scheduled_jobs()
+    if not scheduled_jobs:
+        await ctx.send("No jobs are scheduled.")
+        return
 
-    # Send the scheduled jobs to the admin user
-    for job in scheduled_jobs:
-        await ctx.send(job)
+    # Send the scheduled jobs to the admin user as a paged table
+    headers = ['Job ID', 'Time Zone', 'Members', 'Next Run', 'Remaining']
+    await send_table(ctx, headers, scheduled_jobs)
 
 @bot.command(name='statusrequest')
 async def status_request(ctx, discord_id: int):
-    if ctx.message.author.id != ADMIN_DISCORD_ID or not isinstance(ctx.channel, DMChannel):
-        await ctx.send("You're not authorized to request status.")
+    tenant = await get_admin_tenant(ctx, "You're not authorized to request status.")
+    if tenant is None:
         return
 
     # Find the member object using the Discord ID
-    member_to_request = team_member_manager.find_member(discord_id)
+    member_to_request = tenant.team_member_manager.find_member(discord_id)
 
     if member_to_request:
-        for member in team_member_manager.team_members:
-            scheduler.remove_job(member.discord_id)
-        scheduler.unschedule_weekly_post()
         # Send the status request to the member
         await ctx.send(f"Status request sent to user with Discord ID {discord_id}.")
-        for member in team_member_manager.team_members:
-            scheduler.add_job(send_status_request, member, weekly_post_manager, streaks_manager, updates_manager)
-        scheduler.schedule_weekly_post(weekly_state_reset, weekly_post_manager, streaks_manager, team_member_manager.team_members)
-        await send_status_request(member_to_request, weekly_post_manager, streaks_manager, updates_manager)
+        await send_status_request(member_to_request, tenant.weekly_post_manager, streaks_manager, updates_manager)
         await ctx.send(f"Status request received from user with Discord ID {discord_id}.")
     else:
         await ctx.send(f"No user with Discord ID {discord_id} found.")
 
 @bot.command(name='adduser')
 async def add_user(ctx, discord_id: int, time_zone: str, name: str, github_username: str):
-    if ctx.message.author.id != ADMIN_DISCORD_ID or not isinstance(ctx.channel, DMChannel):
-        await ctx.send("You're not authorized to add users.")
+    tenant = await get_admin_tenant(ctx, "You're not authorized to add users.")
+    if tenant is None:
         return
     
+    # Members belong to a single team
+    member_tenant = tenant_registry.find_member_tenant(discord_id)
+    if member_tenant and member_tenant is not tenant:
+        await ctx.send(f"User with Discord ID {discord_id} is already a member of team {member_tenant.name}.")
+        return
+
     # Add the new member using team_member_manager
-    team_member_manager.add_member(discord_id, name, time_zone, github_username)
+    tenant.team_member_manager.add_member(discord_id, name, time_zone, github_username)
     
     # Update the weekly post to include the new member
-    new_member = team_member_manager.find_member(discord_id)
+    new_member = tenant.team_member_manager.find_member(discord_id)
     if new_member:
-        await weekly_post_manager.rebuild_post(team_member_manager.team_members)
-        scheduler.add_job(send_status_request, new_member, weekly_post_manager, streaks_manager, updates_manager) 
-        scheduler.unschedule_weekly_post()
-        scheduler.schedule_weekly_post(weekly_state_reset, weekly_post_manager, streaks_manager, team_member_manager.team_members)
+        request_post_rebuild(tenant)
+        tenant.scheduler.sync_member(send_status_request, new_member, tenant.weekly_post_manager, streaks_manager, updates_manager)
     
     await ctx.send(f"User {name} added successfully.")
 
 @bot.command(name='removeuser')
 async def remove_user(ctx, discord_id: int):
-    if ctx.message.author.id != ADMIN_DISCORD_ID or not isinstance(ctx.channel, DMChannel):
-        await ctx.send("You're not authorized to remove users.")
+    tenant = await get_admin_tenant(ctx, "You're not authorized to remove users.")
+    if tenant is None:
         return
 
     # Find the member object
-    member_to_remove = team_member_manager.find_member(discord_id)
+    member_to_remove = tenant.team_member_manager.find_member(discord_id)
 
     if member_to_remove:
         # Remove the member from the database
-        team_member_manager.remove_member(discord_id)
+        tenant.team_member_manager.remove_member(discord_id)
         
         # Update the weekly post to remove the member
-        await weekly_post_manager.rebuild_post(team_member_manager.team_members)
-        scheduler.remove_job(discord_id)
-        scheduler.unschedule_weekly_post()
-        scheduler.schedule_weekly_post(weekly_state_reset, weekly_post_manager, streaks_manager, team_member_manager.team_members)
+        request_post_rebuild(tenant)
+        tenant.scheduler.remove_job(discord_id)
 
         await ctx.send(f"User with Discord ID {discord_id} removed successfully.")
     else:
@@ -424,32 +928,29 @@ async def remove_user(ctx, discord_id: int):
 
 @bot.command(name='listusers')
 async def list_users(ctx):
-    if ctx.message.author.id != ADMIN_DISCORD_ID or not isinstance(ctx.channel, DMChannel):
-        await ctx.send("You're not authorized to list users.")
+    tenant = await get_admin_tenant(ctx, "You're not authorized to list users.")
+    if tenant is None:
         return
 
     # List users using team_member_manager
-    users = [(member.discord_id, member.name, member.time_zone, member.github_username, member.current_streak) for member in team_member_manager.team_members]
+    users = [(member.discord_id, member.name, member.time_zone, member.github_username, member.current_streak) for member in tenant.team_member_manager.team_members]
     user_list = '\n'.join([f"Name: {user[1]}, Discord ID: {user[0]}, Time Zone: {user[2]}, GitHub Username: {user[3]}, Current Streak: {user[4]}" for user in users])
 
     await ctx.send(f"List of users:\n{user_list}")
 
 @bot.command(name='updatetimezone')
 async def update_timezone(ctx, discord_id: int, new_time_zone: str):
-    if ctx.message.author.id != ADMIN_DISCORD_ID or not isinstance(ctx.channel, DMChannel):
-        await ctx.send("You're not authorized to update timezones.")
+    tenant = await get_admin_tenant(ctx, "You're not authorized to update timezones.")
+    if tenant is None:
         return
 
     # Find the member object using the Discord ID
-    member_to_update = team_member_manager.find_member(discord_id)
+    member_to_update = tenant.team_member_manager.find_member(discord_id)
 
     if member_to_update:
         # Update the timezone in the database
-        team_member_manager.update_member_timezone(discord_id, new_time_zone)
-        scheduler.remove_job(discord_id)
-        scheduler.add_job(send_status_request, member_to_update, weekly_post_manager, streaks_manager, updates_manager)
-        scheduler.unschedule_weekly_post()
-        scheduler.schedule_weekly_post(weekly_state_reset, weekly_post_manager, streaks_manager, team_member_manager.team_members)
+        tenant.team_member_manager.update_member_timezone(discord_id, new_time_zone)
+        tenant.scheduler.sync_member(send_status_request, member_to_update, tenant.weekly_post_manager, streaks_manager, updates_manager)
 
         await ctx.send(f"Timezone for user with Discord ID {discord_id} updated to {new_time_zone}.")
     else:
@@ -457,20 +958,20 @@ async def update_timezone(ctx, discord_id: int, new_time_zone: str):
 
 @bot.command(name='updatestreak')
 async def update_streak(ctx, discord_id: int, new_streak: int):
-    if ctx.message.author.id != ADMIN_DISCORD_ID or not isinstance(ctx.channel, DMChannel):
-        await ctx.send("You're not authorized to update streaks.")
+    tenant = await get_admin_tenant(ctx, "You're not authorized to update streaks.")
+    if tenant is None:
         return
 
     # Find the member object using the Discord ID
-    member_to_update = team_member_manager.find_member(discord_id)
+    member_to_update = tenant.team_member_manager.find_member(discord_id)
 
     if member_to_update:
         # Update the streak in the database
         streaks_manager.update_streak(discord_id, new_streak)
         member_to_update.update_streak(new_streak)
 
-        # Update the Discord post using WeeklyPostManager
-        await weekly_post_manager.rebuild_post(team_member_manager.team_members)
+        # Update the member's shard of the Discord post using WeeklyPostManager
+        request_post_rebuild(tenant, discord_id)
         
         await ctx.send(f"Streak for user with Discord ID {discord_id} updated to {new_streak}.")
     else:
@@ -478,36 +979,43 @@ async def update_streak(ctx, discord_id: int, new_streak: int):
 
 @bot.command(name='forcepostrebuild')
 async def force_post_rebuild(ctx):
-    if ctx.message.author.id != ADMIN_DISCORD_ID or not isinstance(ctx.channel, DMChannel):
-        await ctx.send("You're not authorized to force a post rebuild.")
+    tenant = await get_admin_tenant(ctx, "You're not authorized to force a post rebuild.")
+    if tenant is None:
         return
 
     # Rebuild the post
-    await weekly_post_manager.rebuild_post(team_member_manager.team_members)
+    await tenant.weekly_post_manager.rebuild_post(tenant.team_member_manager.team_members, force=True)
 
     await ctx.send("Post rebuilt successfully.")
 
 @bot.command(name='deletelateststatus')
 async def delete_latest_status(ctx, discord_id: int):
-    if ctx.message.author.id != ADMIN_DISCORD_ID or not isinstance(ctx.channel, DMChannel):
-        await ctx.send("You're not authorized to delete status updates.")
+    tenant = await get_admin_tenant(ctx, "You're not authorized to delete status updates.")
+    if tenant is None:
         return
 
     # Find the member object using the Discord ID
-    member = team_member_manager.find_member(discord_id)
+    member = tenant.team_member_manager.find_member(discord_id)
 
     if not member:
         await ctx.send(f"No user with Discord ID {discord_id} found.")
         return
 
     # Delete the newest status using the UpdatesManager's method
+    last_update_timestamp, _ = updates_manager.get_last_update_timestamp(discord_id)
     updates_manager.delete_newest_status(discord_id)
+    weekly_summary_manager.invalidate_week_of(discord_id, last_update_timestamp)
     await ctx.send(f"Latest status update for user with Discord ID {discord_id} deleted successfully.")
 
 @bot.command(name='viewuser')
 async def view_user(ctx, discord_id: int):
-    if ctx.message.author.id != ADMIN_DISCORD_ID or not isinstance(ctx.channel, DMChannel):
-        await ctx.send("You're not authorized to view user data.")
+    tenant = await get_admin_tenant(ctx, "You're not authorized to view user data.")
+    if tenant is None:
+        return
+
+    # Admins only see the updates of their own team's members
+    if not tenant.team_member_manager.find_member(discord_id):
+        await ctx.send(f"No user with Discord ID {discord_id} found.")
         return
 
     # Get the member's statuses using the UpdatesManager's method
@@ -517,122 +1025,475 @@ async def view_user(ctx, discord_id: int):
         await ctx.send(f"No status updates found for user with Discord ID {discord_id}.")
         return
 
-    # Loop through the statuses and send individual messages
+    # Send each status as one message, queued through the outbound dispatcher
     for status in statuses:
-        await ctx.send(f"### **Timestamp:** {status['timestamp']}")
-        await ctx.send(f"### **Raw Status:** {status['status']}")
-        await ctx.send(f"### **Summarized Status:** \n{status['summarized_status']}")
+        await send_long_message(ctx, (
+            f"### **Timestamp:** {status['timestamp']}\n"
+            f"### **Raw Status:** {status['status']}\n"
+            f"### **Summarized Status:** \n{status['summarized_status']}"
+        ))
 
 @bot.command(name='setvacationstatus')
 async def set_vacation_status(ctx, discord_id: int):
-    if ctx.message.author.id != ADMIN_DISCORD_ID or not isinstance(ctx.channel, DMChannel):
-        await ctx.send("You're not authorized to set vacation status.")
+    tenant = await get_admin_tenant(ctx, "You're not authorized to set vacation status.")
+    if tenant is None:
         return
 
-    member = team_member_manager.find_member(discord_id)
+    member = tenant.team_member_manager.find_member(discord_id)
     if member:
         new_status = not member.on_vacation
-        team_member_manager.set_member_vacation_status(discord_id, new_status)
+        tenant.team_member_manager.set_member_vacation_status(discord_id, new_status)
         await ctx.send(f"Vacation status for user with Discord ID {discord_id} set to {'on vacation' if new_status else 'not on vacation'}.")
     else:
         await ctx.send(f"No user with Discord ID {discord_id} found.")
 
+def parse_date_range(start_date: str, end_date: str) -> Tuple[datetime, datetime]:
+    """Parse MM-DD-YYYY start and end dates into datetimes covering both days entirely."""
+    start_date = datetime.strptime(start_date, '%m-%d-%Y')
+    end_date = datetime.strptime(end_date, '%m-%d-%Y')
+
+    # Setting the time to ensure the whole week is captured
+    start_date = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
+    end_date = end_date.replace(hour=23, minute=59, second=59, microsecond=999999)
+    return start_date, end_date
+
 @bot.command(name='weeklysummary')
 async def weekly_summary(ctx, discord_id: int, start_date: str, end_date: str):
-    if ctx.message.author.id != ADMIN_DISCORD_ID or not isinstance(ctx.channel, DMChannel):
-        await ctx.send("You're not authorized to generate weekly summaries.")
+    tenant = await get_admin_tenant(ctx, "You're not authorized to generate weekly summaries.")
+    if tenant is None:
         return
 
     # Find the member object using the Discord ID
-    member = team_member_manager.find_member(discord_id)
+    member = tenant.team_member_manager.find_member(discord_id)
 
     if not member:
         await ctx.send(f"No user with Discord ID {discord_id} found.")
         return
 
-    # Convert the start_date and end_date strings to datetime objects
-    # Adjusting the date format to MM-DD-YYYY and setting the time
     try:
-        start_date = datetime.strptime(start_date, '%m-%d-%Y')
-        end_date = datetime.strptime(end_date, '%m-%d-%Y')
-
-        # Setting the time to ensure the whole week is captured
-        start_date = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
-        end_date = end_date.replace(hour=23, minute=59, second=59, microsecond=999999)
+        start_date, end_date = parse_date_range(start_date, end_date)
     except ValueError:
         await ctx.send("Invalid date format. Please use MM-DD-YYYY.")
         return
 
     # Generate the weekly summary
-    weekly_summary = await updates_manager.generate_weekly_summary(discord_id, start_date, end_date)
+    weekly_summary = await weekly_summary_manager.get_weekly_summary(discord_id, member.time_zone, start_date, end_date)
+
+    # Send the weekly summary to the admin who asked for it
+    await outbox.send(ctx.message.author, f"**{member.name}'s Weekly Summary for {start_date.strftime('%m-%d-%Y')} to {end_date.strftime('%m-%d-%Y')}:**\n{weekly_summary}")
+
+@bot.command(name='llmmetrics')
+async def llm_metrics(ctx):
+    tenant = await get_admin_tenant(ctx, "You're not authorized to view LLM metrics.")
+    if tenant is None:
+        return
+
+    metrics = llm_backend.metrics()
+    if not metrics:
+        await ctx.send("The LLM backend does not report any metrics.")
+        return
+
+    metrics_list = '\n'.join(f"{name}: {value}" for name, value in metrics.items())
+    await ctx.send(f"LLM metrics:\n{metrics_list}")
+
+@bot.command(name='schedulermetrics')
+async def scheduler_metrics(ctx):
+    tenant = await get_admin_tenant(ctx, "You're not authorized to view scheduler metrics.")
+    if tenant is None:
+        return
+
+    summary = scheduler_telemetry.summary()
+    rows = []
+    for group, keys in summary.items():
+        for key, stats in keys.items():
+            outcomes = stats['outcomes']
+            rows.append([
+                group, key, str(stats['runs']),
+                f"{outcomes.get('ok', 0)}/{outcomes.get('error', 0)}/{outcomes.get('missed', 0)}",
+                f"{stats['lag_p50']}/{stats['lag_p95']}/{stats['lag_p99']}",
+                f"{stats['duration_p50']}/{stats['duration_p95']}/{stats['duration_p99']}"
+            ])
+
+    if not rows:
+        await ctx.send("No scheduled runs have been recorded yet.")
+        return
 
-    # Send the weekly summary to the admin user
-    admin_user = bot.get_user(ADMIN_DISCORD_ID)
-    if admin_user:
-        await admin_user.send(f"**{member.name}'s Weekly Summary for {start_date.strftime('%m-%d-%Y')} to {end_date.strftime('%m-%d-%Y')}:**\n{weekly_summary}")
+    headers = ['Group', 'Key', 'Runs', 'OK/Err/Missed', 'Lag p50/95/99 (s)', 'Duration p50/95/99 (s)']
+    await send_table(ctx, headers, rows)
+
+@bot.command(name='slowstandups')
+async def slow_standups(ctx, count: int = 5):
+    tenant = await get_admin_tenant(ctx, "You're not authorized to view stand-up timings.")
+    if tenant is None:
+        return
+
+    # Only show the runs of the team's members
+    traces = [trace for trace in stage_tracer.slowest(len(stage_tracer.traces)) if tenant.team_member_manager.find_member(trace.discord_id)][:count]
+    if not traces:
+        await ctx.send("No stand-ups have been timed yet.")
+        return
+
+    # One row per stage, the run's details on its first row; time spent waiting for the member is not counted
+    rows = []
+    for trace in traces:
+        member = tenant.team_member_manager.find_member(trace.discord_id)
+        details = [member.name, trace.started_at.strftime('%m-%d %H:%M UTC'), f"{trace.kind}/{trace.outcome}", f"{trace.total():.2f}"]
+        for stage, seconds in trace.stage_totals().items():
+            rows.append(details + [stage, f"{seconds:.2f}"])
+            details = [''] * len(details)
+
+    headers = ['Member', 'Started', 'Run', 'Total (s)', 'Stage', 'Stage (s)']
+    await send_table(ctx, headers, rows)
+
+@bot.command(name='statussessions')
+async def status_sessions(ctx):
+    tenant = await get_admin_tenant(ctx, "You're not authorized to view status sessions.")
+    if tenant is None:
+        return
+
+    # In worker mode the conversations run on every worker, so list the ones they all persisted
+    if WORKER_MODE:
+        sessions = {session.discord_id: session for session in status_session_manager.get_unfinished_sessions()}
     else:
-        await ctx.send("Unable to find the admin user.")
+        sessions = live_status_sessions
+
+    # Only list the conversations of the team's members
+    rows = []
+    for discord_id, session in sessions.items():
+        member = tenant.team_member_manager.find_member(discord_id)
+        if member:
+            rows.append([member.name, session.stage])
+
+    if not rows:
+        await ctx.send("No status conversations are running.")
+        return
+
+    await ctx.send(f"{len(rows)} status conversations are running.")
+    await send_table(ctx, ['Member', 'Stage'], rows)
+
+@bot.command(name='team')
+async def select_team(ctx, name: Optional[str] = None):
+    authorized = isinstance(ctx.channel, DMChannel) and bool(tenant_registry.admin_tenants(ctx.message.author.id))
+
+    # Admins of several teams choose which team their commands apply to. Every worker keeps
+    # its own copy of the choice, so the command runs on all of them and the leader replies.
+    selected = authorized and (name is None or tenant_registry.select_tenant(ctx.message.author.id, name))
+    if not is_leader():
+        return
+
+    if not authorized:
+        await ctx.send("You're not authorized to select a team.")
+        return
+    if not selected:
+        await ctx.send(f"You're not an admin of a team named {name}.")
+        return
+
+    tenant = tenant_registry.get_admin_tenant(ctx.message.author.id)
+    teams = ', '.join(admin_tenant.name for admin_tenant in tenant_registry.admin_tenants(ctx.message.author.id))
+    await ctx.send(f"Your commands apply to team {tenant.name}. Your teams: {teams}.")
+
+@bot.command(name='outboxmetrics')
+async def outbox_metrics(ctx):
+    tenant = await get_admin_tenant(ctx, "You're not authorized to view outbox metrics.")
+    if tenant is None:
+        return
+
+    metrics_list = '\n'.join(f"{name}: {value}" for name, value in outbox.metrics().items())
+    await ctx.send(f"Outbox metrics:\n{metrics_list}")
+
+@bot.command(name='teamdigest')
+async def team_digest(ctx, start_date: str, end_date: str):
+    tenant = await get_admin_tenant(ctx, "You're not authorized to generate team digests.")
+    if tenant is None:
+        return
+
+    try:
+        start_date, end_date = parse_date_range(start_date, end_date)
+    except ValueError:
+        await ctx.send("Invalid date format. Please use MM-DD-YYYY.")
+        return
+
+    team_members = tenant.team_member_manager.team_members
+    if not team_members:
+        await ctx.send("There are no team members to summarize.")
+        return
+
+    progress_message = await ctx.send(f"Generating team digest: 0/{len(team_members)} members done.")
+
+    async def report_progress(completed: int, total: int):
+        await outbox.edit(progress_message, content=f"Generating team digest: {completed}/{total} members done.")
+
+    digest = await weekly_summary_manager.generate_team_digest(
+        team_members, start_date, end_date,
+        max_concurrency=TEAM_DIGEST_CONCURRENCY,
+        on_progress=report_progress
+    )
+
+    header = f"# Team Digest for {start_date.strftime('%m-%d-%Y')} to {end_date.strftime('%m-%d-%Y')}"
+    await send_long_message(ctx, f"{header}\n{digest}")
+
+async def setup_tenant(tenant: Tenant, team_member_db: TeamMemberDB, weekly_posts_db: WeeklyPostsDB, scheduled_jobs_db: ScheduledJobsDB):
+    """Creates a team's managers and schedule on the shared database connections and starts its jobs."""
+    guild = bot.get_guild(tenant.guild_id)
+    tenant.channel = guild.get_channel(tenant.channel_id)
+
+    tenant.team_member_manager = TeamMemberManager(team_member_db, tenant.name)
+    team_members = tenant.team_member_manager.team_members
+
+    # Update each team member's streak from the database
+    refresh_member_stats(team_members)
+
+    tenant.weekly_post_manager = WeeklyPostManager(tenant.channel, weekly_posts_db, WEEKLY_POST_FLUSH_SECONDS, WEEKLY_POST_SHARD_SIZE, tenant.name, outbox)
+    # Initialize new weekly post
+    if is_leader():
+        await tenant.weekly_post_manager.initialize_post(team_members)
+        await tenant.weekly_post_manager.rebuild_post(team_members)
+
+    # In worker mode each worker persists its own schedule and only dispatches to the members it owns
+    job_namespace = tenant.job_namespace
+    if WORKER_MODE:
+        job_namespace = f"{tenant.job_namespace or DEFAULT_TEAM}@worker{WORKER_INDEX}"
+
+    tenant.scheduler = Scheduler(
+        prewarm_func=prewarm_status_request,
+        prewarm_lead_minutes=PREWARM_LEAD_MINUTES,
+        job_store=MySQLJobStore(scheduled_jobs_db, namespace=job_namespace),
+        misfire_grace_time=SCHEDULER_MISFIRE_GRACE_SECONDS,
+        dispatch_window_seconds=STATUS_DISPATCH_WINDOW_SECONDS,
+        max_in_flight=STATUS_DISPATCH_MAX_IN_FLIGHT,
+        telemetry=scheduler_telemetry,
+        namespace=job_namespace,
+        weekday_hour=tenant.weekday_hour,
+        weekend_hour=tenant.weekend_hour,
+        member_filter=owns_member if WORKER_MODE else None
+    )
+
+    # Every time zone rolls over to the new week at its own Monday
+    tenant.scheduler.schedule_weekly_rollover(weekly_rollover, tenant.weekly_post_manager, streaks_manager, team_members)
+
+    for member in team_members:
+        tenant.scheduler.add_job(send_status_request, member, tenant.weekly_post_manager, streaks_manager, updates_manager)
+
+    # Drop persisted jobs that no longer apply and start running, catching up on missed runs
+    tenant.scheduler.finish_reconciliation()
+
+async def start_tenants() -> bool:
+    """Starts the teams that are not running yet, each on its own so a failing team does not hold up the others.
+
+    Returns whether every team is running.
+    """
+    for tenant in tenant_registry.all_tenants():
+        if tenant.started:
+            continue
+        try:
+            await setup_tenant(tenant, team_member_db, weekly_posts_db, scheduled_jobs_db)
+            tenant.started = True
+        except Exception as e:
+            print(f"Failed to start team {tenant.name}: {e}")
+            # Drop the partly created team so the next attempt starts it from scratch
+            if tenant.scheduler is not None:
+                tenant.scheduler.shutdown()
+            tenant.team_member_manager = tenant.weekly_post_manager = tenant.scheduler = None
+    return all(tenant.started for tenant in tenant_registry.all_tenants())
+
+def resume_status_sessions():
+    """Resumes the interrupted conversations of the members of the started teams that are not running."""
+    for session in status_session_manager.get_unfinished_sessions():
+        member = tenant_registry.find_member(session.discord_id)
+        if member is None or session.discord_id in ongoing_status_requests or not owns_member(session.discord_id):
+            continue
+        task = ensure_future(resume_status_session(member, session))
+        resumed_status_sessions.add(task)
+        task.add_done_callback(resumed_status_sessions.discard)
+
+@tasks.loop(seconds=TENANT_RETRY_SECONDS)
+async def retry_tenants():
+    """Retries starting the teams that failed to start, until every team is running."""
+    if retry_tenants.current_loop == 0:
+        return  # The first attempt was just made by on_ready
+    all_started = await start_tenants()
+    resume_status_sessions()
+    if all_started:
+        retry_tenants.stop()
+
+@tasks.loop(seconds=max(1, LEADER_LEASE_SECONDS // 3))
+async def renew_leadership():
+    """Keeps the leader lease, or takes it over when the leader stopped renewing it."""
+    was_leader = leader_lease.is_held
+    if leader_lease.renew() and not was_leader:
+        print(f"Worker {WORKER_INDEX} is now the leader.")
+        # Bring the weekly posts up to date with the check-ins every worker recorded, starting
+        # from the messages the previous leader saved rather than the ones this worker last saw
+        for tenant in tenant_registry.started_tenants():
+            team_members = tenant.team_member_manager.team_members
+            refresh_member_stats(team_members)
+            tenant.weekly_post_manager.load_weekly_post_data()
+            await tenant.weekly_post_manager.initialize_post(team_members)
+            await tenant.weekly_post_manager.rebuild_post(team_members)
+    elif was_leader and not leader_lease.is_held:
+        print(f"Worker {WORKER_INDEX} is no longer the leader.")
+        # The new leader edits the weekly posts from now on
+        for tenant in tenant_registry.started_tenants():
+            tenant.weekly_post_manager.cancel_pending_rebuild()
+
+@tasks.loop(seconds=WORKER_SYNC_SECONDS)
+async def sync_workers():
+    """Picks up the roster changes and, on the leader, the check-ins made on the other workers."""
+    for tenant in tenant_registry.started_tenants():
+        added_members, removed_ids = tenant.team_member_manager.refresh_members()
+        team_members = tenant.team_member_manager.team_members
+        for member in team_members:
+            tenant.scheduler.sync_member(send_status_request, member, tenant.weekly_post_manager, streaks_manager, updates_manager)
+        for discord_id in removed_ids:
+            tenant.scheduler.remove_job(discord_id)
+
+        if not is_leader():
+            continue
+        changed_ids = refresh_member_stats(team_members)
+        if added_members or removed_ids:
+            await tenant.weekly_post_manager.initialize_post(team_members)
+            request_post_rebuild(tenant)
+        else:
+            for discord_id in changed_ids:
+                request_post_rebuild(tenant, discord_id)
+
+class RoutedToOtherWorker(commands.CheckFailure):
+    """Raised to skip a command that another worker answers."""
+
+@bot.before_invoke
+async def route_command(ctx):
+    """In worker mode, lets commands about a member run on the member's worker and the others on the leader.
+
+    Every worker receives every message, so all but one of them skip each command.
+    """
+    if not WORKER_MODE or ctx.command.name == 'team':
+        return
+
+    params = list(ctx.command.clean_params)
+    arguments = dict(zip(params, ctx.args[len(ctx.args) - len(params):]))
+    discord_id = arguments.get('discord_id')
+    if discord_id is not None:
+        if not owns_member(discord_id):
+            raise RoutedToOtherWorker()
+    elif not is_leader():
+        raise RoutedToOtherWorker()
 
 @bot.event
-async def on_ready():
-    print("Bot is online!")  # Log that the bot is online
+async def on_command_error(ctx, error):
+    if isinstance(error, RoutedToOtherWorker):
+        return
+    await commands.Bot.on_command_error(bot, ctx, error)
 
+@bot.event
+async def setup_hook():
+    """Creates the database connections and shared managers once per process, before the gateway connects."""
     streaks_db = StreaksDB(MYSQL_HOST, MYSQL_USER, MYSQL_PASSWORD, MYSQL_DB, MYSQL_PORT)
+    updates_db = UpdatesDB(MYSQL_HOST, MYSQL_USER, MYSQL_PASSWORD, MYSQL_DB, MYSQL_PORT)
+    weekly_summaries_db = WeeklySummariesDB(MYSQL_HOST, MYSQL_USER, MYSQL_PASSWORD, MYSQL_DB, MYSQL_PORT)
+    status_sessions_db = StatusSessionsDB(MYSQL_HOST, MYSQL_USER, MYSQL_PASSWORD, MYSQL_DB, MYSQL_PORT)
+
+    # The teams are started on these connections once the guilds are available
+    global team_member_db, weekly_posts_db, scheduled_jobs_db
+
     team_member_db = TeamMemberDB(MYSQL_HOST, MYSQL_USER, MYSQL_PASSWORD, MYSQL_DB, MYSQL_PORT)
     weekly_posts_db = WeeklyPostsDB(MYSQL_HOST, MYSQL_USER, MYSQL_PASSWORD, MYSQL_DB, MYSQL_PORT)
-    updates_db = UpdatesDB(MYSQL_HOST, MYSQL_USER, MYSQL_PASSWORD, MYSQL_DB, MYSQL_PORT)
+    scheduled_jobs_db = ScheduledJobsDB(MYSQL_HOST, MYSQL_USER, MYSQL_PASSWORD, MYSQL_DB, MYSQL_PORT)
+
+    # In worker mode the worker holding the lease becomes the leader
+    if WORKER_MODE:
+        global leader_lease
 
-    guild = bot.get_guild(GUILD_TOKEN)
-    channel = guild.get_channel(CHANNEL_TOKEN)
+        leases_db = LeasesDB(MYSQL_HOST, MYSQL_USER, MYSQL_PASSWORD, MYSQL_DB, MYSQL_PORT)
+        leader_lease = LeaseManager(leases_db, 'leader', f"{socket.gethostname()}:{os.getpid()}:{WORKER_INDEX}", LEADER_LEASE_SECONDS)
+        leader_lease.renew()
+        print(f"Worker {WORKER_INDEX} of {WORKER_COUNT} started{' as the leader' if leader_lease.is_held else ''}.")
 
     global updates_manager
 
-    updates_manager = UpdatesManager(updates_db)
+    updates_manager = UpdatesManager(updates_db, llm_backend)
+
+    global weekly_summary_manager
+
+    weekly_summary_manager = WeeklySummaryManager(weekly_summaries_db, updates_manager)
 
     global streaks_manager
 
     streaks_manager = StreaksManager(streaks_db)
 
-    global team_member_manager
+    global status_session_manager
 
-    team_member_manager = TeamMemberManager(team_member_db)
+    status_session_manager = StatusSessionManager(status_sessions_db)
 
-    # Update each team member's streak from the database
-    for member in team_member_manager.team_members:
-        member.update_streak(streaks_manager.get_streak(member.discord_id))
-        member.update_weekly_checkins(updates_manager.get_weekly_checkins_count(member.discord_id, member.time_zone))
+    global scheduler_telemetry
 
-    global weekly_post_manager
-    
-    weekly_post_manager = WeeklyPostManager(channel, weekly_posts_db)
-    # Initialize new weekly post
-    await weekly_post_manager.initialize_post(team_member_manager.team_members)
-    await weekly_post_manager.rebuild_post(team_member_manager.team_members)
+    scheduler_telemetry = SchedulerTelemetry()
 
-    global scheduler
-    scheduler = Scheduler()
+    # Handle clicks on the review buttons of every report, including ones sent before a restart
+    global review_view
 
-    scheduler.schedule_weekly_post(weekly_state_reset, weekly_post_manager, streaks_manager, team_member_manager.team_members)
-    
-    for member in team_member_manager.team_members:
-        scheduler.add_job(send_status_request, member, weekly_post_manager, streaks_manager, updates_manager)
+    review_view = ReportReviewView(handle_review_choice)
+    bot.add_view(review_view)
 
-@app.route('/')
-def index(): 
-    return 'Discord bot is running.'
+    # Serve the health checks and metrics from this event loop; workers on one host use consecutive ports
+    global health_server
 
-def run_bot():
-    bot.run(BOT_TOKEN)
+    health_server = HealthServer(
+        '0.0.0.0', int(os.environ.get('PORT', 80)) + WORKER_INDEX,
+        liveness_checks={'gateway': lambda: not bot.is_closed()},
+        readiness_checks={'gateway': gateway_ready, 'database': database_reachable, 'scheduler': schedulers_running},
+        metrics_sources={
+            'status_sessions': status_session_metrics,
+            'outbox': outbox_metrics_summary,
+            'scheduler': scheduler_metrics_summary,
+            'llm': llm_metrics_summary,
+        }
+    )
+    await health_server.start()
 
-def run_app():
-    app.run(host='0.0.0.0', port=int(os.environ.get('PORT', 80)))
+def revalidate_channels():
+    """Points the started teams at the channel objects of the new gateway session, keeping their schedules and posts."""
+    for tenant in tenant_registry.all_tenants():
+        if tenant.weekly_post_manager is None:
+            continue  # The team is still being started
+        channel = bot.get_channel(tenant.channel_id)
+        if channel is None:
+            print(f"Channel {tenant.channel_id} of team {tenant.name} is not available.")
+            continue
+        tenant.channel = channel
+        tenant.weekly_post_manager.channel = channel
 
-if __name__ == '__main__':
-    p1 = Process(target=run_bot)
-    p2 = Process(target=run_app)
+@bot.event
+async def on_ready():
+    # on_ready fires again when the gateway reconnects without resuming its session;
+    # the teams are only started once, later calls only refresh the channel handles
+    global tenants_started
+
+    if tenants_started:
+        print("Bot reconnected.")
+        revalidate_channels()
+        return
+    tenants_started = True
+
+    print("Bot is online!")  # Log that the bot is online
 
-    p1.start()
-    p2.start()
+    # Start every team on the shared database connections, retrying the ones that fail
+    if not await start_tenants() and not retry_tenants.is_running():
+        retry_tenants.start()
 
-    p1.join()
-    p2.join()
\ No newline at end of file
+    # Expire interrupted conversations that waited too long, then resume the rest
+    await reap_status_sessions()
+    resume_status_sessions()
+
+    # Keep expiring conversations that were abandoned
+    if not reap_status_sessions.is_running():
+        reap_status_sessions.start()
+
+    # Keep the leadership and follow the other workers' changes
+    if WORKER_MODE:
+        if not renew_leadership.is_running():
+            renew_leadership.start()
+        if not sync_workers.is_running():
+            sync_workers.start()
+
+if __name__ == '__main__':
+    bot.run(BOT_TOKEN)
@@ -0,0 +1,146 @@
+import asyncio
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, Hashable, Optional, Tuple
+from latency_histogram import LatencyHistogram
+
+class OutboundDispatcher:
+    """Shared queue for outgoing Discord messages and edits.
+
+    Requests are queued per channel and each channel's queue is drained by its own
+    worker, one request at a time, so a long message in one conversation never delays
+    another conversation. Discord's message rate limits are bucketed per channel; the
+    per-bucket pacing from the X-RateLimit-* response headers is done by discord.py's
+    HTTP client, so the workers never sleep on a fixed timer and a request only waits
+    when its own channel's bucket is exhausted.
+
+    Attributes:
+        window: Number of recent queue wait times kept for the percentiles.
+        wait_histogram: Histogram of the time requests waited in their queue.
+        request_histogram: Histogram of the time the API calls took.
+    """
+
+    def __init__(self, window: int = 500) -> None:
+        """Initialize the OutboundDispatcher.
+
+        Args:
+            window: Number of recent queue wait times kept for the percentiles.
+        """
+        self.window = window
+        self._queues: Dict[Hashable, Deque[Tuple[Callable[[], Awaitable], asyncio.Future, float]]] = {}
+        self._workers: Dict[Hashable, asyncio.Task] = {}
+        self._waits = deque(maxlen=window)
+        self.sent = 0
+        self.failed = 0
+        self.max_depth = 0
+        self.wait_histogram = LatencyHistogram()
+        self.request_histogram = LatencyHistogram()
+
+    @staticmethod
+    def channel_key(destination) -> Hashable:
+        """Return the key of the queue a destination's messages go through."""
+        # A command context or a message sends into its channel
+        channel = getattr(destination, 'channel', None)
+        if channel is not None and getattr(channel, 'id', None) is not None:
+            destination = channel
+        # A user and their DM channel share one queue keyed by the user's ID, since the
+        # DM channel only exists once the first message was sent
+        recipient = getattr(destination, 'recipient', None)
+        if recipient is not None:
+            return ('dm', recipient.id)
+        if hasattr(destination, 'dm_channel'):
+            return ('dm', destination.id)
+        return destination.id
+
+    async def submit(self, key: Hashable, request: Callable[[], Awaitable]):
+        """Queue a request on a channel's queue and wait for its result.
+
+        Args:
+            key: The key of the channel queue, see channel_key().
+            request: A function returning the coroutine that performs the API call.
+
+        Returns:
+            The result of the request.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        queue = self._queues.setdefault(key, deque())
+        queue.append((request, future, loop.time()))
+        self.max_depth = max(self.max_depth, self.depth())
+
+        if key not in self._workers:
+            self._workers[key] = asyncio.ensure_future(self._drain(key))
+        return await future
+
+    async def send(self, destination, content: Optional[str] = None, **kwargs):
+        """Send a message to a channel, user or command context through its channel queue."""
+        return await self.submit(self.channel_key(destination), lambda: destination.send(content, **kwargs))
+
+    async def edit(self, message, **kwargs):
+        """Edit a message through its channel queue."""
+        return await self.submit(self.channel_key(message), lambda: message.edit(**kwargs))
+
+    async def delete(self, message):
+        """Delete a message through its channel queue."""
+        return await self.submit(self.channel_key(message), message.delete)
+
+    async def _drain(self, key: Hashable) -> None:
+        """Run a channel's queued requests in order until the queue is empty."""
+        loop = asyncio.get_running_loop()
+        queue = self._queues[key]
+        try:
+            while queue:
+                request, future, enqueued_at = queue.popleft()
+                if future.cancelled():
+                    continue
+                started_at = loop.time()
+                self._waits.append(started_at - enqueued_at)
+                self.wait_histogram.observe(started_at - enqueued_at)
+                try:
+                    result = await request()
+                except Exception as e:
+                    self.failed += 1
+                    if not future.cancelled():
+                        future.set_exception(e)
+                else:
+                    self.sent += 1
+                    if not future.cancelled():
+                        future.set_result(result)
+                finally:
+                    self.request_histogram.observe(loop.time() - started_at)
+        finally:
+            self._workers.pop(key, None)
+            if not queue:
+                self._queues.pop(key, None)
+
+    def depth(self) -> int:
+        """Return the number of requests waiting in all queues."""
+        return sum(len(queue) for queue in self._queues.values())
+
+    def _wait_percentile(self, percentile: float) -> Optional[float]:
+        """Return the given percentile (0-100) of recent queue wait times in seconds."""
+        if not self._waits:
+            return None
+        ordered = sorted(self._waits)
+        index = min(len(ordered) - 1, int(len(ordered) * percentile / 100))
+        return round(ordered[index], 3)
+
+    def metrics(self) -> dict:
+        """Return the queue depth, throughput counters and queue wait percentiles."""
+        return {
+            'queue_depth': self.depth(),
+            'max_queue_depth': self.max_depth,
+            'active_channels': len(self._workers),
+            'sent': self.sent,
+            'failed': self.failed,
+            'wait_p50_seconds': self._wait_percentile(50),
+            'wait_p95_seconds': self._wait_percentile(95),
+            'wait_p99_seconds': self._wait_percentile(99),
+        }
+
+    def histograms(self) -> dict:
+        """Return the queue wait and API call latency histograms."""
+        return {
+            'wait_seconds': self.wait_histogram.snapshot(),
+            'request_seconds': self.request_histogram.snapshot(),
+        }
+
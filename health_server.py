@@ -0,0 +1,97 @@
+import inspect
+from aiohttp import web
+from typing import Callable, Dict, Optional
+
+class HealthServer:
+    """HTTP server for health checks and metrics, running in the bot's own event loop.
+
+    Routes:
+        /healthz: Liveness; 200 if every liveness check passes, 503 otherwise.
+        /readyz: Readiness; 200 if every readiness check passes, 503 otherwise.
+        /metrics: The metrics of every source, indexed by source name.
+        /metrics/<name>: The metrics of one source.
+
+    Checks are functions returning a bool, or coroutines resolving to one; a check that
+    raises fails. Metrics sources are functions returning a JSON-serializable dict.
+
+    Attributes:
+        host: The address to listen on.
+        port: The port to listen on.
+        liveness_checks: The liveness checks, indexed by name.
+        readiness_checks: The readiness checks, indexed by name.
+        metrics_sources: The metrics sources, indexed by name.
+    """
+
+    def __init__(self, host: str, port: int, liveness_checks: Optional[Dict[str, Callable]] = None,
+                 readiness_checks: Optional[Dict[str, Callable]] = None,
+                 metrics_sources: Optional[Dict[str, Callable[[], dict]]] = None) -> None:
+        """Initialize the HealthServer.
+
+        Args:
+            host: The address to listen on.
+            port: The port to listen on.
+            liveness_checks: The liveness checks, indexed by name.
+            readiness_checks: The readiness checks, indexed by name.
+            metrics_sources: The metrics sources, indexed by name.
+        """
+        self.host = host
+        self.port = port
+        self.liveness_checks = liveness_checks or {}
+        self.readiness_checks = readiness_checks or {}
+        self.metrics_sources = metrics_sources or {}
+        self._runner: Optional[web.AppRunner] = None
+
+        self.app = web.Application()
+        self.app.router.add_get('/', self._index)
+        self.app.router.add_get('/healthz', self._liveness)
+        self.app.router.add_get('/readyz', self._readiness)
+        self.app.router.add_get('/metrics', self._all_metrics)
+        self.app.router.add_get('/metrics/{name}', self._metrics)
+
+    async def start(self) -> None:
+        """Start listening. Must be called from the running event loop."""
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        print(f"Health server listening on {self.host}:{self.port}")
+
+    async def stop(self) -> None:
+        """Stop listening and close open connections."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @staticmethod
+    async def _run_checks(checks: Dict[str, Callable]) -> web.Response:
+        """Run the checks and return their results, with status 503 if any failed."""
+        results = {}
+        for name, check in checks.items():
+            try:
+                result = check()
+                if inspect.isawaitable(result):
+                    result = await result
+                results[name] = bool(result)
+            except Exception as e:
+                print(f"Health check '{name}' failed: {e}")
+                results[name] = False
+
+        healthy = all(results.values())
+        return web.json_response({'status': 'ok' if healthy else 'fail', 'checks': results}, status=200 if healthy else 503)
+
+    async def _index(self, request: web.Request) -> web.Response:
+        return web.Response(text='Discord bot is running.')
+
+    async def _liveness(self, request: web.Request) -> web.Response:
+        return await self._run_checks(self.liveness_checks)
+
+    async def _readiness(self, request: web.Request) -> web.Response:
+        return await self._run_checks(self.readiness_checks)
+
+    async def _all_metrics(self, request: web.Request) -> web.Response:
+        return web.json_response({name: source() for name, source in self.metrics_sources.items()})
+
+    async def _metrics(self, request: web.Request) -> web.Response:
+        source = self.metrics_sources.get(request.match_info['name'])
+        if source is None:
+            raise web.HTTPNotFound()
+        return web.json_response(source())
@@ -0,0 +1,44 @@
+from bisect import bisect_left
+from typing import Iterable
+
+class LatencyHistogram:
+    """Cumulative histogram of latencies in seconds.
+
+    Unlike the rolling percentiles, the bucket counts cover every observation since
+    startup, so a monitoring system can compute rates and percentiles over any interval
+    from two snapshots.
+
+    Attributes:
+        bounds: The upper bounds of the buckets in seconds, in increasing order.
+        count: The number of observations.
+        total: The sum of all observations in seconds.
+    """
+
+    DEFAULT_BOUNDS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300)
+
+    def __init__(self, bounds: Iterable[float] = DEFAULT_BOUNDS) -> None:
+        """Initialize the LatencyHistogram.
+
+        Args:
+            bounds: The upper bounds of the buckets in seconds.
+        """
+        self.bounds = sorted(bounds)
+        self._counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Record one latency."""
+        self._counts[bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+
+    def snapshot(self) -> dict:
+        """Return the cumulative count per bucket upper bound, the count and the sum."""
+        buckets = {}
+        cumulative = 0
+        for bound, bucket_count in zip(self.bounds, self._counts):
+            cumulative += bucket_count
+            buckets[str(bound)] = cumulative
+        buckets['+Inf'] = self.count
+        return {'buckets': buckets, 'count': self.count, 'sum': round(self.total, 3)}
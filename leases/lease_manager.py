@@ -0,0 +1,47 @@
+from leases.leases_db import LeasesDB
+
+class LeaseManager:
+    """
+    Holds a named lease for this process, e.g. to make it the leader among several workers.
+    """
+
+    def __init__(self, leases_db: LeasesDB, name: str, holder: str, ttl_seconds: int):
+        """
+        Initializes a new LeaseManager instance.
+
+        Args:
+            leases_db: The LeasesDB object that handles database operations.
+            name: The name of the lease.
+            holder: The unique name of this process.
+            ttl_seconds: The number of seconds the lease is held for unless it is renewed.
+        """
+        self.leases_db = leases_db
+        self.name = name
+        self.holder = holder
+        self.ttl_seconds = ttl_seconds
+        self.is_held = False
+
+    def renew(self) -> bool:
+        """
+        Acquires the lease, or renews it if this process already holds it.
+
+        Must be called more often than every ttl_seconds to keep the lease. A failed
+        renewal, e.g. because the database is unreachable, gives the lease up.
+
+        Returns:
+            True if this process holds the lease.
+        """
+        try:
+            self.is_held = self.leases_db.try_acquire(self.name, self.holder, self.ttl_seconds)
+        except Exception as e:
+            print(f"Failed to renew the '{self.name}' lease: {e}")
+            self.is_held = False
+        return self.is_held
+
+    def release(self):
+        """
+        Gives the lease up, e.g. on shutdown, so another process can take it over right away.
+        """
+        if self.is_held:
+            self.leases_db.release(self.name, self.holder)
+        self.is_held = False
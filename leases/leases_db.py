@@ -0,0 +1,105 @@
+from typing import Optional
+from base_db import BaseDB
+
+class LeasesDB(BaseDB):
+    """
+    Database class that handles operations related to the 'leases' table,
+    which elects a single holder for duties that must not run in several processes.
+    """
+
+    def __init__(self, host: str, user: str, password: str, database: str, port: str):
+        """
+        Initializes the LeasesDB class and creates the 'leases' table if it doesn't exist.
+
+        :param host: The MySQL host address.
+        :param user: The MySQL user.
+        :param password: The MySQL password.
+        :param database: The MySQL database name.
+        :param port: The MySQL port number.
+        """
+        super().__init__(host, user, password, database, port)
+        self._create_leases_table()
+
+    def _create_leases_table(self):
+        """
+        Creates the 'leases' table if it doesn't already exist.
+        """
+        query = '''
+            CREATE TABLE IF NOT EXISTS leases (
+                name VARCHAR(64) PRIMARY KEY,
+                holder VARCHAR(255) NOT NULL,
+                expires_at TIMESTAMP NOT NULL
+            );
+        '''
+        try:
+            self.execute_query(query)
+        finally:
+            self.close()
+
+    def try_acquire(self, name: str, holder: str, ttl_seconds: int) -> bool:
+        """
+        Acquires or renews a lease, unless another holder's lease has not expired yet.
+
+        The check and the write are a single statement, and expiry is decided by MySQL's
+        clock, so two processes can never both hold the lease.
+
+        :param name: The name of the lease.
+        :param holder: The unique name of the process asking for the lease.
+        :param ttl_seconds: The number of seconds the lease is held for unless it is renewed.
+        :return: True if the process holds the lease.
+        """
+        if not self.conn.is_connected():
+            print("Reconnecting to MySQL")
+            self.connect()
+
+        # MySQL applies the assignments in order, so expires_at sees the updated holder
+        query = """
+            INSERT INTO leases (name, holder, expires_at)
+            VALUES (%s, %s, NOW() + INTERVAL %s SECOND)
+            ON DUPLICATE KEY UPDATE
+                holder = IF(holder = VALUES(holder) OR expires_at < NOW(), VALUES(holder), holder),
+                expires_at = IF(holder = VALUES(holder), VALUES(expires_at), expires_at)
+        """
+        c = self.conn.cursor()
+        try:
+            c.execute(query, (name, holder, ttl_seconds))
+            self.conn.commit()
+            c.execute("SELECT holder FROM leases WHERE name = %s", (name,))
+            row = c.fetchone()
+            return row is not None and row[0] == holder
+        finally:
+            c.close()
+            self.close()
+
+    def get_holder(self, name: str) -> Optional[str]:
+        """
+        Fetches the current holder of a lease.
+
+        :param name: The name of the lease.
+        :return: The holder, or None if the lease is free or has expired.
+        """
+        if not self.conn.is_connected():
+            print("Reconnecting to MySQL")
+            self.connect()
+
+        c = self.conn.cursor()
+        try:
+            c.execute("SELECT holder FROM leases WHERE name = %s AND expires_at >= NOW()", (name,))
+            row = c.fetchone()
+            return row[0] if row else None
+        finally:
+            c.close()
+            self.close()
+
+    def release(self, name: str, holder: str):
+        """
+        Releases a lease so another process can take it over right away.
+
+        :param name: The name of the lease.
+        :param holder: The process releasing the lease; other holders' leases are kept.
+        """
+        query = "DELETE FROM leases WHERE name = %s AND holder = %s"
+        try:
+            self.execute_query(query, (name, holder))
+        finally:
+            self.close()
@@ -0,0 +1,181 @@
+import asyncio
+from collections import deque
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from llm.llm_backend import LLMBackend
+
+class HedgedBackend(LLMBackend):
+    """LLM backend wrapper that hedges slow completions to cut tail latency.
+
+    If a completion has not returned by the configured latency percentile of recent
+    calls to the same model, a duplicate request is fired and whichever finishes first wins; the other
+    is cancelled. Streaming calls are hedged on the time to their first chunk: if the
+    stream has not yielded by the percentile of recent first-chunk latencies, a second
+    stream is started, the one that yields first is kept and the other is cancelled.
+    Hedges are capped at max_hedge_ratio of all calls to bound the extra spend.
+
+    Attributes:
+        backend: The wrapped LLMBackend.
+        percentile: Latency percentile (0-100) of recent calls used as the hedge deadline.
+        initial_deadline: Hedge deadline in seconds until enough latency samples exist.
+        max_hedge_ratio: Maximum number of hedges as a fraction of all calls.
+        min_samples: Number of samples of a model needed before its percentile deadline is used.
+        window: Number of recent latencies kept per model.
+    """
+
+    def __init__(self, backend: LLMBackend, percentile: float = 95.0, initial_deadline: float = 10.0,
+                 max_hedge_ratio: float = 0.1, min_samples: int = 20, window: int = 200) -> None:
+        """Initialize the HedgedBackend.
+
+        Args:
+            backend: The LLMBackend to wrap.
+            percentile: Latency percentile (0-100) of recent calls used as the hedge deadline.
+            initial_deadline: Hedge deadline in seconds until enough latency samples exist.
+            max_hedge_ratio: Maximum number of hedges as a fraction of all calls.
+            min_samples: Number of samples of a model needed before its percentile deadline is used.
+            window: Number of recent latencies kept per model for the percentile.
+        """
+        self.backend = backend
+        self.percentile = percentile
+        self.initial_deadline = initial_deadline
+        self.max_hedge_ratio = max_hedge_ratio
+        self.min_samples = min_samples
+        self.window = window
+        # Recent latencies per model, since models differ widely in speed
+        self._latencies: Dict[str, deque] = {}
+        self.calls = 0
+        self.hedges_fired = 0
+        self.hedges_won = 0
+        self.hedges_skipped = 0
+
+    def hedge_deadline(self, model: str) -> float:
+        """Return the number of seconds to wait before hedging a call to a model."""
+        latencies = self._latencies.get(model, ())
+        if len(latencies) < self.min_samples:
+            return self.initial_deadline
+        ordered = sorted(latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * self.percentile / 100))
+        return ordered[index]
+
+    def _hedge_allowed(self) -> bool:
+        """Return whether another hedge stays within the extra spend cap."""
+        return self.hedges_fired + 1 <= self.max_hedge_ratio * self.calls
+
+    def _record_latency(self, model: str, latency: float) -> None:
+        """Add a completed call's latency to its model's window."""
+        self._latencies.setdefault(model, deque(maxlen=self.window)).append(latency)
+
+    @staticmethod
+    def _first_chunk_key(model: str) -> str:
+        """Return the key the first-chunk latencies of a model's streams are kept under."""
+        return f"{model} first chunk"
+
+    @staticmethod
+    async def _first_chunk(stream: AsyncIterator[str]) -> Tuple[bool, Optional[str]]:
+        """Wait for the first chunk of a stream; returns (False, None) if it ends without one."""
+        try:
+            return True, await stream.__anext__()
+        except StopAsyncIteration:
+            return False, None
+
+    async def complete(self, model: str, messages: List[dict]) -> str:
+        loop = asyncio.get_running_loop()
+        self.calls += 1
+        primary = asyncio.ensure_future(self.backend.complete(model, messages))
+        # Each request's latency is measured from its own start
+        started = {primary: loop.time()}
+        pending = {primary}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=self.hedge_deadline(model))
+            if done or not self._hedge_allowed():
+                if not done:
+                    self.hedges_skipped += 1
+                result = await primary
+                self._record_latency(model, loop.time() - started[primary])
+                return result
+
+            self.hedges_fired += 1
+            hedge = asyncio.ensure_future(self.backend.complete(model, messages))
+            started[hedge] = loop.time()
+            pending = {primary, hedge}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self.hedges_won += 1
+                        self._record_latency(model, loop.time() - started[task])
+                        return task.result()
+            # Both requests failed; surface the primary's error
+            return primary.result()
+        finally:
+            # Also stops the requests when the caller is cancelled while waiting
+            for task in pending:
+                task.cancel()
+
+    async def stream(self, model: str, messages: List[dict]) -> AsyncIterator[str]:
+        loop = asyncio.get_running_loop()
+        key = self._first_chunk_key(model)
+        self.calls += 1
+        streams: Dict[asyncio.Future, AsyncIterator[str]] = {}
+        started: Dict[asyncio.Future, float] = {}
+
+        def start_stream() -> asyncio.Future:
+            stream = self.backend.stream(model, messages).__aiter__()
+            first_chunk = asyncio.ensure_future(self._first_chunk(stream))
+            streams[first_chunk] = stream
+            started[first_chunk] = loop.time()
+            return first_chunk
+
+        primary = start_stream()
+        hedge = None
+        winner = None
+        pending = {primary}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=self.hedge_deadline(key))
+            if not done:
+                if self._hedge_allowed():
+                    self.hedges_fired += 1
+                    hedge = start_stream()
+                    pending.add(hedge)
+                else:
+                    self.hedges_skipped += 1
+
+            while winner is None:
+                if not done:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = next((task for task in done if task.exception() is None), None)
+                if winner is None and not pending:
+                    # Every stream failed before its first chunk; surface the primary's error
+                    primary.result()
+                done = set()
+
+            if winner is hedge:
+                self.hedges_won += 1
+            self._record_latency(key, loop.time() - started[winner])
+            for task in pending:
+                task.cancel()
+
+            has_chunk, chunk = winner.result()
+            if has_chunk:
+                yield chunk
+                async for delta in streams[winner]:
+                    yield delta
+        finally:
+            # Stop the losing stream, and the streams of a caller that stopped reading
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            for stream in streams.values():
+                await stream.aclose()
+
+    def metrics(self) -> Dict[str, float]:
+        """Return hedging counters and the current hedge deadline of each model."""
+        metrics = {
+            'calls': self.calls,
+            'hedges_fired': self.hedges_fired,
+            'hedges_won': self.hedges_won,
+            'hedges_skipped': self.hedges_skipped,
+        }
+        for model in sorted(self._latencies):
+            metrics[f'hedge_deadline_seconds[{model}]'] = round(self.hedge_deadline(model), 3)
+        return metrics
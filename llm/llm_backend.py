@@ -0,0 +1,42 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Dict, List
+
+class LLMError(Exception):
+    """Raised when an LLM backend fails to produce a completion."""
+
+class LLMBackend(ABC):
+    """Interface for chat completion providers.
+
+    Implementations must provide complete() and stream(), so a backend missing
+    one fails when it is instantiated. A backend that can not stream may call
+    the default stream(), which yields the whole completion as a single chunk.
+    """
+
+    @abstractmethod
+    async def complete(self, model: str, messages: List[dict]) -> str:
+        """Run a chat completion and return the generated text.
+
+        Args:
+            model: The model to use.
+            messages: The chat messages, each a dict with 'role' and 'content'.
+
+        Returns:
+            The generated text, stripped of surrounding whitespace.
+        """
+
+    @abstractmethod
+    async def stream(self, model: str, messages: List[dict]) -> AsyncIterator[str]:
+        """Run a chat completion and yield the generated text chunk by chunk.
+
+        Args:
+            model: The model to use.
+            messages: The chat messages, each a dict with 'role' and 'content'.
+
+        Yields:
+            Chunks of generated text in order.
+        """
+        yield await self.complete(model, messages)
+
+    def metrics(self) -> Dict[str, float]:
+        """Return backend-specific counters for monitoring. Backends without metrics return an empty dict."""
+        return {}
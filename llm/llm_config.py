@@ -0,0 +1,56 @@
+import os
+from typing import Dict
+from llm.llm_backend import LLMBackend
+
+# Default model for each LLM task; override with LLM_MODEL_<TASK>, e.g. LLM_MODEL_WEEKLY_SUMMARY
+DEFAULT_MODELS: Dict[str, str] = {
+    'daily_summary': 'gpt-3.5-turbo-1106',
+    'weekly_summary': 'gpt-4-0613',
+    'technical_summary': 'gpt-3.5-turbo-1106',
+    'revision': 'gpt-3.5-turbo-1106',
+    'non_technical_summary': 'gpt-3.5-turbo-1106',
+    'goals_summary': 'gpt-3.5-turbo-1106',
+    'performance_evaluation': 'gpt-3.5-turbo-1106',
+    'commit_message': 'gpt-3.5-turbo-16k-0613',
+}
+
+def load_model_config() -> Dict[str, str]:
+    """Return the model to use for each task, applying LLM_MODEL_<TASK> environment overrides."""
+    return {task: os.getenv(f"LLM_MODEL_{task.upper()}", model) for task, model in DEFAULT_MODELS.items()}
+
+def create_llm_backend() -> LLMBackend:
+    """Create the LLM backend selected by the LLM_BACKEND environment variable.
+
+    LLM_BACKEND=openai (the default) uses OPENAI_API_KEY. LLM_BACKEND=stub uses the
+    deterministic local backend configured by STUB_LLM_LATENCY, STUB_LLM_CHUNK_LATENCY,
+    STUB_LLM_FAILURE_RATE and STUB_LLM_SEED.
+
+    With LLM_HEDGE=true the backend is wrapped in a HedgedBackend configured by
+    LLM_HEDGE_PERCENTILE, LLM_HEDGE_INITIAL_DEADLINE and LLM_HEDGE_MAX_RATIO.
+    """
+    backend = _create_base_backend(os.getenv('LLM_BACKEND', 'openai').lower())
+
+    if os.getenv('LLM_HEDGE', 'false').lower() == 'true':
+        from llm.hedged_backend import HedgedBackend
+        backend = HedgedBackend(
+            backend,
+            percentile=float(os.getenv('LLM_HEDGE_PERCENTILE', 95.0)),
+            initial_deadline=float(os.getenv('LLM_HEDGE_INITIAL_DEADLINE', 10.0)),
+            max_hedge_ratio=float(os.getenv('LLM_HEDGE_MAX_RATIO', 0.1))
+        )
+    return backend
+
+def _create_base_backend(backend: str) -> LLMBackend:
+    """Create the provider backend with the given name."""
+    if backend == 'stub':
+        from llm.stub_backend import StubBackend
+        return StubBackend(
+            latency=float(os.getenv('STUB_LLM_LATENCY', 0.0)),
+            chunk_latency=float(os.getenv('STUB_LLM_CHUNK_LATENCY', 0.0)),
+            failure_rate=float(os.getenv('STUB_LLM_FAILURE_RATE', 0.0)),
+            seed=int(os.getenv('STUB_LLM_SEED', 0))
+        )
+    if backend == 'openai':
+        from llm.openai_backend import OpenAIBackend
+        return OpenAIBackend(os.getenv('OPENAI_API_KEY'))
+    raise ValueError(f"Unknown LLM_BACKEND '{backend}'. Use 'openai' or 'stub'.")
@@ -0,0 +1,33 @@
+from typing import AsyncIterator, List
+import openai
+from llm.llm_backend import LLMBackend
+
+class OpenAIBackend(LLMBackend):
+    """LLM backend that calls OpenAI's ChatCompletion API."""
+
+    def __init__(self, api_key: str = None) -> None:
+        """Initialize the OpenAIBackend.
+
+        Args:
+            api_key: The OpenAI API key. If omitted, the key already configured on the openai module is used.
+        """
+        if api_key:
+            openai.api_key = api_key
+
+    async def complete(self, model: str, messages: List[dict]) -> str:
+        response = await openai.ChatCompletion.acreate(
+            model=model,
+            messages=messages
+        )
+        return response['choices'][0]['message']['content'].strip()
+
+    async def stream(self, model: str, messages: List[dict]) -> AsyncIterator[str]:
+        response = await openai.ChatCompletion.acreate(
+            model=model,
+            messages=messages,
+            stream=True
+        )
+        async for chunk in response:
+            delta = chunk['choices'][0]['delta'].get('content')
+            if delta:
+                yield delta
@@ -0,0 +1,60 @@
+import asyncio
+import hashlib
+import random
+from typing import AsyncIterator, List
+from llm.llm_backend import LLMBackend, LLMError
+
+class StubBackend(LLMBackend):
+    """Deterministic local LLM backend for offline runs and benchmarks.
+
+    The reply is derived from the model name and the last message, so the same
+    input always produces the same output. Latency and failures are simulated.
+
+    Attributes:
+        latency: Seconds to wait before a completion returns.
+        chunk_latency: Seconds to wait between streamed chunks.
+        failure_rate: Probability in [0, 1] that a call raises LLMError.
+        calls: Number of completions requested so far.
+    """
+
+    def __init__(self, latency: float = 0.0, chunk_latency: float = 0.0, failure_rate: float = 0.0, seed: int = 0) -> None:
+        """Initialize the StubBackend.
+
+        Args:
+            latency: Seconds to wait before a completion returns.
+            chunk_latency: Seconds to wait between streamed chunks.
+            failure_rate: Probability in [0, 1] that a call raises LLMError.
+            seed: Seed for the failure injection, so failing calls are reproducible.
+        """
+        self.latency = latency
+        self.chunk_latency = chunk_latency
+        self.failure_rate = failure_rate
+        self.calls = 0
+        self._random = random.Random(seed)
+
+    def _reply(self, model: str, messages: List[dict]) -> str:
+        """Build the deterministic reply for a request."""
+        content = messages[-1]['content'] if messages else ""
+        digest = hashlib.sha1(f"{model}\n{content}".encode('utf-8')).hexdigest()[:8]
+        excerpt = ' '.join(content.split()[:40])
+        return f"[{model} stub {digest}] {excerpt}".strip()
+
+    async def _begin_call(self) -> None:
+        """Count the call, apply latency and inject a failure if one is due."""
+        self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.failure_rate and self._random.random() < self.failure_rate:
+            raise LLMError(f"Injected stub failure on call {self.calls}")
+
+    async def complete(self, model: str, messages: List[dict]) -> str:
+        await self._begin_call()
+        return self._reply(model, messages)
+
+    async def stream(self, model: str, messages: List[dict]) -> AsyncIterator[str]:
+        await self._begin_call()
+        words = self._reply(model, messages).split(' ')
+        for index, word in enumerate(words):
+            if self.chunk_latency:
+                await asyncio.sleep(self.chunk_latency)
+            yield word if index == 0 else f" {word}"
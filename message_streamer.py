@@ -0,0 +1,133 @@
+import asyncio
+from typing import List, Optional
+
+class MessageStreamer:
+    """Streams generated text into a Discord channel by progressively editing messages.
+
+    Text is buffered and the current message is edited at most once per edit_interval.
+    When the buffered text outgrows Discord's message limit, the current message is
+    finalized at the nearest newline and a new message is started for the remainder.
+
+    Attributes:
+        destination: The channel or user the messages are sent to.
+        header: Text shown at the top of the first message.
+        edit_interval: Minimum number of seconds between two edits of the same message.
+        max_length: Maximum number of characters per message.
+        messages: All messages sent so far.
+        started: Whether any generated text has been received.
+        text: The generated text received so far.
+        outbox: Optional OutboundDispatcher the sends and edits are queued through.
+    """
+
+    def __init__(self, destination, header: str = "", edit_interval: float = 1.0, max_length: int = 2000, outbox=None) -> None:
+        """Initialize the MessageStreamer.
+
+        Args:
+            destination: The channel or user the messages are sent to.
+            header: Text shown at the top of the first message.
+            edit_interval: Minimum number of seconds between two edits of the same message.
+            max_length: Maximum number of characters per message.
+            outbox: Optional OutboundDispatcher the sends and edits are queued through.
+        """
+        self.destination = destination
+        self.edit_interval = edit_interval
+        self.max_length = max_length
+        self.outbox = outbox
+        self.messages: List = []
+        self.started = False
+        self.text = ""
+        self._header = header
+        self._content = header  # Full text of the message currently being streamed
+        self._rendered = ""  # Text last sent to Discord for the current message
+        self._current = None
+        self._last_edit = 0.0
+        self._reusable: List = []  # Sent messages to edit instead of sending new ones, after a rewrite
+
+    async def append(self, text: str) -> None:
+        """Append generated text, editing or rolling over messages as needed.
+
+        Args:
+            text: The newly generated text.
+        """
+        if not text:
+            return
+        self.started = True
+        self.text += text
+        await self._add(text)
+
+    async def _add(self, text: str) -> None:
+        """Add text to the current message, rolling over to new messages as needed."""
+        self._content += text
+
+        # Roll over to a new message once the current one is full
+        while len(self._content) > self.max_length:
+            split_index = self._content.rfind('\n', 0, self.max_length)
+            if split_index <= 0:
+                split_index = self.max_length
+            head, self._content = self._content[:split_index], self._content[split_index:].lstrip('\n')
+            await self._render(head)
+            self._current = None
+            self._rendered = ""
+
+        if asyncio.get_running_loop().time() - self._last_edit >= self.edit_interval:
+            await self._render(self._content)
+
+    async def finish(self, trailer: str = "", view=None, text: Optional[str] = None):
+        """Flush any buffered text and return the last message sent.
+
+        Args:
+            trailer: Optional text appended after the generated text, e.g. instructions.
+            view: Optional view, e.g. buttons, attached to the last message.
+            text: Optional final text of the generation. If it differs from the streamed text,
+                e.g. because the generation failed partway and an error message was returned,
+                the messages are rewritten to show it instead.
+
+        Returns:
+            The last Discord message of the stream, or None if nothing was sent.
+        """
+        if text is not None and text.strip() != self.text.strip():
+            self._reusable, self.messages = self.messages, []
+            self._current = None
+            self._rendered = ""
+            self._content = self._header
+            self.text = text
+            await self._add(text)
+        if trailer:
+            await self._add(trailer)
+        await self._render(self._content, view)
+
+        # Delete the messages a shorter rewritten text no longer needs
+        while self._reusable:
+            message = self._reusable.pop()
+            if self.outbox:
+                await self.outbox.delete(message)
+            else:
+                await message.delete()
+        return self._current
+
+    async def _render(self, content: str, view=None) -> None:
+        """Send or edit the current message so it shows the given content and view."""
+        content = content.strip()
+        if not content or (content == self._rendered and view is None):
+            return
+        kwargs = {'view': view} if view is not None else {}
+        if self._current is None and self._reusable:
+            self._current = self._reusable.pop(0)
+            self.messages.append(self._current)
+            kwargs['content'] = content
+            if self.outbox:
+                await self.outbox.edit(self._current, **kwargs)
+            else:
+                await self._current.edit(**kwargs)
+        elif self._current is None:
+            if self.outbox:
+                self._current = await self.outbox.send(self.destination, content, **kwargs)
+            else:
+                self._current = await self.destination.send(content, **kwargs)
+            self.messages.append(self._current)
+        elif self.outbox:
+            await self.outbox.edit(self._current, content=content, **kwargs)
+        else:
+            await self._current.edit(content=content, **kwargs)
+        self._rendered = content
+        self._last_edit = asyncio.get_running_loop().time()
@@ -0,0 +1,40 @@
+import discord
+from typing import Awaitable, Callable
+
+# The choices a member can make on a report, identified by the buttons' custom IDs
+CONFIRM = 'confirm'
+REVISE = 'revise'
+SUBMIT = 'submit'
+
+class ReportReviewView(discord.ui.View):
+    """Persistent Confirm / Revise / Submit buttons shown under a member's report.
+
+    The buttons have fixed custom IDs and the view never times out, so a single
+    instance registered with the bot handles clicks on every report message, including
+    messages sent before a restart.
+
+    Attributes:
+        on_choice: Coroutine called with the interaction and the chosen CONFIRM, REVISE or SUBMIT.
+    """
+
+    def __init__(self, on_choice: Callable[[discord.Interaction, str], Awaitable[None]]) -> None:
+        """Initialize the ReportReviewView.
+
+        Args:
+            on_choice: Coroutine called with the interaction and the chosen CONFIRM, REVISE or SUBMIT.
+                It must respond to the interaction.
+        """
+        super().__init__(timeout=None)
+        self.on_choice = on_choice
+
+    @discord.ui.button(label="Confirm", emoji="👍", style=discord.ButtonStyle.success, custom_id=f"status_review:{CONFIRM}")
+    async def confirm(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.on_choice(interaction, CONFIRM)
+
+    @discord.ui.button(label="Revise with AI", emoji="✏️", style=discord.ButtonStyle.primary, custom_id=f"status_review:{REVISE}")
+    async def revise(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.on_choice(interaction, REVISE)
+
+    @discord.ui.button(label="Submit my own", emoji="📝", style=discord.ButtonStyle.secondary, custom_id=f"status_review:{SUBMIT}")
+    async def submit(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.on_choice(interaction, SUBMIT)
@@ -0,0 +1,87 @@
+import pickle
+from typing import List, Optional
+from apscheduler.job import Job
+from apscheduler.jobstores.base import BaseJobStore, ConflictingIdError, JobLookupError
+from apscheduler.util import datetime_to_utc_timestamp, utc_timestamp_to_datetime
+from mysql.connector import errors
+from scheduled_jobs.scheduled_jobs_db import ScheduledJobsDB
+
+class MySQLJobStore(BaseJobStore):
+    """APScheduler job store that persists jobs in the 'scheduled_jobs' table.
+
+    Jobs must reference module-level functions and have picklable arguments. Several
+    stores can share the table, each seeing only the jobs of its namespace.
+    """
+
+    def __init__(self, scheduled_jobs_db: ScheduledJobsDB, pickle_protocol: int = pickle.HIGHEST_PROTOCOL,
+                 namespace: Optional[str] = None) -> None:
+        """Initialize the MySQLJobStore.
+
+        Args:
+            scheduled_jobs_db: The ScheduledJobsDB object that handles database operations.
+            pickle_protocol: The pickle protocol used to serialize job state.
+            namespace: Only use the jobs whose IDs are prefixed with '<namespace>|', or the
+                unprefixed ones if ''. Defaults to every job in the table.
+        """
+        super().__init__()
+        self.scheduled_jobs_db = scheduled_jobs_db
+        self.pickle_protocol = pickle_protocol
+        self.namespace = namespace
+
+    def lookup_job(self, job_id: str) -> Optional[Job]:
+        job_state = self.scheduled_jobs_db.get_job_state(job_id)
+        return self._reconstitute_job(job_state) if job_state else None
+
+    def get_due_jobs(self, now) -> List[Job]:
+        return self._get_jobs(datetime_to_utc_timestamp(now))
+
+    def get_next_run_time(self):
+        return utc_timestamp_to_datetime(self.scheduled_jobs_db.get_next_run_time(self.namespace))
+
+    def get_all_jobs(self) -> List[Job]:
+        jobs = self._get_jobs()
+        self._fix_paused_jobs_sorting(jobs)
+        return jobs
+
+    def add_job(self, job: Job) -> None:
+        try:
+            self.scheduled_jobs_db.insert_job(job.id, datetime_to_utc_timestamp(job.next_run_time), self._serialize(job))
+        except errors.IntegrityError:
+            raise ConflictingIdError(job.id)
+
+    def update_job(self, job: Job) -> None:
+        if not self.scheduled_jobs_db.update_job(job.id, datetime_to_utc_timestamp(job.next_run_time), self._serialize(job)):
+            raise JobLookupError(job.id)
+
+    def remove_job(self, job_id: str) -> None:
+        if not self.scheduled_jobs_db.delete_job(job_id):
+            raise JobLookupError(job_id)
+
+    def remove_all_jobs(self) -> None:
+        self.scheduled_jobs_db.delete_all_jobs(self.namespace)
+
+    def _serialize(self, job: Job) -> bytes:
+        """Pickle the job's state."""
+        return pickle.dumps(job.__getstate__(), self.pickle_protocol)
+
+    def _reconstitute_job(self, job_state: bytes) -> Job:
+        """Rebuild a Job from its pickled state and attach it to this store."""
+        job = Job.__new__(Job)
+        job.__setstate__(pickle.loads(job_state))
+        job._scheduler = self._scheduler
+        job._jobstore_alias = self._alias
+        return job
+
+    def _get_jobs(self, max_next_run_time: Optional[float] = None) -> List[Job]:
+        """Restore stored jobs, dropping any that can no longer be restored."""
+        jobs = []
+        for job_id, job_state in self.scheduled_jobs_db.get_jobs(max_next_run_time, self.namespace):
+            try:
+                jobs.append(self._reconstitute_job(job_state))
+            except Exception as e:
+                print(f"Unable to restore scheduled job {job_id}, removing it: {e}")
+                self.scheduled_jobs_db.delete_job(job_id)
+        return jobs
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}>"
@@ -0,0 +1,196 @@
+from typing import List, Optional, Tuple
+from base_db import BaseDB
+
+class ScheduledJobsDB(BaseDB):
+    """
+    Database class that handles operations related to the 'scheduled_jobs' table,
+    which persists the scheduler's jobs across restarts.
+    """
+
+    def __init__(self, host: str, user: str, password: str, database: str, port: str):
+        """
+        Initializes the ScheduledJobsDB class and creates the 'scheduled_jobs' table if it doesn't exist.
+
+        :param host: The MySQL host address.
+        :param user: The MySQL user.
+        :param password: The MySQL password.
+        :param database: The MySQL database name.
+        :param port: The MySQL port number.
+        """
+        super().__init__(host, user, password, database, port)
+        self._create_scheduled_jobs_table()
+
+    def _create_scheduled_jobs_table(self):
+        """
+        Creates the 'scheduled_jobs' table if it doesn't already exist.
+        """
+        query = '''
+            CREATE TABLE IF NOT EXISTS scheduled_jobs (
+                id VARCHAR(191) PRIMARY KEY,
+                next_run_time DOUBLE,
+                job_state BLOB NOT NULL,
+                INDEX (next_run_time)
+            );
+        '''
+        try:
+            self.execute_query(query)
+        finally:
+            self.close()
+
+    @staticmethod
+    def _namespace_condition(namespace: Optional[str]) -> Tuple[str, tuple]:
+        """
+        Builds the condition selecting the jobs of a namespace.
+
+        Namespaced job IDs start with '<namespace>|'; jobs of the empty namespace have no prefix.
+
+        :param namespace: The namespace, '' for unprefixed jobs, or None for all jobs.
+        :return: The SQL condition and its parameters.
+        """
+        if namespace is None:
+            return "TRUE", ()
+        if namespace == '':
+            return "id NOT LIKE %s", ('%|%',)
+        prefix = namespace.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        return "id LIKE %s", (f"{prefix}|%",)
+
+    def get_job_state(self, job_id: str) -> Optional[bytes]:
+        """
+        Fetches the serialized state of a job.
+
+        :param job_id: The ID of the job.
+        :return: The serialized job state, or None if the job doesn't exist.
+        """
+        if not self.conn.is_connected():
+            print("Reconnecting to MySQL")
+            self.connect()
+
+        c = self.conn.cursor()
+        try:
+            c.execute("SELECT job_state FROM scheduled_jobs WHERE id = %s", (job_id,))
+            row = c.fetchone()
+            return row[0] if row else None
+        finally:
+            c.close()
+            self.close()
+
+    def get_jobs(self, max_next_run_time: Optional[float] = None, namespace: Optional[str] = None) -> List[Tuple[str, bytes]]:
+        """
+        Fetches jobs ordered by next run time, optionally only those due by max_next_run_time.
+
+        :param max_next_run_time: If given, only jobs with a next run time at or before this UTC timestamp are returned.
+        :param namespace: If given, only the jobs of this namespace are returned.
+        :return: A list of (id, job_state) tuples.
+        """
+        if not self.conn.is_connected():
+            print("Reconnecting to MySQL")
+            self.connect()
+
+        c = self.conn.cursor()
+        condition, params = self._namespace_condition(namespace)
+        if max_next_run_time is None:
+            query = f"SELECT id, job_state FROM scheduled_jobs WHERE {condition} ORDER BY next_run_time IS NULL, next_run_time"
+        else:
+            query = f"SELECT id, job_state FROM scheduled_jobs WHERE {condition} AND next_run_time <= %s ORDER BY next_run_time"
+            params += (max_next_run_time,)
+        try:
+            c.execute(query, params or None)
+            return [(row[0], row[1]) for row in c.fetchall()]
+        finally:
+            c.close()
+            self.close()
+
+    def get_next_run_time(self, namespace: Optional[str] = None) -> Optional[float]:
+        """
+        Fetches the earliest next run time of all active jobs.
+
+        :param namespace: If given, only the jobs of this namespace are considered.
+        :return: The earliest next run time as a UTC timestamp, or None if there are no active jobs.
+        """
+        if not self.conn.is_connected():
+            print("Reconnecting to MySQL")
+            self.connect()
+
+        c = self.conn.cursor()
+        condition, params = self._namespace_condition(namespace)
+        try:
+            c.execute(f"SELECT MIN(next_run_time) FROM scheduled_jobs WHERE {condition} AND next_run_time IS NOT NULL", params or None)
+            row = c.fetchone()
+            return row[0] if row else None
+        finally:
+            c.close()
+            self.close()
+
+    def insert_job(self, job_id: str, next_run_time: Optional[float], job_state: bytes):
+        """
+        Inserts a new job. Raises mysql.connector.errors.IntegrityError if the ID already exists.
+
+        :param job_id: The ID of the job.
+        :param next_run_time: The next run time as a UTC timestamp, or None if the job is paused.
+        :param job_state: The serialized job state.
+        """
+        query = "INSERT INTO scheduled_jobs (id, next_run_time, job_state) VALUES (%s, %s, %s)"
+        params = (job_id, next_run_time, job_state)
+        try:
+            self.execute_query(query, params)
+        finally:
+            self.close()
+
+    def update_job(self, job_id: str, next_run_time: Optional[float], job_state: bytes) -> bool:
+        """
+        Updates an existing job.
+
+        :param job_id: The ID of the job.
+        :param next_run_time: The next run time as a UTC timestamp, or None if the job is paused.
+        :param job_state: The serialized job state.
+        :return: True if the job exists, False otherwise.
+        """
+        if not self.conn.is_connected():
+            print("Reconnecting to MySQL")
+            self.connect()
+
+        c = self.conn.cursor()
+        try:
+            c.execute("UPDATE scheduled_jobs SET next_run_time = %s, job_state = %s WHERE id = %s", (next_run_time, job_state, job_id))
+            updated = c.rowcount > 0
+            if not updated:
+                # MySQL reports 0 affected rows when nothing changed, so check the job exists
+                c.execute("SELECT 1 FROM scheduled_jobs WHERE id = %s", (job_id,))
+                updated = c.fetchone() is not None
+            self.conn.commit()
+            return updated
+        finally:
+            c.close()
+            self.close()
+
+    def delete_job(self, job_id: str) -> bool:
+        """
+        Deletes a job.
+
+        :param job_id: The ID of the job.
+        :return: True if a job was deleted, False if it didn't exist.
+        """
+        if not self.conn.is_connected():
+            print("Reconnecting to MySQL")
+            self.connect()
+
+        c = self.conn.cursor()
+        try:
+            c.execute("DELETE FROM scheduled_jobs WHERE id = %s", (job_id,))
+            self.conn.commit()
+            return c.rowcount > 0
+        finally:
+            c.close()
+            self.close()
+
+    def delete_all_jobs(self, namespace: Optional[str] = None):
+        """
+        Deletes all jobs.
+
+        :param namespace: If given, only the jobs of this namespace are deleted.
+        """
+        condition, params = self._namespace_condition(namespace)
+        try:
+            self.execute_query(f"DELETE FROM scheduled_jobs WHERE {condition}", params or None)
+        finally:
+            self.close()
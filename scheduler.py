@@ -1,95 +1,473 @@
+from apscheduler.events import EVENT_JOB_ERROR, EVENT_JOB_EXECUTED, EVENT_JOB_MISSED, EVENT_JOB_SUBMITTED
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.schedulers.base import STATE_RUNNING
+from apscheduler.jobstores.base import BaseJobStore
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.date import DateTrigger
 from streaks.streaks_manager import StreaksManager
 from team_members.team_member import TeamMember
 from updates.updates_manager import UpdatesManager
 from weekly_posts.weekly_post_manager import WeeklyPostManager
+from scheduler_telemetry import SchedulerTelemetry
+import asyncio
+import hashlib
 import pytz
-from typing import Dict, List
-from datetime import datetime
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from datetime import datetime, timedelta, tzinfo
+
+# The Schedulers whose handlers persisted jobs are dispatched to, indexed by namespace
+_active_schedulers: Dict[str, 'Scheduler'] = {}
+
+@lru_cache(maxsize=None)
+def get_time_zone(time_zone: str) -> tzinfo:
+    """Return the pytz time zone for a name, building each one only once."""
+    return pytz.timezone(time_zone)
+
+async def run_scheduled_job(handler_name: str, *args, namespace: str = '') -> None:
+    """Entry point stored with every job.
+
+    Persisted jobs only record a handler name and plain arguments such as a Discord ID,
+    so they survive restarts; the live objects are looked up when the job runs.
+
+    Args:
+        handler_name: The name the handler was registered under.
+        args: The plain arguments stored with the job.
+        namespace: The namespace of the Scheduler that owns the job.
+    """
+    scheduler = _active_schedulers.get(namespace)
+    if scheduler is None:
+        print(f"No scheduler is active to run the '{handler_name}' job in namespace '{namespace}'.")
+        return
+    await scheduler.run_handler(handler_name, *args)
 
 class Scheduler:
     """Scheduler class to manage timed jobs for sending status requests.
 
+    Members are grouped into time zone buckets. Each bucket has one weekday and one
+    weekend trigger (plus the matching pre-warm triggers and a weekly rollover at its
+    local Monday midnight) that fan out to all of the bucket's members, so the number of jobs grows with the number of distinct time
+    zones rather than with headcount. Adding a member to an existing time zone does
+    not touch any job.
+
+    When a bucket's trigger fires, its members are not all contacted at once. Each member
+    is dispatched at a fixed offset into dispatch_window_seconds derived from a hash of
+    their Discord ID, so everyone keeps a stable, predictable time, and at most
+    max_in_flight dispatches are running at the same time. Each member's dispatch is a
+    one-shot job in the job store, so dispatches still waiting for their offset survive
+    a restart and are caught up like any other job.
+
+    Every job run and every member dispatch is recorded in the telemetry with its lag
+    behind the scheduled time, its duration and its outcome.
+
+    Each team has its own Scheduler. A non-empty namespace prefixes the IDs of its jobs
+    with '<namespace>|', so several schedulers can share one job table.
+
+    Jobs have deterministic IDs and are kept in the given job store. On startup the
+    scheduler starts paused, the desired jobs are reconciled against the stored ones,
+    and only then is it resumed, so runs missed while the bot was down are caught up
+    within misfire_grace_time and coalesced into a single run.
+
     Attributes:
         scheduler: The APScheduler object.
-        job_ids: A dictionary to store lists of job IDs for each member.
+        bucket_job_ids: A dictionary to store lists of job IDs for each time zone bucket.
+        job_time_zones: Reverse index from a bucket job's ID to its time zone.
+        buckets: The Discord IDs of the scheduled members in each time zone.
+        member_time_zones: The time zone bucket each member is currently scheduled in.
+        members: The scheduled TeamMember objects indexed by Discord ID.
+        handlers: The coroutine functions jobs are dispatched to, indexed by name.
+        prewarm_func: Optional function run ahead of each status request to prepare the report.
+        prewarm_lead_minutes: How many minutes before the status request the pre-warm job runs.
+        dispatch_window_seconds: The window over which a bucket's members are spread.
+        max_in_flight: Maximum number of member dispatches running at the same time.
+        dispatch_slot_timeout: Seconds a dispatch holds its in-flight slot at most, so long
+            status conversations do not hold up the rest of the bucket.
+        telemetry: The SchedulerTelemetry runs are recorded in.
+        namespace: The prefix of the scheduler's job IDs, '' for none.
+        weekday_hour: The local hour of the status requests on weekdays.
+        weekend_hour: The local hour of the status requests on weekends.
+        member_filter: Optional function telling whether a member's status requests and
+            pre-warms are dispatched by this scheduler, e.g. to partition members over workers.
     """
-    
-    def __init__(self) -> None:
-        """Initialize the Scheduler object and start the APScheduler."""
-        self.scheduler: AsyncIOScheduler = AsyncIOScheduler()
-        self.job_ids: Dict[int, List[str]] = {}  # Store job IDs indexed by member's Discord ID
-        self.weekly_post_job_id = None  # To store the ID of the scheduled weekly post job
-        self.scheduler.start()
+
+    def __init__(self, prewarm_func: Optional[callable] = None, prewarm_lead_minutes: int = 0,
+                 job_store: Optional[BaseJobStore] = None, misfire_grace_time: int = 3600,
+                 dispatch_window_seconds: int = 0, max_in_flight: int = 0, dispatch_slot_timeout: float = 60,
+                 telemetry: Optional[SchedulerTelemetry] = None, namespace: str = '',
+                 weekday_hour: int = 10, weekend_hour: int = 11,
+                 member_filter: Optional[Callable[[int], bool]] = None) -> None:
+        """Initialize the Scheduler object and start the APScheduler paused.
+
+        Call finish_reconciliation() once all jobs have been added to start running them.
+
+        Args:
+            prewarm_func: Optional function called with the member ahead of each status request.
+            prewarm_lead_minutes: How many minutes before the status request to run prewarm_func.
+            job_store: Job store used to persist jobs. Defaults to APScheduler's in-memory store.
+            misfire_grace_time: Seconds after its scheduled time a missed run is still executed.
+            dispatch_window_seconds: The window over which a bucket's members are spread (0 disables).
+            max_in_flight: Maximum number of member dispatches running at the same time (0 is unlimited).
+            dispatch_slot_timeout: Seconds a dispatch holds its in-flight slot at most.
+            telemetry: The SchedulerTelemetry to record runs in. A new one is created if omitted.
+            namespace: The prefix of the scheduler's job IDs. Its job store must only hold that namespace's jobs.
+            weekday_hour: The local hour of the status requests on weekdays.
+            weekend_hour: The local hour of the status requests on weekends.
+            member_filter: Optional function called with a Discord ID; members for which it returns
+                False are kept in their buckets but not dispatched to.
+        """
+        job_defaults = {
+            'misfire_grace_time': misfire_grace_time,
+            'coalesce': True,  # Run a job once even if several runs were missed
+            'max_instances': 1
+        }
+        jobstores = {'default': job_store} if job_store else {}
+        self.scheduler: AsyncIOScheduler = AsyncIOScheduler(jobstores=jobstores, job_defaults=job_defaults)
+        self.bucket_job_ids: Dict[str, List[str]] = {}  # Store job IDs indexed by time zone
+        self.job_time_zones: Dict[str, str] = {}
+        self.buckets: Dict[str, Set[int]] = {}
+        self.member_time_zones: Dict[int, str] = {}
+        self.members: Dict[int, TeamMember] = {}
+        self.handlers: Dict[str, callable] = {}
+        self.prewarm_func = prewarm_func
+        self.prewarm_lead_minutes = prewarm_lead_minutes
+        self.dispatch_window_seconds = max(0, dispatch_window_seconds)
+        self.max_in_flight = max_in_flight
+        self.dispatch_slot_timeout = dispatch_slot_timeout
+        self._in_flight: Optional[asyncio.Semaphore] = None
+        self.telemetry = telemetry or SchedulerTelemetry()
+        self._job_starts: Dict[Tuple[str, datetime], datetime] = {}
+        self._ensured_job_ids: Set[str] = set()
+        self._reconciling = True
+        self.namespace = namespace
+        self.weekday_hour = weekday_hour
+        self.weekend_hour = weekend_hour
+        self.member_filter = member_filter
+        _active_schedulers[namespace] = self
+        self.scheduler.add_listener(self._on_job_submitted, EVENT_JOB_SUBMITTED)
+        self.scheduler.add_listener(self._on_job_finished, EVENT_JOB_EXECUTED | EVENT_JOB_ERROR | EVENT_JOB_MISSED)
+        self.scheduler.start(paused=True)
+
+    def shutdown(self) -> None:
+        """Stop the scheduler without running its jobs, e.g. when its team failed to start."""
+        if _active_schedulers.get(self.namespace) is self:
+            del _active_schedulers[self.namespace]
+        self.scheduler.shutdown(wait=False)
+
+    def is_running(self) -> bool:
+        """Return whether the scheduler finished its reconciliation and is dispatching jobs."""
+        return self.scheduler.state == STATE_RUNNING
+
+    def _job_id(self, name: str) -> str:
+        """Return the ID of a job in the scheduler's namespace."""
+        return f"{self.namespace}|{name}" if self.namespace else name
+
+    def _job_labels(self, job_id: str) -> Tuple[str, Optional[str]]:
+        """Return the job type and time zone used to group a job's telemetry."""
+        job_type, _, rest = job_id.split('|', 1)[-1].partition(':')
+        if self._is_dispatch(job_type):
+            # Member dispatch jobs are named '<name>_dispatch:<time zone>:<Discord ID>'
+            return job_type, rest.rsplit(':', 1)[0]
+        return job_type, self.job_time_zones.get(job_id)
+
+    @staticmethod
+    def _is_dispatch(job_type: str) -> bool:
+        """Return whether a job type is a one-shot member dispatch."""
+        return job_type.endswith('_dispatch')
+
+    def _on_job_submitted(self, event) -> None:
+        """Remember when each scheduled run actually started."""
+        # Member dispatches record their own runs, measured against their offset
+        if self._is_dispatch(self._job_labels(event.job_id)[0]):
+            return
+        now = datetime.now(pytz.utc)
+        for run_time in event.scheduled_run_times:
+            self._job_starts[(event.job_id, run_time)] = now
+
+    def _on_job_finished(self, event) -> None:
+        """Record the lag, duration and outcome of a finished or missed run."""
+        now = datetime.now(pytz.utc)
+        job_type, time_zone = self._job_labels(event.job_id)
+        started = self._job_starts.pop((event.job_id, event.scheduled_run_time), None)
+        if self._is_dispatch(job_type) and event.code != EVENT_JOB_MISSED:
+            return
+
+        if event.code == EVENT_JOB_MISSED or started is None:
+            self.telemetry.record(job_type, time_zone, (now - event.scheduled_run_time).total_seconds(), None, 'missed')
+            return
+
+        outcome = 'error' if event.code == EVENT_JOB_ERROR else 'ok'
+        lag = (started - event.scheduled_run_time).total_seconds()
+        self.telemetry.record(job_type, time_zone, lag, (now - started).total_seconds(), outcome)
+
+    def finish_reconciliation(self) -> None:
+        """Remove stored jobs that were not re-added since startup and resume the scheduler.
+
+        Pending member dispatches are kept, so the ones interrupted by a restart still run.
+        """
+        for job in self.scheduler.get_jobs():
+            if job.id not in self._ensured_job_ids and not self._is_dispatch(self._job_labels(job.id)[0]):
+                print(f"Removing stale scheduled job {job.id}")
+                self.scheduler.remove_job(job.id)
+        self._ensured_job_ids.clear()
+        self._reconciling = False
+        self.scheduler.resume()
+
+    async def run_handler(self, handler_name: str, *args) -> None:
+        """Run the handler registered under handler_name with the job's arguments."""
+        handler = self.handlers.get(handler_name)
+        if handler is None:
+            print(f"No handler registered for scheduled job '{handler_name}'.")
+            return
+        await handler(*args)
+
+    def dispatch_offset(self, discord_id: int) -> int:
+        """Return the member's fixed offset in seconds into the dispatch window.
+
+        The offset is derived from a hash of the Discord ID, so it does not change across
+        restarts or when other members join or leave the bucket.
+        """
+        if self.dispatch_window_seconds == 0:
+            return 0
+        digest = hashlib.sha256(str(discord_id).encode()).digest()
+        return int.from_bytes(digest[:8], 'big') % self.dispatch_window_seconds
+
+    def _bucket_handler(self, name: str, func: callable, *extra_args) -> callable:
+        """Wrap func so it can be called with a time zone and runs for every member of that bucket.
+
+        Each member's call is scheduled as its own one-shot job at the member's dispatch offset,
+        registered as the '<name>_dispatch' handler, so a long status conversation does not hold
+        up the rest of the bucket or the next trigger, and a restart does not drop the calls
+        still waiting for their offset.
+        """
+        async def dispatch_handler(discord_id: int, time_zone: str, triggered: datetime):
+            await self._dispatch(name, func, discord_id, extra_args, time_zone, triggered)
+        self.handlers[f"{name}_dispatch"] = dispatch_handler
+
+        async def handler(time_zone: str):
+            triggered = datetime.now(pytz.utc)
+            kwargs = {'namespace': self.namespace} if self.namespace else {}
+            for discord_id in list(self.buckets.get(time_zone, ())):
+                if self.member_filter and not self.member_filter(discord_id):
+                    continue
+                run_date = triggered + timedelta(seconds=self.dispatch_offset(discord_id))
+                self.scheduler.add_job(run_scheduled_job, DateTrigger(run_date), args=[f"{name}_dispatch", discord_id, time_zone, triggered],
+                                       kwargs=kwargs, id=self._job_id(f"{name}_dispatch:{time_zone}:{discord_id}"), replace_existing=True)
+        return handler
+
+    def _bucket_batch_handler(self, func: callable, *extra_args) -> callable:
+        """Wrap func so it can be called with a time zone and runs once with all members of that bucket."""
+        async def handler(time_zone: str):
+            members = [self.members[discord_id] for discord_id in self.buckets.get(time_zone, ()) if discord_id in self.members]
+            if members:
+                await func(members, *extra_args)
+        return handler
+
+    async def _dispatch(self, name: str, func: callable, discord_id: int, extra_args: tuple,
+                        time_zone: str, triggered: datetime) -> None:
+        """Wait for a free in-flight slot, then call func; run by the member's dispatch job at their offset.
+
+        The run is recorded in the telemetry as '<name>_dispatch', with its lag measured
+        against the trigger time plus the member's offset.
+        """
+        offset = self.dispatch_offset(discord_id)
+
+        # The member may have been removed while waiting
+        member = self.members.get(discord_id)
+        if member is None:
+            return
+
+        task = None
+        started = None
+        outcome = 'ok'
+        try:
+            if self.max_in_flight <= 0:
+                started = datetime.now(pytz.utc)
+                await func(member, *extra_args)
+                return
+
+            if self._in_flight is None:
+                self._in_flight = asyncio.Semaphore(self.max_in_flight)
+            async with self._in_flight:
+                started = datetime.now(pytz.utc)
+                task = asyncio.ensure_future(func(member, *extra_args))
+                # Release the slot once the call is done or has had dispatch_slot_timeout to do its burst of work
+                await asyncio.wait({task}, timeout=self.dispatch_slot_timeout)
+            await task
+        except Exception as e:
+            outcome = 'error'
+            print(f"Scheduled '{name}' run for {member.name} failed: {e}")
+        finally:
+            if started is not None:
+                lag = (started - triggered).total_seconds() - offset
+                duration = (datetime.now(pytz.utc) - started).total_seconds()
+                self.telemetry.record(f"{name}_dispatch", time_zone, lag, duration, outcome)
+
+    def _ensure_job(self, job_id: str, trigger: CronTrigger, args: list) -> None:
+        """Add a job, keeping an existing one if it already has the same trigger and arguments.
+
+        Keeping the existing job preserves its next run time, so a run missed while the
+        bot was down is still caught up.
+        """
+        if self._reconciling:
+            self._ensured_job_ids.add(job_id)
+        kwargs = {'namespace': self.namespace} if self.namespace else {}
+        existing = self.scheduler.get_job(job_id)
+        if (existing and repr(existing.trigger) == repr(trigger) and list(existing.args) == list(args)
+                and dict(existing.kwargs) == kwargs):
+            return
+        self.scheduler.add_job(run_scheduled_job, trigger, args=args, kwargs=kwargs, id=job_id, replace_existing=True)
+
+    def _prewarm_time(self, hour: int) -> Tuple[int, int]:
+        """Return the (hour, minute) at which to pre-warm a job scheduled at the given hour."""
+        minutes = max(0, hour * 60 - self.prewarm_lead_minutes)
+        return divmod(minutes, 60)
 
     def add_job(self, func: callable, member: TeamMember, weekly_post_manager: WeeklyPostManager, streaks_manager: StreaksManager, updates_manager: UpdatesManager) -> None:
-        """Add a new job to the scheduler for a specific team member.
-        
+        """Add a team member to their time zone bucket, creating the bucket's jobs if needed.
+
         Args:
             func: The function to call when the job is run.
             member: The TeamMember object for whom the job is added.
         """
-        time_zone = pytz.timezone(member.time_zone)
-        
-        weekday_trigger = CronTrigger(day_of_week='mon,tue,wed,thu,fri', hour=10, timezone=time_zone)
-        weekend_trigger = CronTrigger(day_of_week='sat,sun', hour=11, timezone=time_zone)
+        self.handlers['status_request'] = self._bucket_handler('status_request', func, weekly_post_manager, streaks_manager, updates_manager)
+        if self.prewarm_func and self.prewarm_lead_minutes > 0:
+            self.handlers['prewarm'] = self._bucket_handler('prewarm', self.prewarm_func)
+
+        self.members[member.discord_id] = member
+        self.member_time_zones[member.discord_id] = member.time_zone
+
+        bucket = self.buckets.setdefault(member.time_zone, set())
+        bucket.add(member.discord_id)
+        if member.time_zone not in self.bucket_job_ids:
+            self._add_bucket_jobs(member.time_zone)
+
+    def _add_bucket_jobs(self, time_zone_name: str) -> None:
+        """Create the status request and pre-warm jobs for a time zone bucket."""
+        time_zone = get_time_zone(time_zone_name)
+
+        weekday_trigger = CronTrigger(day_of_week='mon,tue,wed,thu,fri', hour=self.weekday_hour, timezone=time_zone)
+        weekend_trigger = CronTrigger(day_of_week='sat,sun', hour=self.weekend_hour, timezone=time_zone)
+
+        weekday_job_id = self._job_id(f"status_request:{time_zone_name}:weekday")
+        weekend_job_id = self._job_id(f"status_request:{time_zone_name}:weekend")
+        self._ensure_job(weekday_job_id, weekday_trigger, ['status_request', time_zone_name])
+        self._ensure_job(weekend_job_id, weekend_trigger, ['status_request', time_zone_name])
+
+        job_ids = [weekday_job_id, weekend_job_id]
+
+        # Prepare the technical reports ahead of each status request
+        if self.prewarm_func and self.prewarm_lead_minutes > 0:
+            weekday_hour, weekday_minute = self._prewarm_time(self.weekday_hour)
+            weekend_hour, weekend_minute = self._prewarm_time(self.weekend_hour)
+            weekday_prewarm_trigger = CronTrigger(day_of_week='mon,tue,wed,thu,fri', hour=weekday_hour, minute=weekday_minute, timezone=time_zone)
+            weekend_prewarm_trigger = CronTrigger(day_of_week='sat,sun', hour=weekend_hour, minute=weekend_minute, timezone=time_zone)
+
+            weekday_prewarm_job_id = self._job_id(f"prewarm:{time_zone_name}:weekday")
+            weekend_prewarm_job_id = self._job_id(f"prewarm:{time_zone_name}:weekend")
+            self._ensure_job(weekday_prewarm_job_id, weekday_prewarm_trigger, ['prewarm', time_zone_name])
+            self._ensure_job(weekend_prewarm_job_id, weekend_prewarm_trigger, ['prewarm', time_zone_name])
+
+            job_ids.extend([weekday_prewarm_job_id, weekend_prewarm_job_id])
 
-        weekday_job = self.scheduler.add_job(func, weekday_trigger, args=[member, weekly_post_manager, streaks_manager, updates_manager])
-        weekend_job = self.scheduler.add_job(func, weekend_trigger, args=[member, weekly_post_manager, streaks_manager, updates_manager])
+        # Start the new week for the bucket at its local Monday
+        if 'weekly_rollover' in self.handlers:
+            rollover_job_id = self._job_id(f"weekly_rollover:{time_zone_name}")
+            rollover_trigger = CronTrigger(day_of_week='mon', hour=0, minute=0, timezone=time_zone)
+            self._ensure_job(rollover_job_id, rollover_trigger, ['weekly_rollover', time_zone_name])
+            job_ids.append(rollover_job_id)
 
-        self.job_ids.setdefault(member.discord_id, []).extend([weekday_job.id, weekend_job.id])
+        self.bucket_job_ids[time_zone_name] = job_ids
+        for job_id in job_ids:
+            self.job_time_zones[job_id] = time_zone_name
+
+    def sync_member(self, func: callable, member: TeamMember, weekly_post_manager: WeeklyPostManager, streaks_manager: StreaksManager, updates_manager: UpdatesManager) -> bool:
+        """Bring a member's jobs in line with their current time zone.
+
+        The member only changes bucket when they are not scheduled yet or have moved to
+        another time zone; otherwise this is a no-op and in-flight triggers are kept.
+
+        Args:
+            func: The function to call when the job is run.
+            member: The TeamMember object whose jobs should be synced.
+
+        Returns:
+            True if the member's bucket was changed.
+        """
+        scheduled_time_zone = self.member_time_zones.get(member.discord_id)
+        if scheduled_time_zone == member.time_zone:
+            return False
+
+        if scheduled_time_zone is not None:
+            self.remove_job(member.discord_id)
+        self.add_job(func, member, weekly_post_manager, streaks_manager, updates_manager)
+        return True
 
     def remove_job(self, discord_id: int) -> None:
-        """Remove jobs for a specific team member.
-        
+        """Remove a team member from their time zone bucket, removing the bucket's jobs if it is now empty.
+
         Args:
             discord_id: The Discord ID of the member for whom the job should be removed.
         """
-        job_ids = self.job_ids.get(discord_id, [])
-        for job_id in job_ids:
+        self.members.pop(discord_id, None)
+        time_zone = self.member_time_zones.pop(discord_id, None)
+        if time_zone is None:
+            return
+
+        bucket = self.buckets.get(time_zone, set())
+        bucket.discard(discord_id)
+        if bucket:
+            return
+
+        # The bucket is empty, so its jobs are no longer needed
+        del self.buckets[time_zone]
+        for job_id in self.bucket_job_ids.pop(time_zone, []):
+            self.job_time_zones.pop(job_id, None)
             self.scheduler.remove_job(job_id)
 
-        if discord_id in self.job_ids:
-            del self.job_ids[discord_id]  # Remove the job IDs from the dictionary
+    def schedule_weekly_rollover(self, func: callable, weekly_post_manager: WeeklyPostManager, streaks_manager: StreaksManager, team_members: List[TeamMember]) -> None:
+        """Schedules the weekly rollover for every time zone bucket at its local Monday midnight.
 
-    def schedule_weekly_post(self, func: callable, weekly_post_manager: WeeklyPostManager, streaks_manager: StreaksManager, team_members: List[TeamMember]) -> None:
-        """Schedules the weekly post based on the latest time zone among the team members."""
-        
-        # Determine the latest time zone
-        latest_time_zone = max([member.time_zone for member in team_members], key=lambda tz: pytz.timezone(tz).utcoffset(datetime.utcnow()))
+        Each bucket resets its own members when their week starts, rather than the whole
+        team at once. Buckets created later get their rollover job automatically.
 
-        # Set the trigger for 9:10 AM in the earliest time zone on Monday
-        trigger = CronTrigger(day_of_week='mon', hour=9, minute=10, timezone=latest_time_zone)
+        Args:
+            func: The function called with the bucket's members when the job is run.
+            team_members: The team member list passed to the job. It must be the live list so
+                membership changes are visible without rescheduling.
+        """
+        self.handlers['weekly_rollover'] = self._bucket_batch_handler(func, weekly_post_manager, streaks_manager, team_members)
 
-        # Schedule the function with the trigger
-        job = self.scheduler.add_job(func, trigger, args=[weekly_post_manager, streaks_manager, team_members])
-        self.weekly_post_job_id = job.id
+        # Recreate the jobs of buckets that were added before the rollover was registered
+        for time_zone in list(self.buckets):
+            self._add_bucket_jobs(time_zone)
 
-    def unschedule_weekly_post(self) -> None:
-        """Removes the weekly post job from the scheduler."""
-        if self.weekly_post_job_id:
-            self.scheduler.remove_job(self.weekly_post_job_id)
-            self.weekly_post_job_id = None
+    def get_job_members(self, job_id: str) -> List[TeamMember]:
+        """Return the members a job runs for, using the job-to-time-zone index."""
+        time_zone = self.job_time_zones.get(job_id)
+        if time_zone is None:
+            return []
+        return [self.members[discord_id] for discord_id in self.buckets.get(time_zone, ()) if discord_id in self.members]
 
-    def get_all_scheduled_jobs(self, team_member_manager) -> List[str]:
-        """Retrieve all scheduled jobs as a list of strings."""
-        job_descriptions = []
+    def get_all_scheduled_jobs(self) -> List[List[str]]:
+        """Retrieve all scheduled jobs as table rows.
+
+        Returns:
+            One row per job: ID, time zone, members, next run time and remaining time.
+        """
+        rows = []
 
         for job in self.scheduler.get_jobs():
-            # Determine the associated team member by looking up the job ID in the job_ids dictionary
-            member_discord_id = next((discord_id for discord_id, job_ids in self.job_ids.items() if job.id in job_ids), None)
-            member_name = team_member_manager.find_member(member_discord_id).name if member_discord_id else "Unknown"
-
-            # Calculate the remaining time until the next run
-            now = datetime.now(job.next_run_time.tzinfo)  # Get the current time with the same timezone as the job's next_run_time
-            remaining_time = job.next_run_time - now
-            remaining_time_str = str(remaining_time).split('.')[0]  # Remove the microseconds part
-
-            # If this job is the weekly post job
-            if job.id == self.weekly_post_job_id:
-                job_descriptions.append(f"ID: {job.id}, Type: Weekly Post, Next Run: {job.next_run_time}, Remaining Time: {remaining_time_str}, Func: {job.func.__name__}")
+            if job.next_run_time is None:
+                next_run, remaining_time_str = 'paused', '-'
             else:
-                job_descriptions.append(f"ID: {job.id}, Member: {member_name}, Next Run: {job.next_run_time}, Remaining Time: {remaining_time_str}, Func: {job.func.__name__}")
+                # Calculate the remaining time until the next run
+                now = datetime.now(job.next_run_time.tzinfo)  # Get the current time with the same timezone as the job's next_run_time
+                remaining_time_str = str(job.next_run_time - now).split('.')[0]  # Remove the microseconds part
+                next_run = job.next_run_time.strftime('%Y-%m-%d %H:%M %Z')
+
+            time_zone = self.job_time_zones.get(job.id, '?')
+            member_names = ', '.join(sorted(member.name for member in self.get_job_members(job.id))) or 'None'
+
+            rows.append([job.id, time_zone, member_names, next_run, remaining_time_str])
 
-        return job_descriptions
+        return rows
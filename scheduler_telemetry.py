@@ -0,0 +1,89 @@
+from collections import Counter, deque
+from typing import Dict, Optional
+from latency_histogram import LatencyHistogram
+
+class SchedulerTelemetry:
+    """Keeps rolling lag and duration statistics for scheduled runs.
+
+    Every run is recorded with how late it started relative to its scheduled time, how
+    long it took and its outcome. Samples are kept in a rolling window per job type and
+    per job type within each time zone, and summarized as percentiles. Job types are
+    never mixed, since a bucket job takes milliseconds while a member dispatch lasts as
+    long as the member's conversation.
+
+    Attributes:
+        window: Number of recent runs kept per job type and per job type within each time zone.
+    """
+
+    PERCENTILES = (50, 95, 99)
+
+    def __init__(self, window: int = 500) -> None:
+        """Initialize the SchedulerTelemetry.
+
+        Args:
+            window: Number of recent runs kept per job type and per job type within each time zone.
+        """
+        self.window = window
+        self._samples: Dict[str, Dict[str, deque]] = {'job_type': {}, 'time_zone': {}}
+        self._outcomes: Dict[str, Dict[str, Counter]] = {'job_type': {}, 'time_zone': {}}
+        # Lag and duration histograms since startup, per job type
+        self._histograms: Dict[str, Dict[str, LatencyHistogram]] = {}
+
+    def record(self, job_type: str, time_zone: Optional[str], lag: float, duration: Optional[float], outcome: str) -> None:
+        """Record a single run.
+
+        Args:
+            job_type: The kind of run, e.g. 'status_request' or 'weekly_post'.
+            time_zone: The time zone the run was scheduled in, if any.
+            lag: Seconds between the scheduled and the actual start time.
+            duration: Seconds the run took, or None if it never ran.
+            outcome: 'ok', 'error' or 'missed'.
+        """
+        for group, key in (('job_type', job_type), ('time_zone', f"{time_zone or 'n/a'} {job_type}")):
+            samples = self._samples[group].setdefault(key, deque(maxlen=self.window))
+            samples.append((lag, duration))
+            self._outcomes[group].setdefault(key, Counter())[outcome] += 1
+
+        histograms = self._histograms.setdefault(job_type, {'lag': LatencyHistogram(), 'duration': LatencyHistogram()})
+        histograms['lag'].observe(max(lag, 0))
+        if duration is not None:
+            histograms['duration'].observe(duration)
+
+    @staticmethod
+    def _percentile(values: list, percentile: float) -> Optional[float]:
+        """Return the given percentile (0-100) of the values, or None if there are none."""
+        if not values:
+            return None
+        ordered = sorted(values)
+        index = min(len(ordered) - 1, int(len(ordered) * percentile / 100))
+        return round(ordered[index], 3)
+
+    def _stats(self, samples: deque, outcomes: Counter) -> dict:
+        """Summarize one rolling window of samples."""
+        lags = [lag for lag, _ in samples]
+        durations = [duration for _, duration in samples if duration is not None]
+        stats = {'runs': sum(outcomes.values()), 'outcomes': dict(outcomes)}
+        for percentile in self.PERCENTILES:
+            stats[f'lag_p{percentile}'] = self._percentile(lags, percentile)
+            stats[f'duration_p{percentile}'] = self._percentile(durations, percentile)
+        return stats
+
+    def summary(self) -> dict:
+        """Return the statistics per job type and per time zone.
+
+        Returns:
+            A dictionary with 'job_type' and 'time_zone' sections, each mapping a key to its
+            run count, outcome counts and lag and duration percentiles in seconds. The keys
+            of the 'time_zone' section are '<time zone> <job type>'.
+        """
+        return {
+            group: {key: self._stats(samples, self._outcomes[group][key]) for key, samples in sorted(keys.items())}
+            for group, keys in self._samples.items()
+        }
+
+    def histograms(self) -> dict:
+        """Return the lag and duration histograms of every run since startup, per job type."""
+        return {
+            job_type: {name: histogram.snapshot() for name, histogram in histograms.items()}
+            for job_type, histograms in sorted(self._histograms.items())
+        }
@@ -0,0 +1,109 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Deque, Dict, List, Optional, Tuple
+
+# The trace of the status conversation running in the current task, if any
+_current_trace: ContextVar[Optional['Trace']] = ContextVar('current_trace', default=None)
+
+class Trace:
+    """Stage timings of one run of a member's status conversation.
+
+    Attributes:
+        discord_id: The Discord ID of the member.
+        kind: What started the run, e.g. 'request' or 'resume'.
+        started_at: When the run started, in UTC.
+        spans: The (stage, seconds) of every timed step, in the order they ended.
+        outcome: The stage the run ended in, once it ended.
+    """
+
+    def __init__(self, discord_id: int, kind: str) -> None:
+        """Initialize the Trace.
+
+        Args:
+            discord_id: The Discord ID of the member.
+            kind: What started the run, e.g. 'request' or 'resume'.
+        """
+        self.discord_id = discord_id
+        self.kind = kind
+        self.started_at = datetime.utcnow()
+        self.spans: List[Tuple[str, float]] = []
+        self.outcome: Optional[str] = None
+        self._token = None
+
+    def add(self, stage: str, seconds: float) -> None:
+        """Record a timed step."""
+        self.spans.append((stage, seconds))
+
+    def track(self, stage: str, future: asyncio.Future) -> None:
+        """Record the seconds a background operation resolves with, e.g. a debounced rebuild, once it completes."""
+        future.add_done_callback(lambda done: None if done.cancelled() else self.add(stage, done.result()))
+
+    def stage_totals(self) -> Dict[str, float]:
+        """Return the total seconds per stage, in the order the stages first ended."""
+        totals: Dict[str, float] = {}
+        for stage, seconds in self.spans:
+            totals[stage] = totals.get(stage, 0.0) + seconds
+        return totals
+
+    def total(self) -> float:
+        """Return the seconds spent in timed steps; time waiting for the member is not timed."""
+        return sum(seconds for _, seconds in self.spans)
+
+class StageTracer:
+    """Keeps the stage timings of recent status conversations in a ring buffer.
+
+    A trace is started for each run and made current for the task running it, so the
+    stages time themselves with span() without the trace being passed around. Outside a
+    traced run span() does nothing, e.g. while pre-warming a report.
+
+    Attributes:
+        traces: The most recent traces, oldest first.
+    """
+
+    def __init__(self, capacity: int = 200) -> None:
+        """Initialize the StageTracer.
+
+        Args:
+            capacity: Number of recent traces kept.
+        """
+        self.traces: Deque[Trace] = deque(maxlen=capacity)
+
+    def start(self, discord_id: int, kind: str) -> Trace:
+        """Start a trace and make it current for the running task."""
+        trace = Trace(discord_id, kind)
+        trace._token = _current_trace.set(trace)
+        self.traces.append(trace)
+        return trace
+
+    def finish(self, trace: Trace, outcome: str) -> None:
+        """Record the stage a run ended in and stop timing its task's spans."""
+        trace.outcome = outcome
+        if trace._token is not None:
+            _current_trace.reset(trace._token)
+            trace._token = None
+
+    @staticmethod
+    def current() -> Optional[Trace]:
+        """Return the trace of the running task, if any."""
+        return _current_trace.get()
+
+    @staticmethod
+    @contextmanager
+    def span(stage: str):
+        """Time the enclosed step as a stage of the current trace."""
+        trace = _current_trace.get()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            if trace is not None:
+                trace.add(stage, time.perf_counter() - started)
+
+    def slowest(self, limit: int = 10) -> List[Trace]:
+        """Return the finished traces with the most timed seconds, slowest first."""
+        finished = [trace for trace in self.traces if trace.outcome is not None]
+        return sorted(finished, key=lambda trace: trace.total(), reverse=True)[:limit]
@@ -0,0 +1,93 @@
+import json
+from typing import Optional
+
+class StatusSession:
+    """StatusSession class to store the progress of one member's status conversation.
+
+    The conversation is a state machine. Each stage waits for one answer from the member
+    and then moves to the next stage; the session is persisted after every step so it can
+    be resumed after a restart.
+
+    Attributes:
+        discord_id: The Discord ID of the member the conversation is with.
+        stage: The stage the conversation is in.
+        summarized_report: The draft technical report.
+        raw_updates: The member's raw answers collected so far.
+        non_technical_update: The summarized non-technical update.
+        goals_for_today: The summarized goals for the day.
+        prompt_message_id: The ID of the DM the current stage is waiting on, if it was sent.
+        missed_stage: The stage the conversation expired in, once it was missed.
+        recorded_streak: The streak the check-in is recorded with, once the record stage started.
+        inserted_update_id: The ID of the update the check-in was stored as, once it was inserted.
+        age_seconds: Seconds since the session was last persisted, when loaded from the database.
+    """
+
+    # Stages of the conversation, in order
+    REPORT = 'report'                      # Build the technical report from the member's commits
+    REVIEW = 'review'                      # Wait for the member to confirm, revise or replace the report
+    FEEDBACK = 'feedback'                  # Wait for what the member wants changed in the report
+    DIRECT_REPORT = 'direct_report'        # Wait for the member's own technical report
+    NON_TECHNICAL = 'non_technical'        # Wait for the non-technical updates
+    GOALS = 'goals'                        # Wait for the goals for the day
+    RECORD = 'record'                      # Store the check-in and update the streak
+    PUBLISH = 'publish'                    # Post the update to the channel and send feedback
+    DONE = 'done'
+    MISSED = 'missed'                      # The member did not answer in time
+
+    # Stages that wait for an answer from the member
+    WAITING_STAGES = (REVIEW, FEEDBACK, DIRECT_REPORT, NON_TECHNICAL, GOALS)
+
+    def __init__(self, discord_id: int, stage: str = REPORT, summarized_report: str = "", raw_updates: str = "",
+                 non_technical_update: str = "", goals_for_today: str = "", prompt_message_id: Optional[int] = None,
+                 missed_stage: Optional[str] = None, recorded_streak: Optional[int] = None,
+                 inserted_update_id: Optional[int] = None) -> None:
+        """Initialize a new StatusSession object.
+
+        Args:
+            discord_id: The Discord ID of the member the conversation is with.
+            stage: The stage the conversation is in. Defaults to REPORT.
+            summarized_report: The draft technical report.
+            raw_updates: The member's raw answers collected so far.
+            non_technical_update: The summarized non-technical update.
+            goals_for_today: The summarized goals for the day.
+            prompt_message_id: The ID of the DM the current stage is waiting on, if it was sent.
+            missed_stage: The stage the conversation expired in, once it was missed.
+            recorded_streak: The streak the check-in is recorded with, once the record stage started.
+            inserted_update_id: The ID of the update the check-in was stored as, once it was inserted.
+        """
+        self.discord_id: int = discord_id
+        self.stage: str = stage
+        self.summarized_report: str = summarized_report
+        self.raw_updates: str = raw_updates
+        self.non_technical_update: str = non_technical_update
+        self.goals_for_today: str = goals_for_today
+        self.prompt_message_id: Optional[int] = prompt_message_id
+        self.missed_stage: Optional[str] = missed_stage
+        self.recorded_streak: Optional[int] = recorded_streak
+        self.inserted_update_id: Optional[int] = inserted_update_id
+        self.age_seconds: Optional[int] = None
+
+    def to_json(self) -> str:
+        """Serialize the drafts and message IDs of the session."""
+        return json.dumps({
+            'summarized_report': self.summarized_report,
+            'raw_updates': self.raw_updates,
+            'non_technical_update': self.non_technical_update,
+            'goals_for_today': self.goals_for_today,
+            'prompt_message_id': self.prompt_message_id,
+            'missed_stage': self.missed_stage,
+            'recorded_streak': self.recorded_streak,
+            'inserted_update_id': self.inserted_update_id,
+        })
+
+    @classmethod
+    def from_row(cls, row: dict) -> 'StatusSession':
+        """Create a StatusSession from a 'status_sessions' row.
+
+        Args:
+            row: A dictionary with the discord_id, stage and JSON state of the session.
+        """
+        state = json.loads(row['state']) if row.get('state') else {}
+        session = cls(row['discord_id'], row['stage'], **state)
+        session.age_seconds = row.get('age_seconds')
+        return session
@@ -0,0 +1,121 @@
+from typing import List, Optional
+from status_sessions.status_sessions_db import StatusSessionsDB
+from status_sessions.status_session import StatusSession
+
+class StatusSessionManager:
+    """
+    Manages the persisted state of members' in-progress status conversations.
+    """
+
+    def __init__(self, status_sessions_db: StatusSessionsDB):
+        """
+        Initializes a new StatusSessionManager instance.
+
+        Args:
+            status_sessions_db: The StatusSessionsDB object that handles database operations.
+        """
+        self.status_sessions_db = status_sessions_db
+
+    def start_session(self, discord_id: int) -> StatusSession:
+        """
+        Starts a new conversation for a member, replacing any unfinished one.
+
+        Args:
+            discord_id: The Discord ID of the member.
+
+        Returns:
+            The new StatusSession.
+        """
+        session = StatusSession(discord_id)
+        self.status_sessions_db.save_session(discord_id, session.stage, session.to_json(), new_session=True)
+        return session
+
+    def get_session(self, discord_id: int) -> Optional[StatusSession]:
+        """
+        Fetches a member's unfinished conversation.
+
+        Args:
+            discord_id: The Discord ID of the member.
+
+        Returns:
+            The StatusSession, or None if the member has no unfinished conversation.
+        """
+        row = self.status_sessions_db.get_session(discord_id)
+        return StatusSession.from_row(row) if row else None
+
+    def get_all_sessions(self) -> List[StatusSession]:
+        """
+        Fetches every unfinished conversation, e.g. to resume them on startup.
+
+        Returns:
+            A list of StatusSession objects.
+        """
+        return [StatusSession.from_row(row) for row in self.status_sessions_db.get_all_sessions()]
+
+    def get_unfinished_sessions(self) -> List[StatusSession]:
+        """
+        Fetches the conversations that can still be resumed, skipping missed ones.
+
+        Returns:
+            A list of StatusSession objects.
+        """
+        return [session for session in self.get_all_sessions() if session.stage != StatusSession.MISSED]
+
+    def get_stale_sessions(self, min_age_seconds: int) -> List[StatusSession]:
+        """
+        Fetches the unfinished conversations that have not progressed for at least min_age_seconds.
+
+        Args:
+            min_age_seconds: The minimum number of seconds since the conversation last progressed.
+
+        Returns:
+            A list of StatusSession objects with their age_seconds set.
+        """
+        return [StatusSession.from_row(row) for row in self.status_sessions_db.get_stale_sessions(min_age_seconds)]
+
+    def mark_missed(self, session: StatusSession):
+        """
+        Records a conversation the member did not finish in time as missed.
+
+        The row is kept with the stage it expired in until the member's next status request replaces it.
+
+        Args:
+            session: The StatusSession that expired.
+        """
+        session.missed_stage = session.stage
+        session.stage = StatusSession.MISSED
+        self.save(session)
+
+    def advance(self, session: StatusSession, stage: str, prompt_message_id: Optional[int] = None):
+        """
+        Moves a conversation to a new stage and persists it.
+
+        Args:
+            session: The StatusSession to update.
+            stage: The stage the conversation moves to.
+            prompt_message_id: The ID of the DM the new stage waits on, if it was already sent.
+        """
+        session.stage = stage
+        session.prompt_message_id = prompt_message_id
+        self.save(session)
+
+    def save(self, session: StatusSession):
+        """
+        Persists a conversation, or deletes it once it is done.
+
+        Args:
+            session: The StatusSession to persist.
+        """
+        if session.stage == StatusSession.DONE:
+            self.status_sessions_db.delete_session(session.discord_id)
+        else:
+            self.status_sessions_db.save_session(session.discord_id, session.stage, session.to_json())
+
+    def end_session(self, discord_id: int):
+        """
+        Drops a member's conversation, e.g. when it can not be resumed.
+
+        Args:
+            discord_id: The Discord ID of the member.
+        """
+        self.status_sessions_db.delete_session(discord_id)
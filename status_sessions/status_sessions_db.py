@@ -0,0 +1,146 @@
+from typing import Optional, Dict, List
+from base_db import BaseDB
+
+class StatusSessionsDB(BaseDB):
+    """
+    Database class that handles operations related to the 'status_sessions' table.
+    """
+
+    def __init__(self, host: str, user: str, password: str, database: str, port: str):
+        """
+        Initializes the StatusSessionsDB class and creates the 'status_sessions' table if it doesn't exist.
+
+        :param host: The MySQL host address.
+        :param user: The MySQL user.
+        :param password: The MySQL password.
+        :param database: The MySQL database name.
+        :param port: The MySQL port number.
+        """
+        super().__init__(host, user, password, database, port)
+        self._create_status_sessions_table()
+
+    def _create_status_sessions_table(self):
+        """
+        Creates the 'status_sessions' table if it doesn't already exist.
+
+        Each row holds the in-progress status conversation of one member: the stage it is
+        in and the answers and message IDs collected so far, serialized as JSON.
+        """
+        query = '''
+            CREATE TABLE IF NOT EXISTS status_sessions (
+                discord_id BIGINT PRIMARY KEY,
+                stage VARCHAR(64) NOT NULL,
+                state TEXT NOT NULL,
+                started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+                FOREIGN KEY (discord_id) REFERENCES team_members(discord_id) ON DELETE CASCADE
+            );
+        '''
+        try:
+            self.execute_query(query)
+        finally:
+            self.close()
+
+    def get_session(self, discord_id: int) -> Optional[Dict]:
+        """
+        Fetches the in-progress session of a member.
+
+        :param discord_id: The Discord ID of the team member.
+        :return: A dictionary with the discord_id, stage, state, started_at and updated_at, or None if there is no session.
+        """
+        if not self.conn.is_connected():
+            print("Reconnecting to MySQL")
+            self.connect()
+
+        c = self.conn.cursor(dictionary=True)
+        query = "SELECT discord_id, stage, state, started_at, updated_at FROM status_sessions WHERE discord_id = %s"
+        try:
+            c.execute(query, (discord_id,))
+            return c.fetchone()
+        finally:
+            c.close()
+            self.close()
+
+    def get_all_sessions(self) -> List[Dict]:
+        """
+        Fetches all in-progress sessions.
+
+        :return: A list of dictionaries with the discord_id, stage, state, started_at and updated_at of each session.
+        """
+        if not self.conn.is_connected():
+            print("Reconnecting to MySQL")
+            self.connect()
+
+        c = self.conn.cursor(dictionary=True)
+        query = "SELECT discord_id, stage, state, started_at, updated_at FROM status_sessions"
+        try:
+            c.execute(query)
+            return c.fetchall()
+        finally:
+            c.close()
+            self.close()
+
+    def get_stale_sessions(self, min_age_seconds: int) -> List[Dict]:
+        """
+        Fetches the unfinished sessions that have not been updated for at least min_age_seconds.
+
+        The age is computed by MySQL so it does not depend on the bot's clock or time zone.
+
+        :param min_age_seconds: The minimum number of seconds since the session was last updated.
+        :return: A list of dictionaries with the discord_id, stage, state and age_seconds of each session.
+        """
+        if not self.conn.is_connected():
+            print("Reconnecting to MySQL")
+            self.connect()
+
+        c = self.conn.cursor(dictionary=True)
+        query = """
+            SELECT discord_id, stage, state, TIMESTAMPDIFF(SECOND, updated_at, NOW()) AS age_seconds
+            FROM status_sessions
+            WHERE stage != 'missed' AND updated_at <= NOW() - INTERVAL %s SECOND
+        """
+        try:
+            c.execute(query, (min_age_seconds,))
+            return c.fetchall()
+        finally:
+            c.close()
+            self.close()
+
+    def save_session(self, discord_id: int, stage: str, state: str, new_session: bool = False):
+        """
+        Inserts or updates the session of a member.
+
+        :param discord_id: The Discord ID of the team member.
+        :param stage: The stage the conversation is in.
+        :param state: The JSON-serialized answers and message IDs collected so far.
+        :param new_session: Whether this starts a new session, resetting its start time.
+        """
+        if new_session:
+            query = """
+                INSERT INTO status_sessions (discord_id, stage, state)
+                VALUES (%s, %s, %s)
+                ON DUPLICATE KEY UPDATE stage = %s, state = %s, started_at = CURRENT_TIMESTAMP
+            """
+        else:
+            query = """
+                INSERT INTO status_sessions (discord_id, stage, state)
+                VALUES (%s, %s, %s)
+                ON DUPLICATE KEY UPDATE stage = %s, state = %s
+            """
+        params = (discord_id, stage, state, stage, state)
+        try:
+            self.execute_query(query, params)
+        finally:
+            self.close()
+
+    def delete_session(self, discord_id: int):
+        """
+        Deletes the session of a member once the conversation has ended.
+
+        :param discord_id: The Discord ID of the team member.
+        """
+        query = "DELETE FROM status_sessions WHERE discord_id = %s"
+        try:
+            self.execute_query(query, (discord_id,))
+        finally:
+            self.close()
@@ -1,3 +1,4 @@
+from typing import Dict, List
 from base_db import BaseDB
 
 class StreaksDB(BaseDB):
@@ -53,6 +54,43 @@ class StreaksDB(BaseDB):
         finally:
             self.close()
 
+    def reset_streaks(self, discord_ids: List[int]):
+        """
+        Resets the streaks of several users to zero in a single query.
+
+        :param discord_ids: The Discord IDs of the users.
+        """
+        if not discord_ids:
+            return
+        placeholders = ', '.join(['%s'] * len(discord_ids))
+        query = f"UPDATE streaks SET current_streak = 0 WHERE discord_id IN ({placeholders})"
+        try:
+            self.execute_query(query, tuple(discord_ids))
+        finally:
+            self.close()
+
+    def get_streaks(self, discord_ids: List[int]) -> Dict[int, int]:
+        """
+        Fetches the current streaks of several users in a single query.
+
+        :param discord_ids: The Discord IDs of the users.
+        :return: A dictionary of streaks indexed by Discord ID; users without a streak are left out.
+        """
+        if not discord_ids:
+            return {}
+        if not self.conn.is_connected():
+            print("Reconnecting to MySQL")
+            self.connect()
+        c = self.conn.cursor()
+        placeholders = ', '.join(['%s'] * len(discord_ids))
+        query = f"SELECT discord_id, current_streak FROM streaks WHERE discord_id IN ({placeholders})"
+        try:
+            c.execute(query, tuple(discord_ids))
+            return {row[0]: row[1] for row in c.fetchall()}
+        finally:
+            c.close()
+            self.close()
+
     def get_streak(self, discord_id: int) -> int:
         """
         Fetches the current streak for a given user.
@@ -1,3 +1,4 @@
+from typing import Dict, List
 from streaks.streaks_db import StreaksDB
 
 class StreaksManager:
@@ -26,6 +27,18 @@ class StreaksManager:
         """
         return self.streaks_db.get_streak(discord_id)
 
+    def get_streaks(self, discord_ids: List[int]) -> Dict[int, int]:
+        """
+        Fetches the current streaks of several users at once.
+
+        Args:
+            discord_ids: The Discord IDs of the users.
+
+        Returns:
+            A dictionary of streaks indexed by Discord ID; users without a streak are left out.
+        """
+        return self.streaks_db.get_streaks(discord_ids)
+
     def update_streak(self, discord_id: int, new_streak: int):
         """
         Updates the streak for a given user.
@@ -43,4 +56,13 @@ class StreaksManager:
         Args:
             discord_id: The Discord ID of the user.
         """
-        self.streaks_db.update_streak(discord_id, 0)
\ No newline at end of file
+        self.streaks_db.update_streak(discord_id, 0)
+
+    def reset_streaks(self, discord_ids: List[int]):
+        """
+        Resets the streaks for several users to zero in one batched write.
+
+        Args:
+            discord_ids: The Discord IDs of the users.
+        """
+        self.streaks_db.reset_streaks(discord_ids)
\ No newline at end of file
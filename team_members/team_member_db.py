@@ -29,15 +29,18 @@ class TeamMemberDB(BaseDB):
                 name VARCHAR(255) NOT NULL,
                 time_zone VARCHAR(50) NOT NULL,
                 github_username VARCHAR(255),
-                on_vacation BOOLEAN DEFAULT FALSE
+                on_vacation BOOLEAN DEFAULT FALSE,
+                team VARCHAR(64) NOT NULL DEFAULT 'default'
             );
         '''
         try:
             self.execute_query(query)
+            # Tables created before the bot served several teams
+            self.add_column_if_missing('team_members', 'team', "VARCHAR(64) NOT NULL DEFAULT 'default'")
         finally:
             self.close()
 
-    def insert_new_member(self, discord_id: int, name: str, time_zone: str, github_username: str):
+    def insert_new_member(self, discord_id: int, name: str, time_zone: str, github_username: str, team: str = 'default'):
         """
         Inserts a new team member into the 'team_members' table.
 
@@ -45,13 +48,14 @@ class TeamMemberDB(BaseDB):
         :param name: The name of the team member.
         :param time_zone: The time zone of the team member.
         :param github_username: The GitHub username of the team member.
+        :param team: The name of the team the member belongs to.
         """
         query = """
-            INSERT INTO team_members (discord_id, name, time_zone, github_username)
-            VALUES (%s, %s, %s, %s)
-            ON DUPLICATE KEY UPDATE name = %s, time_zone = %s, github_username = %s
+            INSERT INTO team_members (discord_id, name, time_zone, github_username, team)
+            VALUES (%s, %s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE name = %s, time_zone = %s, github_username = %s, team = %s
         """
-        params = (discord_id, name, time_zone, github_username, name, time_zone, github_username)
+        params = (discord_id, name, time_zone, github_username, team, name, time_zone, github_username, team)
         try:
             self.execute_query(query, params)
         finally:
@@ -70,10 +74,11 @@ class TeamMemberDB(BaseDB):
         finally:
             self.close()
 
-    def list_all_members(self) -> List[Tuple[int, str, str, str, bool]]:
+    def list_all_members(self, team: str = 'default') -> List[Tuple[int, str, str, str, bool]]:
         """
-        Fetches all team members from the 'team_members' table.
+        Fetches all members of a team from the 'team_members' table.
 
+        :param team: The name of the team.
         :return: A list of tuples, each containing the Discord ID, name, time zone, GitHub username, and vacation status of a team member.
         """
         if not self.conn.is_connected():
@@ -81,7 +86,7 @@ class TeamMemberDB(BaseDB):
             self.connect()
         c = self.conn.cursor()
         try:
-            c.execute("SELECT discord_id, name, time_zone, github_username, on_vacation FROM team_members")
+            c.execute("SELECT discord_id, name, time_zone, github_username, on_vacation FROM team_members WHERE team = %s", (team,))
             return c.fetchall()
         finally:
             c.close()
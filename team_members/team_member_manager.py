@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Tuple
 from team_members.team_member import TeamMember
 from team_members.team_member_db import TeamMemberDB
 
@@ -7,13 +7,15 @@ class TeamMemberManager:
     Manages operations related to team members.
     """
 
-    def __init__(self, db: TeamMemberDB):
+    def __init__(self, db: TeamMemberDB, team: str = 'default'):
         """
         Initialize a TeamMemberManager object.
 
         :param db: TeamMemberDB object for interacting with the database.
+        :param team: The name of the team whose members are managed.
         """
         self.db = db
+        self.team = team
         self.team_members = self.load_team_members()
 
     def load_team_members(self) -> List[TeamMember]:
@@ -23,7 +25,7 @@ class TeamMemberManager:
         :return: List of TeamMember objects.
         """
         team_members = []
-        members_data = self.db.list_all_members()
+        members_data = self.db.list_all_members(self.team)
 
         for member_data in members_data:
             member = TeamMember(
@@ -37,6 +39,38 @@ class TeamMemberManager:
 
         return team_members
 
+    def refresh_members(self) -> Tuple[List[TeamMember], List[int]]:
+        """
+        Reload the team's members from the database, e.g. after another process changed them.
+
+        Known members are updated in place, so the objects and the list held by the scheduler
+        and the weekly post stay current.
+
+        :return: The members that were added and the Discord IDs of the members that were removed.
+        """
+        members_data = self.db.list_all_members(self.team)
+        current_members = {member.discord_id: member for member in self.team_members}
+
+        added_members = []
+        for discord_id, name, time_zone, github_username, on_vacation in members_data:
+            member = current_members.get(discord_id)
+            if member is None:
+                member = TeamMember(discord_id=discord_id, time_zone=time_zone, name=name,
+                                    github_username=github_username, on_vacation=on_vacation)
+                self.team_members.append(member)
+                added_members.append(member)
+            else:
+                member.name = name
+                member.time_zone = time_zone
+                member.github_username = github_username
+                member.on_vacation = on_vacation
+
+        loaded_ids = {member_data[0] for member_data in members_data}
+        removed_ids = [member.discord_id for member in self.team_members if member.discord_id not in loaded_ids]
+        if removed_ids:
+            self.team_members[:] = [member for member in self.team_members if member.discord_id in loaded_ids]
+        return added_members, removed_ids
+
     def find_member(self, discord_id: int) -> TeamMember:
         """
         Find and return a team member by their Discord ID.
@@ -59,7 +93,7 @@ class TeamMemberManager:
         :param github_username: The GitHub username of the new member.
         """
         new_member = TeamMember(discord_id, time_zone, name, github_username)
-        self.db.insert_new_member(discord_id, name, time_zone, github_username)
+        self.db.insert_new_member(discord_id, name, time_zone, github_username, self.team)
         self.team_members.append(new_member)
 
     def remove_member(self, discord_id: int):
@@ -69,7 +103,8 @@ class TeamMemberManager:
         :param discord_id: The Discord ID of the member to remove.
         """
         self.db.remove_member(discord_id)
-        self.team_members = [member for member in self.team_members if member.discord_id != discord_id]
+        # Update the list in place so scheduled jobs holding a reference to it stay current
+        self.team_members[:] = [member for member in self.team_members if member.discord_id != discord_id]
 
     def update_member_timezone(self, discord_id: int, new_time_zone: str):
         """
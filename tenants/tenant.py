@@ -0,0 +1,57 @@
+from typing import Iterable, Optional
+
+# The team of a deployment that is configured through the single-team environment variables
+DEFAULT_TEAM = 'default'
+
+class Tenant:
+    """Tenant class to store one team served by the bot.
+
+    All teams share the bot's gateway connection, database connections, GitHub harvester
+    and LLM backend; each team has its own members, weekly post, channel, admins and schedule.
+
+    Attributes:
+        name: The unique name of the team. It namespaces the team's data and scheduled jobs.
+        guild_id: The ID of the Discord guild the team's channel is in.
+        channel_id: The ID of the channel the team's weekly post and updates are posted in.
+        admin_ids: The Discord IDs of the members allowed to run admin commands for the team.
+        weekday_hour: The local hour of the status requests on weekdays.
+        weekend_hour: The local hour of the status requests on weekends.
+        channel: The Discord channel, once the bot is connected.
+        team_member_manager: The TeamMemberManager of the team's members.
+        weekly_post_manager: The WeeklyPostManager of the team's weekly post.
+        scheduler: The Scheduler running the team's jobs.
+        started: Whether the team's managers and schedule are running.
+    """
+
+    def __init__(self, name: str, guild_id: int, channel_id: int, admin_ids: Iterable[int],
+                 weekday_hour: int = 10, weekend_hour: int = 11) -> None:
+        """Initialize a new Tenant object.
+
+        Args:
+            name: The unique name of the team.
+            guild_id: The ID of the Discord guild the team's channel is in.
+            channel_id: The ID of the channel the team's weekly post and updates are posted in.
+            admin_ids: The Discord IDs of the members allowed to run admin commands for the team.
+            weekday_hour: The local hour of the status requests on weekdays. Defaults to 10.
+            weekend_hour: The local hour of the status requests on weekends. Defaults to 11.
+        """
+        self.name: str = name
+        self.guild_id: int = guild_id
+        self.channel_id: int = channel_id
+        self.admin_ids: set = set(admin_ids)
+        self.weekday_hour: int = weekday_hour
+        self.weekend_hour: int = weekend_hour
+        self.channel = None
+        self.team_member_manager = None
+        self.weekly_post_manager = None
+        self.scheduler = None
+        self.started: bool = False
+
+    @property
+    def job_namespace(self) -> str:
+        """The namespace of the team's scheduled jobs; the default team keeps unprefixed job IDs."""
+        return '' if self.name == DEFAULT_TEAM else self.name
+
+    def is_admin(self, discord_id: int) -> bool:
+        """Return whether the user is an admin of the team."""
+        return discord_id in self.admin_ids
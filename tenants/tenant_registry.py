@@ -0,0 +1,147 @@
+import json
+from typing import Dict, List, Optional
+from tenants.tenant import Tenant
+from team_members.team_member import TeamMember
+
+def load_tenants(path: str) -> List[Tenant]:
+    """
+    Load the teams from a JSON file.
+
+    The file holds a list of objects with the name, guild_id, channel_id and admin_ids of
+    each team, and optionally its weekday_hour and weekend_hour.
+
+    Args:
+        path: The path of the JSON file.
+
+    Returns:
+        A list of Tenant objects, in the order of the file.
+    """
+    with open(path) as f:
+        config = json.load(f)
+
+    tenants = []
+    for entry in config:
+        if '|' in entry['name']:
+            raise ValueError(f"Team name '{entry['name']}' must not contain '|'.")
+        tenants.append(Tenant(
+            name=entry['name'],
+            guild_id=int(entry['guild_id']),
+            channel_id=int(entry['channel_id']),
+            admin_ids=[int(admin_id) for admin_id in entry['admin_ids']],
+            weekday_hour=int(entry.get('weekday_hour', 10)),
+            weekend_hour=int(entry.get('weekend_hour', 11))
+        ))
+    return tenants
+
+class TenantRegistry:
+    """
+    Keeps the teams served by the bot and finds the team of a member or an admin.
+    """
+
+    def __init__(self, tenants: List[Tenant]):
+        """
+        Initializes a new TenantRegistry instance.
+
+        Args:
+            tenants: The teams served by the bot. Their names must be unique.
+        """
+        self.tenants: Dict[str, Tenant] = {}
+        for tenant in tenants:
+            if tenant.name in self.tenants:
+                raise ValueError(f"Team '{tenant.name}' is configured more than once.")
+            self.tenants[tenant.name] = tenant
+        self.selected_tenants: Dict[int, str] = {}  # Team each admin of several teams chose to manage
+
+    def get_tenant(self, name: str) -> Optional[Tenant]:
+        """
+        Fetches a team by its name.
+
+        Args:
+            name: The name of the team.
+
+        Returns:
+            The Tenant, or None if there is no such team.
+        """
+        return self.tenants.get(name)
+
+    def all_tenants(self) -> List[Tenant]:
+        """
+        Returns every team, in the order they were configured.
+        """
+        return list(self.tenants.values())
+
+    def started_tenants(self) -> List[Tenant]:
+        """
+        Returns the teams whose managers and schedule are running, in the order they were configured.
+        """
+        return [tenant for tenant in self.tenants.values() if tenant.started]
+
+    def find_member_tenant(self, discord_id: int) -> Optional[Tenant]:
+        """
+        Finds the team a member belongs to.
+
+        Args:
+            discord_id: The Discord ID of the member.
+
+        Returns:
+            The Tenant, or None if the member is in no team.
+        """
+        for tenant in self.tenants.values():
+            if tenant.team_member_manager and tenant.team_member_manager.find_member(discord_id):
+                return tenant
+        return None
+
+    def find_member(self, discord_id: int) -> Optional[TeamMember]:
+        """
+        Finds a member in any team.
+
+        Args:
+            discord_id: The Discord ID of the member.
+
+        Returns:
+            The TeamMember, or None if the member is in no team.
+        """
+        tenant = self.find_member_tenant(discord_id)
+        return tenant.team_member_manager.find_member(discord_id) if tenant else None
+
+    def admin_tenants(self, discord_id: int) -> List[Tenant]:
+        """
+        Returns the teams a user is an admin of.
+
+        Args:
+            discord_id: The Discord ID of the user.
+        """
+        return [tenant for tenant in self.tenants.values() if tenant.is_admin(discord_id)]
+
+    def get_admin_tenant(self, discord_id: int) -> Optional[Tenant]:
+        """
+        Returns the team an admin's commands apply to: the one they selected, or their first team.
+
+        Args:
+            discord_id: The Discord ID of the admin.
+
+        Returns:
+            The Tenant, or None if the user is not an admin of any team.
+        """
+        selected = self.tenants.get(self.selected_tenants.get(discord_id))
+        if selected and selected.is_admin(discord_id):
+            return selected
+        tenants = self.admin_tenants(discord_id)
+        return tenants[0] if tenants else None
+
+    def select_tenant(self, discord_id: int, name: str) -> bool:
+        """
+        Selects the team an admin of several teams manages with their commands.
+
+        Args:
+            discord_id: The Discord ID of the admin.
+            name: The name of the team.
+
+        Returns:
+            True if the user is an admin of the team and it was selected.
+        """
+        tenant = self.tenants.get(name)
+        if tenant is None or not tenant.is_admin(discord_id):
+            return False
+        self.selected_tenants[discord_id] = name
+        return True
@@ -1,6 +1,6 @@
 from datetime import datetime, timedelta
 import pytz
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 from base_db import BaseDB
 
 class UpdatesDB(BaseDB):
@@ -41,23 +41,33 @@ class UpdatesDB(BaseDB):
         finally:
             self.close()
 
-    def insert_status(self, discord_id: int, status: str, time_zone: str):
+    def insert_status(self, discord_id: int, status: str, time_zone: str, summarized_status: Optional[str] = None) -> int:
         """
         Inserts a new status update into the 'updates' table.
 
         :param discord_id: The Discord ID of the team member.
         :param status: The status update.
         :param time_zone: The time zone of the user.
+        :param summarized_status: The summarized status update, if it is already known.
+        :return: The ID of the inserted update.
         """
         # Convert current UTC time to user's local time zone
         utc_now = datetime.utcnow().replace(tzinfo=pytz.utc)
         local_now = utc_now.astimezone(pytz.timezone(time_zone))
 
-        query = "INSERT INTO updates (discord_id, status, timestamp, time_zone) VALUES (%s, %s, %s, %s)"
-        params = (discord_id, status, local_now, time_zone)
+        if not self.conn.is_connected():
+            print("Reconnecting to MySQL")
+            self.connect()
+
+        c = self.conn.cursor()
+        query = "INSERT INTO updates (discord_id, status, summarized_status, timestamp, time_zone) VALUES (%s, %s, %s, %s, %s)"
+        params = (discord_id, status, summarized_status, local_now, time_zone)
         try:
-            self.execute_query(query, params)
+            c.execute(query, params)
+            self.conn.commit()
+            return c.lastrowid
         finally:
+            c.close()
             self.close()
 
     def update_summarized_status(self, discord_id: int, summarized_status: str):
@@ -116,6 +126,43 @@ class UpdatesDB(BaseDB):
             c.close()
             self.close()
 
+    def get_weekly_checkins_counts(self, members: List[Tuple[int, str]]) -> Dict[int, int]:
+        """
+        Fetches the number of check-ins in the current week for several users in a single query.
+
+        :param members: The Discord ID and time zone of each user.
+        :return: A dictionary of check-in counts indexed by Discord ID; users without check-ins are left out.
+        """
+        if not members:
+            return {}
+        if not self.conn.is_connected():
+            print("Reconnecting to MySQL")
+            self.connect()
+
+        c = self.conn.cursor()
+
+        # Each user's week starts on the Monday of their own time zone
+        conditions = []
+        params = []
+        for discord_id, time_zone in members:
+            local_now = datetime.now(pytz.timezone(time_zone))
+            monday = local_now - timedelta(days=local_now.weekday())
+            monday = monday.replace(hour=0, minute=0, second=0, microsecond=0)
+            conditions.append("(discord_id = %s AND timestamp >= %s)")
+            params.extend((discord_id, monday))
+
+        query = f"""
+            SELECT discord_id, COUNT(*) FROM updates
+            WHERE {' OR '.join(conditions)}
+            GROUP BY discord_id
+        """
+        try:
+            c.execute(query, tuple(params))
+            return {row[0]: row[1] for row in c.fetchall()}
+        finally:
+            c.close()
+            self.close()
+
     def get_statuses_in_date_range(self, discord_id: int, start_date: datetime, end_date: datetime) -> List[str]:
         """
         Fetches all raw status updates for a given user within a specified date range.
@@ -147,7 +194,40 @@ class UpdatesDB(BaseDB):
         finally:
             c.close()
             self.close()
-    
+
+    def get_summarized_statuses_after(self, discord_id: int, start_date: datetime, end_date: datetime, after_id: int = 0) -> List[Tuple[int, str]]:
+        """
+        Fetches the summarized status updates for a given user within a date range whose ID is greater than after_id.
+
+        Args:
+            discord_id: The Discord ID of the user.
+            start_date: The start date of the date range.
+            end_date: The end date of the date range.
+            after_id: Only updates with an ID greater than this are returned.
+
+        Returns:
+            A list of (id, summarized_status) tuples ordered by ID.
+        """
+        if not self.conn.is_connected():
+            print("Reconnecting to MySQL")
+            self.connect()
+
+        c = self.conn.cursor()
+
+        query = """
+            SELECT id, summarized_status FROM updates
+            WHERE discord_id = %s AND timestamp >= %s AND timestamp <= %s
+                AND id > %s AND summarized_status IS NOT NULL
+            ORDER BY id
+        """
+        params = (discord_id, start_date, end_date, after_id)
+        try:
+            c.execute(query, params)
+            return [(row[0], row[1]) for row in c.fetchall()]
+        finally:
+            c.close()
+            self.close()
+
     def get_all_statuses_for_user(self, discord_id: int) -> List[dict]:
         """
         Fetches all status updates (both raw and summarized) for a given user.
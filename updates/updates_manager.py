@@ -1,31 +1,89 @@
-from typing import List, Tuple
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
 from updates.updates_db import UpdatesDB
+from llm.llm_backend import LLMBackend
+from llm.llm_config import load_model_config
 from datetime import datetime
-import openai
+import time
+from latency_histogram import LatencyHistogram
+
+# Coroutine receiving each chunk of text as it is generated
+DeltaCallback = Callable[[str], Awaitable[None]]
 
 class UpdatesManager:
     """
     Manages status updates for team members.
     """
 
-    def __init__(self, updates_db: UpdatesDB):
+    def __init__(self, updates_db: UpdatesDB, llm_backend: LLMBackend, models: Optional[Dict[str, str]] = None):
         """
         Initializes a new UpdatesManager instance.
 
         Args:
             updates_db: The UpdatesDB object that handles database operations.
+            llm_backend: The LLMBackend used for all summaries and evaluations.
+            models: The model to use per task. Defaults to the configured models from load_model_config.
         """
         self.updates_db = updates_db
+        self.llm_backend = llm_backend
+        self.models = models or load_model_config()
+        # Completion latencies and failures per model
+        self.completion_histograms: Dict[str, LatencyHistogram] = {}
+        self.completion_errors: Dict[str, int] = {}
+
+    async def _create_completion(self, model_engine: str, messages: List[dict], on_delta: Optional[DeltaCallback] = None) -> str:
+        """
+        Runs a chat completion and returns the generated text.
+
+        Args:
+            model_engine: The model to use.
+            messages: The chat messages to send.
+            on_delta: If given, the completion is streamed and this coroutine is called with each chunk.
+
+        Returns:
+            The generated text, stripped of surrounding whitespace.
+        """
+        started_at = time.perf_counter()
+        try:
+            if on_delta is None:
+                return await self.llm_backend.complete(model_engine, messages)
+
+            chunks = []
+            async for delta in self.llm_backend.stream(model_engine, messages):
+                chunks.append(delta)
+                await on_delta(delta)
+            return ''.join(chunks).strip()
+        except Exception:
+            self.completion_errors[model_engine] = self.completion_errors.get(model_engine, 0) + 1
+            raise
+        finally:
+            self.completion_histograms.setdefault(model_engine, LatencyHistogram()).observe(time.perf_counter() - started_at)
+
+    def completion_metrics(self) -> dict:
+        """
+        Returns the completion latency histogram and failure count of each model.
+
+        Returns:
+            A dictionary indexed by model with 'errors' and 'latency_seconds' entries.
+        """
+        return {
+            model: {'errors': self.completion_errors.get(model, 0), 'latency_seconds': histogram.snapshot()}
+            for model, histogram in sorted(self.completion_histograms.items())
+        }
 
-    def insert_status(self, discord_id: int, status: str, time_zone: str):
+    def insert_status(self, discord_id: int, status: str, time_zone: str, summarized_status: Optional[str] = None) -> int:
         """
         Inserts a new status update.
 
         Args:
             discord_id: The Discord ID of the team member.
             status: The status update.
+            time_zone: The time zone of the team member.
+            summarized_status: The summarized status update, if it is already known.
+
+        Returns:
+            The ID of the inserted update.
         """
-        self.updates_db.insert_status(discord_id, status, time_zone)
+        return self.updates_db.insert_status(discord_id, status, time_zone, summarized_status)
 
     def update_summarized_status(self, discord_id: int, summarized_status: str):
         """
@@ -50,6 +108,18 @@ class UpdatesManager:
         """
         return self.updates_db.get_weekly_checkins_count(discord_id, time_zone)
     
+    def get_weekly_checkins_counts(self, members: List[Tuple[int, str]]) -> Dict[int, int]:
+        """
+        Fetches the number of check-ins in the current week for several users at once.
+
+        Args:
+            members: The Discord ID and time zone of each user.
+
+        Returns:
+            A dictionary of check-in counts indexed by Discord ID; users without check-ins are left out.
+        """
+        return self.updates_db.get_weekly_checkins_counts(members)
+
     def get_all_statuses_for_user(self, discord_id: int) -> List[dict]:
         """
         Fetches all status updates (both raw and summarized) for a given user.
@@ -74,6 +144,21 @@ class UpdatesManager:
         """
         return self.updates_db.get_last_update_timestamp(discord_id)
 
+    def get_summarized_statuses_after(self, discord_id: int, start_date: datetime, end_date: datetime, after_id: int = 0) -> List[Tuple[int, str]]:
+        """
+        Fetches the summarized status updates within a date range that are newer than after_id.
+
+        Args:
+            discord_id: The Discord ID of the user.
+            start_date: The start date of the date range.
+            end_date: The end date of the date range.
+            after_id: Only updates with an ID greater than this are returned.
+
+        Returns:
+            A list of (id, summarized_status) tuples ordered by ID.
+        """
+        return self.updates_db.get_summarized_statuses_after(discord_id, start_date, end_date, after_id)
+
     def delete_newest_status(self, discord_id: int) -> None:
         """
         Deletes the most recent status update for a given user.
@@ -83,37 +168,32 @@ class UpdatesManager:
         """
         self.updates_db.delete_newest_status(discord_id)
 
-    async def generate_daily_summary(self, user_message: str) -> str:
+    async def generate_daily_summary(self, user_message: str, on_delta: Optional[DeltaCallback] = None) -> str:
         """
         Generates a daily summary of the user's message using a large language model.
 
         Args:
             user_message: The user's message that needs to be summarized.
+            on_delta: Optional coroutine called with each chunk of generated text to stream the output.
 
         Returns:
             The summarized message.
         """
-        # Prepare a system message to guide OpenAI's model
+        # Prepare a system message to guide the model
         system_message = "Please summarize the user's update into two sections: 'Did' for tasks completed yesterday and 'Do' for tasks planned for today."
         
-        # Prepare the messages input for ChatCompletion
+        # Prepare the messages input for the chat completion
         messages = [
             {"role": "system", "content": system_message},
             {"role": "user", "content": user_message}
         ]
         
         # Specify the model engine you want to use
-        model_engine = "gpt-3.5-turbo-1106"
+        model_engine = self.models['daily_summary']
         
         try:
-            # Make an API call to OpenAI's ChatCompletion
-            response = openai.ChatCompletion.create(
-                model=model_engine,
-                messages=messages
-            )
-            
-            # Extract the generated text
-            summarized_message = response['choices'][0]['message']['content'].strip()
+            # Call the LLM backend, streaming the output if requested
+            summarized_message = await self._create_completion(model_engine, messages, on_delta)
 
             return summarized_message
             
@@ -138,44 +218,61 @@ class UpdatesManager:
 
         if not weekly_statuses:
             return "There are no status updates for this week."
-        
+
+        weekly_summary = await self.summarize_weekly_statuses(weekly_statuses)
+        if weekly_summary is None:
+            return "Error in generating weekly summary"
+
+        return weekly_summary
+
+    async def summarize_weekly_statuses(self, statuses: List[str], previous_summary: Optional[str] = None) -> Optional[str]:
+        """
+        Summarizes daily status updates into a weekly summary, optionally folding them into an existing one.
+
+        Args:
+            statuses: The summarized daily status updates to include.
+            previous_summary: A weekly summary that already covers earlier updates of the same week.
+
+        Returns:
+            The weekly summary, or None if the model call failed.
+        """
         # Combine all raw statuses into a single string
-        combined_statuses = "\n".join(weekly_statuses)
-        
-        # Prepare a system message to guide OpenAI's model for weekly summary
-        system_message = "Please generate a comprehensive weekly summary based on the provided daily status updates, including only tasks that have been accomplished. Ignore tasks that are not in the 'Did' section."
-        
-        # Prepare the messages input for ChatCompletion
-        messages = [
-            {"role": "system", "content": system_message},
-            {"role": "user", "content": combined_statuses}
-        ]
-        
+        combined_statuses = "\n".join(statuses)
+
+        if previous_summary:
+            # Only the new updates are sent, so the prompt stays small as the week grows
+            system_message = "Please update the existing weekly summary with the new daily status updates, including only tasks that have been accomplished. Ignore tasks that are not in the 'Did' section. Return the complete updated weekly summary."
+            messages = [
+                {"role": "system", "content": system_message},
+                {"role": "user", "content": f"Existing Weekly Summary: {previous_summary}"},
+                {"role": "user", "content": f"New Daily Updates: {combined_statuses}"}
+            ]
+        else:
+            # Prepare a system message to guide the model for weekly summary
+            system_message = "Please generate a comprehensive weekly summary based on the provided daily status updates, including only tasks that have been accomplished. Ignore tasks that are not in the 'Did' section."
+            messages = [
+                {"role": "system", "content": system_message},
+                {"role": "user", "content": combined_statuses}
+            ]
+
         # Specify the model engine you want to use
-        model_engine = "gpt-4-0613"
-        
+        model_engine = self.models['weekly_summary']
+
         try:
-            # Make an API call to OpenAI's ChatCompletion
-            response = openai.ChatCompletion.create(
-                model=model_engine,
-                messages=messages
-            )
-            
-            # Extract the generated text
-            weekly_summary = response['choices'][0]['message']['content'].strip()
+            # Call the LLM backend
+            return await self._create_completion(model_engine, messages)
 
-            return weekly_summary
-            
         except Exception as e:
             print(f"An error occurred while generating the weekly summary: {e}")
-            return "Error in generating weekly summary"
-        
-    async def summarize_technical_updates(self, commit_messages: List[str]) -> str:
+            return None
+
+    async def summarize_technical_updates(self, commit_messages: List[str], on_delta: Optional[DeltaCallback] = None) -> str:
         """
         Summarizes the technical updates based on commit messages.
 
         Args:
             commit_messages: List of commit messages for the day.
+            on_delta: Optional coroutine called with each chunk of generated text to stream the output.
 
         Returns:
             A summarized version of the technical updates.
@@ -196,16 +293,11 @@ class UpdatesManager:
             {"role": "user", "content": combined_commits}
         ]
 
-        model_engine = "gpt-3.5-turbo-1106"
+        model_engine = self.models['technical_summary']
 
         try:
-            response = openai.ChatCompletion.create(
-                model=model_engine,
-                messages=messages
-            )
-
-            # Extract the generated summary
-            summarized_message = response['choices'][0]['message']['content'].strip()
+            # Call the LLM backend, streaming the output if requested
+            summarized_message = await self._create_completion(model_engine, messages, on_delta)
 
             return summarized_message
 
@@ -213,21 +305,22 @@ class UpdatesManager:
             print(f"An error occurred while generating the technical summary: {e}")
             return "Error in generating technical summary."
 
-    async def summarize_feedback_and_revisions(self, original_report: str, feedback: str) -> str:
+    async def summarize_feedback_and_revisions(self, original_report: str, feedback: str, on_delta: Optional[DeltaCallback] = None) -> str:
         """
         Takes the original report and user feedback and generates a revised summary.
 
         Args:
             original_report: The original summarized report.
             feedback: The user's feedback or suggested edits.
+            on_delta: Optional coroutine called with each chunk of generated text to stream the output.
 
         Returns:
             The revised summary.
         """
-        # Prepare a system message to guide OpenAI's model
+        # Prepare a system message to guide the model
         system_message = "Revise the original report based on the user's feedback."
 
-        # Prepare the messages input for ChatCompletion
+        # Prepare the messages input for the chat completion
         messages = [
             {"role": "system", "content": system_message},
             {"role": "user", "content": f"Original Report: {original_report}"},
@@ -235,17 +328,11 @@ class UpdatesManager:
         ]
         
         # Specify the model engine you want to use
-        model_engine = "gpt-3.5-turbo-1106"
+        model_engine = self.models['revision']
         
         try:
-            # Make an API call to OpenAI's ChatCompletion
-            response = openai.ChatCompletion.create(
-                model=model_engine,
-                messages=messages
-            )
-            
-            # Extract the generated text
-            revised_summary = response['choices'][0]['message']['content'].strip()
+            # Call the LLM backend, streaming the output if requested
+            revised_summary = await self._create_completion(model_engine, messages, on_delta)
 
             return revised_summary
             
@@ -253,12 +340,13 @@ class UpdatesManager:
             print(f"An error occurred while generating the revised summary: {e}")
             return "Error in generating revised summary"
 
-    async def summarize_non_technical_updates(self, update: str) -> str:
+    async def summarize_non_technical_updates(self, update: str, on_delta: Optional[DeltaCallback] = None) -> str:
         """
         Summarizes a non-technical update using a large language model.
 
         Args:
             update: The raw non-technical update provided by the user.
+            on_delta: Optional coroutine called with each chunk of generated text to stream the output.
 
         Returns:
             The summarized non-technical update.
@@ -267,24 +355,18 @@ class UpdatesManager:
         # System message to guide the LLM for a concise summary
         system_message = "Please provide a concise summary of the non-technical update shared by the user."
 
-        # Prepare the messages input for ChatCompletion
+        # Prepare the messages input for the chat completion
         messages = [
             {"role": "system", "content": system_message},
             {"role": "user", "content": update}
         ]
 
         # Specify the model engine you want to use
-        model_engine = "gpt-3.5-turbo-1106"
+        model_engine = self.models['non_technical_summary']
 
         try:
-            # Make an API call to OpenAI's ChatCompletion
-            response = openai.ChatCompletion.create(
-                model=model_engine,
-                messages=messages
-            )
-
-            # Extract the generated summary
-            summarized_message = response['choices'][0]['message']['content'].strip()
+            # Call the LLM backend, streaming the output if requested
+            summarized_message = await self._create_completion(model_engine, messages, on_delta)
 
             return summarized_message
 
@@ -292,12 +374,13 @@ class UpdatesManager:
             print(f"An error occurred while generating the non-technical summary: {e}")
             return "Error in generating summary"
 
-    async def summarize_goals_for_the_day(self, goals: str) -> str:
+    async def summarize_goals_for_the_day(self, goals: str, on_delta: Optional[DeltaCallback] = None) -> str:
         """
         Summarizes the user's goals for the day using a large language model.
 
         Args:
             goals: The user's raw input on their goals for the day.
+            on_delta: Optional coroutine called with each chunk of generated text to stream the output.
 
         Returns:
             The summarized goals for the day.
@@ -305,24 +388,18 @@ class UpdatesManager:
         # Initiate the conversation with the model
         system_message = "Please provide a concise summary of the user's goals for today."
         
-        # Prepare the messages input for ChatCompletion
+        # Prepare the messages input for the chat completion
         messages = [
             {"role": "system", "content": system_message},
             {"role": "user", "content": goals}
         ]
         
-        # Specify the model engine you want to use (this is an example and can be adjusted based on your needs)
-        model_engine = "gpt-3.5-turbo-1106"
+        # Specify the model engine you want to use
+        model_engine = self.models['goals_summary']
         
         try:
-            # Provide user's input and retrieve model's response
-            response = openai.ChatCompletion.create(
-                model=model_engine,
-                messages=messages
-            )
-            
-            # Extract the generated text
-            summarized_goals = response['choices'][0]['message']['content'].strip()
+            # Call the LLM backend, streaming the output if requested
+            summarized_goals = await self._create_completion(model_engine, messages, on_delta)
 
             # Return the summary
             return summarized_goals
@@ -331,17 +408,18 @@ class UpdatesManager:
             print(f"An error occurred while generating the goals summary: {e}")
             return "Error in generating goals summary"
         
-    async def evaluate_performance(self, user_message: str) -> str:
+    async def evaluate_performance(self, user_message: str, on_delta: Optional[DeltaCallback] = None) -> str:
         """
         Evaluates the performance of the user based on their update.
 
         Args:
             user_message: The user's message that needs to be evaluated.
+            on_delta: Optional coroutine called with each chunk of generated text to stream the output.
 
         Returns:
             The evaluation of the user's performance.
         """
-        # Prepare a system message to guide OpenAI's model
+        # Prepare a system message to guide the model
         system_message = """
         You are a project manager at a fast-paced tech startup, recognized for providing clear and actionable feedback during stand-up meetings. Your role is to evaluate the quality of team members' daily stand-up reports, with a focus on clear communication, comprehensive planning, and problem-solving abilities.
         It is essential to note that team members should neither be penalized nor rewarded for merely mentioning issues; instead, the emphasis should be on the clarity of the report and the quality of strategies proposed to address these issues.
@@ -359,24 +437,18 @@ class UpdatesManager:
         Provide clear and constructive feedback, aiming to foster a culture of excellence and continuous improvement in how we plan and communicate our daily activities.
         """
         
-        # Prepare the messages input for ChatCompletion
+        # Prepare the messages input for the chat completion
         messages = [
             {"role": "system", "content": system_message},
             {"role": "user", "content": user_message}
         ]
         
         # Specify the model engine you want to use
-        model_engine = "gpt-3.5-turbo-1106"
+        model_engine = self.models['performance_evaluation']
         
         try:
-            # Make an API call to OpenAI's ChatCompletion
-            response = openai.ChatCompletion.create(
-                model=model_engine,
-                messages=messages
-            )
-            
-            # Extract the generated text
-            performance_evaluation = response['choices'][0]['message']['content'].strip()
+            # Call the LLM backend, streaming the output if requested
+            performance_evaluation = await self._create_completion(model_engine, messages, on_delta)
 
             return performance_evaluation
             
@@ -1,131 +1,406 @@
+import asyncio
 from datetime import datetime, timedelta
 import pytz
-from typing import List
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set
 from weekly_posts.weekly_posts_db import WeeklyPostsDB
 from team_members.team_member import TeamMember
 
+@lru_cache(maxsize=4096)
+def render_line(name: str, check_ins: int, streak: int, name_width: int) -> str:
+    """
+    Renders the line of one member on the board, reusing it while nothing on it changed.
+
+    Args:
+        name: The name of the member.
+        check_ins: The number of check-ins of the member this week.
+        streak: The current streak of the member.
+        name_width: The width the names are padded to for alignment.
+
+    Returns:
+        The line of the member.
+    """
+    # Generate the marks based on the number of check-ins
+    marks = "✅" * check_ins + "❓" * (5 - check_ins)
+
+    # Include the streak with the fire emoji if the streak is greater than 0
+    streak_str = f" {streak}🔥" if streak > 0 else ""
+
+    return f"# `{name.ljust(name_width)} {marks} {streak_str}`"
+
 class WeeklyPostManager:
-    """Manages the status post in a Discord channel."""
-    
-    def __init__(self, channel, weekly_posts_db: WeeklyPostsDB):
+    """Manages the status post in a Discord channel.
+
+    The board is split into shards of at most shard_size members, in the order of the
+    team member list, and each shard is its own message so the board stays under Discord's
+    message length limit. A member's check-in only re-renders and edits their shard.
+
+    Time zones reach Monday at different times, so a member whose local week is still the
+    previous one is shown without check-ins on a new week's board until they roll over.
+
+    Updates requested with request_rebuild() are coalesced: the post is marked dirty and
+    rebuilt at most once per flush_interval, the edit is skipped when the rendered content
+    did not change, and the post's metadata is only written when its message changes.
+
+    Starting a new post, rebuilding it and deleting its shards hold one lock, so a forced
+    rebuild, a flush and a weekly rollover never edit or replace the shards at the same time.
+    """
+
+    def __init__(self, channel, weekly_posts_db: WeeklyPostsDB, flush_interval: float = 0, shard_size: int = 20,
+                 team: str = 'default', outbox=None):
         """
         Initializes a new WeeklyPostManager instance.
+
+        Args:
+            channel: The Discord channel the post is in.
+            weekly_posts_db: The WeeklyPostsDB object that handles database operations.
+            flush_interval: Minimum number of seconds between two rebuilds requested with request_rebuild().
+            shard_size: Maximum number of members shown in one message of the board.
+            team: The name of the team whose post this is.
+            outbox: Optional OutboundDispatcher the sends, edits and deletes are queued through.
         """
         self.channel = channel
         self.weekly_posts_db = weekly_posts_db
-        self.editable_weekly_post = None
+        self.team = team
+        self.outbox = outbox
+        self.flush_interval = flush_interval
+        self.shard_size = shard_size
+        self.shard_posts = []  # Message of each shard, None until it is fetched
+        self._rendered_shards: List[Optional[str]] = []  # Content each shard was last sent or edited with
+        self._dirty = False
+        self._rebuild_all = False
+        self._dirty_members: Set[int] = set()
+        self._pending_members: List[TeamMember] = []
+        self._rebuild_waiters: List[asyncio.Future] = []  # Resolved with the duration of the rebuild covering their request
+        self._flush_task = None
+        self._last_flush = 0.0
+        self._name_width = 0
+        self._member_shards: Dict[int, int] = {}  # Shard index of each member in the last rendered roster
+        self._lock = asyncio.Lock()  # Held while the shards are sent, edited or deleted
         self.load_weekly_post_data()
 
     def load_weekly_post_data(self):
         """
         Load the weekly post data from the database.
-        
-        This method queries the 'weekly_posts' table to get the ID and timestamp of 
-        the last weekly post. If no data exists, it sets the ID and timestamp to None.
+
+        This method queries the 'weekly_posts' table to get the message IDs and timestamp
+        of the last weekly board. If no data exists, there are no shards and the timestamp
+        is None. The timestamp is the start of the week the post covers.
+        """
+        rows = self.weekly_posts_db.get_weekly_post_shards(self.team)
+        self.shard_post_ids: List[int] = [row['post_id'] for row in rows]
+        self.shard_posts = [None] * len(rows)
+        self._rendered_shards = [None] * len(rows)
+        self.weekly_post_timestamp = rows[0]['timestamp'] if rows else None
+
+    def save_weekly_post_data(self, shard: int):
+        """
+        Save the data of one shard of the weekly post to the database.
+
+        This method inserts or updates the message ID, position and timestamp of the
+        shard in the 'weekly_posts' table.
+
+        Args:
+            shard: The index of the shard.
+        """
+        # All shards of a board share its timestamp, which is how they are found again
+        if self.weekly_post_timestamp is None:
+            self.weekly_post_timestamp = datetime.now().replace(microsecond=0)
+        self.weekly_posts_db.save_weekly_post_data(self.shard_post_ids[shard], self.weekly_post_timestamp, shard, self.team)
+
+    def shard_members(self, team_members: List[TeamMember]) -> List[List[TeamMember]]:
+        """
+        Splits the team members into the shards of the board.
+
+        Args:
+            team_members: A list of TeamMember objects, in the order they are shown.
+
+        Returns:
+            A list with the members of each shard.
+        """
+        return [team_members[i:i + self.shard_size] for i in range(0, len(team_members), self.shard_size)]
+
+    def _index_roster(self, team_members: List[TeamMember]):
+        """
+        Records the name width and the shard of every member for the current roster.
+
+        Args:
+            team_members: A list of TeamMember objects, in the order they are shown.
+        """
+        # Calculate the max name length for alignment purposes
+        self._name_width = max([len(m.name) for m in team_members])
+        self._member_shards = {m.discord_id: i // self.shard_size for i, m in enumerate(team_members)}
+
+    def board_checkins(self, member: TeamMember) -> int:
         """
-        data = self.weekly_posts_db.get_weekly_post_data()
-        self.editable_weekly_post_id = data.get('post_id', None)
-        self.weekly_post_timestamp = data.get('timestamp', None)
+        Returns the number of check-ins shown for a member on the board.
+
+        Args:
+            member: The member.
 
-    def save_weekly_post_data(self):
+        Returns:
+            The member's weekly check-ins, or 0 while their local week is before the board's week.
         """
-        Save the weekly post data to the database.
-        
-        This method inserts or updates the ID and timestamp of the current weekly post 
-        in the 'weekly_posts' table.
+        if self.weekly_post_timestamp is None:
+            return member.weekly_checkins
+        local_week = datetime.now(pytz.timezone(member.time_zone)).isocalendar()[:2]
+        if local_week < self.weekly_post_timestamp.isocalendar()[:2]:
+            return 0
+        return member.weekly_checkins
+
+    def render_shard(self, members: List[TeamMember], fresh: bool = False) -> str:
         """
-        self.weekly_posts_db.save_weekly_post_data(self.editable_weekly_post.id, datetime.now())
+        Renders one shard of the board from the members' cached lines.
 
-    async def initialize_post(self, team_members: List[TeamMember]):
+        Args:
+            members: The members of the shard.
+            fresh: Render every member without check-ins, as at the start of a week.
+
+        Returns:
+            The content of the shard's message.
+        """
+        return '\n'.join(
+            render_line(m.name, 0 if fresh else self.board_checkins(m), m.current_streak, self._name_width) for m in members
+        )
+
+    async def initialize_post(self, team_members: List[TeamMember], week_start: Optional[datetime] = None) -> bool:
         """
         Initializes or retrieves the weekly status post on Discord.
 
-        This function checks if a valid weekly post already exists for the current week.
-        If it does, it retrieves that post. Otherwise, it sends a new message in the Discord
-        channel with the list of team members and their statuses.
+        This function checks if a valid weekly post already exists for the given week or
+        a later one. If it does, it is kept. Otherwise, it sends new messages in the Discord
+        channel with the list of team members and their statuses, one per shard.
+
+        Since time zones roll over to a new week at different times, the first time zone to
+        reach its Monday starts the new post and the later ones reuse it.
 
         Args:
             team_members: A list of TeamMember objects to be displayed in the post.
+            week_start: Any moment of the week the post is for. Defaults to the current UTC week.
+
+        Returns:
+            True if a new post was started.
         """
-        current_week_number = datetime.now().isocalendar()[1]
-        saved_week_number = self.weekly_post_timestamp.isocalendar()[1] if self.weekly_post_timestamp else None
+        async with self._lock:
+            return await self._initialize_post(team_members, week_start)
 
-        # Skip initialization if the post already exists and is for the current week
-        if self.editable_weekly_post_id and current_week_number == saved_week_number:
-            self.editable_weekly_post = await self.channel.fetch_message(self.editable_weekly_post_id)
-            return
+    async def _initialize_post(self, team_members: List[TeamMember], week_start: Optional[datetime] = None) -> bool:
+        """Starts the weekly post unless it exists, see initialize_post(). The caller holds the lock."""
+        if week_start is None:
+            week_start = pytz.utc.localize(datetime.utcnow())
+        current_week = week_start.isocalendar()[:2]
+        saved_week = self.weekly_post_timestamp.isocalendar()[:2] if self.weekly_post_timestamp else None
 
-        utc_now = pytz.utc.localize(datetime.utcnow())
-        today_weekday = utc_now.weekday()
-        last_monday = utc_now - timedelta(days=today_weekday)
+        # Skip initialization if the post already exists and is for this week or a later one;
+        # its messages are fetched when they are first updated
+        if self.shard_post_ids and saved_week is not None and saved_week >= current_week:
+            return False
+
+        last_monday = week_start - timedelta(days=week_start.weekday())
         next_sunday = last_monday + timedelta(days=6)
 
         start_date = self.format_date(last_monday)
         end_date = self.format_date(next_sunday)
 
-        # Calculate the max name length for alignment purposes
-        max_name_length = max([len(m.name) for m in team_members])
+        await self._send(f"# Weekly Status Updates")
+        await self._send(f"## {start_date} to {end_date}")
+
+        # The previous week's messages stay in the channel; the new week starts its own shards
+        self.shard_post_ids, self.shard_posts, self._rendered_shards = [], [], []
+        if team_members:
+            self.weekly_post_timestamp = last_monday.replace(hour=12, minute=0, second=0, microsecond=0, tzinfo=None)
+            self._index_roster(team_members)
+            for shard in self.shard_members(team_members):
+                await self._update_shard(len(self.shard_posts), self.render_shard(shard, fresh=True))
+        return True
+
+    def request_rebuild(self, team_members: List[TeamMember], discord_id: Optional[int] = None):
+        """
+        Marks the post dirty so it is rebuilt at most once per flush_interval.
+
+        Requests made while a rebuild is pending are coalesced into that rebuild.
+
+        Args:
+            team_members: A list of TeamMember objects with updated statuses and streaks.
+            discord_id: The Discord ID of the only member whose line changed, so only their
+                shard is rebuilt. Defaults to rebuilding every shard.
 
-        member_list = []
-        for m in team_members:
-            # Include the streak with the fire emoji if the streak is greater than 0
-            streak_str = f" {m.current_streak}🔥" if m.current_streak > 0 else ""
+        Returns:
+            A future resolved with the seconds the rebuild covering this request took, not
+            counting the time the request waited for it.
+        """
+        rebuilt = asyncio.get_running_loop().create_future()
+        self._rebuild_waiters.append(rebuilt)
+        self._pending_members = team_members
+        if discord_id is None:
+            self._rebuild_all = True
+        else:
+            self._dirty_members.add(discord_id)
+        self._dirty = True
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.ensure_future(self._flush_when_due())
+        return rebuilt
 
-            # Construct the new line for the member with the updated information
-            new_line = f"# `{m.name.ljust(max_name_length)} {'❓' * 5} {streak_str}`"
-            member_list.append(new_line)
+    def cancel_pending_rebuild(self):
+        """
+        Drops the requested rebuilds and cancels the pending one, e.g. when another worker takes over the post.
+        """
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        self._flush_task = None
+        self._dirty, self._rebuild_all, self._dirty_members = False, False, set()
+        for waiter in self._rebuild_waiters:
+            waiter.cancel()
+        self._rebuild_waiters = []
 
-        member_list_str = '\n'.join(member_list)
+    async def _flush_when_due(self):
+        """Rebuilds the post once flush_interval has passed since the last rebuild, until it is clean."""
+        loop = asyncio.get_running_loop()
+        delay = self._last_flush + self.flush_interval - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
 
-        await self.channel.send(f"# Weekly Status Updates")
-        await self.channel.send(f"## {start_date} to {end_date}")
-        if member_list_str:
-            self.editable_weekly_post = await self.channel.send(f"{member_list_str}")
-            self.save_weekly_post_data()  # Save the ID and timestamp after creating the post
+        while self._dirty:
+            discord_ids = None if self._rebuild_all else self._dirty_members
+            waiters, self._rebuild_waiters = self._rebuild_waiters, []
+            self._dirty, self._rebuild_all, self._dirty_members = False, False, set()
+            started = loop.time()
+            try:
+                await self.rebuild_post(self._pending_members, discord_ids=discord_ids)
+            except Exception as e:
+                print(f"Failed to rebuild the weekly post: {e}")
+            finally:
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_result(loop.time() - started)
+            self._last_flush = loop.time()
+            # Requests that arrived during the rebuild are flushed after another interval
+            if self._dirty:
+                await asyncio.sleep(self.flush_interval)
 
-    async def rebuild_post(self, team_members: List[TeamMember]):
+    async def rebuild_post(self, team_members: List[TeamMember], force: bool = False,
+                           discord_ids: Optional[Iterable[int]] = None):
         """
-        Rebuilds the entire weekly status post from the team members' data.
+        Rebuilds the weekly status post from the team members' data.
+
+        Each shard is only edited if its content changed, and its metadata is only
+        saved when a new message was sent.
 
         Args:
             team_members: A list of TeamMember objects with updated statuses and streaks.
+            force: Edit the shards even if their content did not change.
+            discord_ids: Only rebuild the shards holding these members. Defaults to every shard.
         """
+        async with self._lock:
+            await self._rebuild_post(team_members, force, discord_ids)
+
+    async def _rebuild_post(self, team_members: List[TeamMember], force: bool = False,
+                            discord_ids: Optional[Iterable[int]] = None):
+        """Rebuilds the weekly status post, see rebuild_post(). The caller holds the lock."""
         # If there are no team members, delete the post and return
         if not team_members:
-            if self.editable_weekly_post:
-                await self.editable_weekly_post.delete()
-            self.editable_weekly_post = None
+            await self._delete_shards(0)
             return
 
-        # Calculate the max name length for alignment purposes
-        max_name_length = max([len(m.name) for m in team_members])
+        # Only the changed members' shards are rendered while the roster is the one last indexed
+        if discord_ids is not None and self._roster_unchanged(team_members, discord_ids):
+            for i in sorted({self._member_shards[discord_id] for discord_id in discord_ids}):
+                shard = team_members[i * self.shard_size:(i + 1) * self.shard_size]
+                await self._update_shard(i, self.render_shard(shard), force)
+            return
 
-        member_list = []
-        for m in team_members:
-            # Get the streak and number of weekly check-ins for the member
-            streak = m.current_streak
-            check_ins = m.weekly_checkins
+        # A roster change moves members between shards, so every shard is rebuilt
+        self._index_roster(team_members)
+        shards = self.shard_members(team_members)
+        for i, shard in enumerate(shards):
+            await self._update_shard(i, self.render_shard(shard), force)
 
-            # Generate the marks based on the number of check-ins
-            marks = "✅" * check_ins + "❓" * (5 - check_ins)
+        # Remove the shards left over after members were removed
+        await self._delete_shards(len(shards))
 
-            # Include the streak with the fire emoji if the streak is greater than 0
-            streak_str = f" {streak}🔥" if streak > 0 else ""
+    def _roster_unchanged(self, team_members: List[TeamMember], discord_ids: Iterable[int]) -> bool:
+        """
+        Checks that the given members are still where the last full rebuild put them.
 
-            # Construct the new line for the member with the updated information
-            new_line = f"# `{m.name.ljust(max_name_length)} {marks} {streak_str}`"
-            member_list.append(new_line)
+        Args:
+            team_members: A list of TeamMember objects, in the order they are shown.
+            discord_ids: The Discord IDs of the members whose lines changed.
 
-        new_content = '\n'.join(member_list)
+        Returns:
+            True if only the shards of these members need to be rendered.
+        """
+        if len(self._member_shards) != len(team_members) or len(self.shard_post_ids) != len(self.shard_members(team_members)):
+            return False
+        for discord_id in discord_ids:
+            shard = self._member_shards.get(discord_id)
+            if shard is None:
+                return False
+            members = team_members[shard * self.shard_size:(shard + 1) * self.shard_size]
+            if not any(m.discord_id == discord_id for m in members):
+                return False
+        return True
 
-        # Update the existing post or create a new one if it doesn't exist
-        if self.editable_weekly_post:
-            self.editable_weekly_post = await self.editable_weekly_post.edit(content=new_content)
-        else:
-            self.editable_weekly_post = await self.channel.send(new_content)
+    async def _update_shard(self, index: int, content: str, force: bool = False):
+        """
+        Edits a shard's message, or sends it if the shard is new.
 
-        # Save the ID and timestamp of the post
-        self.save_weekly_post_data()
+        Args:
+            index: The index of the shard.
+            content: The rendered content of the shard.
+            force: Edit the message even if its content did not change.
+        """
+        if index >= len(self.shard_post_ids):
+            post = await self._send(content)
+            self.shard_post_ids.append(post.id)
+            self.shard_posts.append(post)
+            self._rendered_shards.append(content)
+            self.save_weekly_post_data(index)
+            return
+
+        # Fetch the message once, e.g. after a restart, to know what it currently shows
+        if self.shard_posts[index] is None:
+            self.shard_posts[index] = await self.channel.fetch_message(self.shard_post_ids[index])
+            self._rendered_shards[index] = self.shard_posts[index].content
+
+        # Skip the edit if the shard already shows this content
+        if content == self._rendered_shards[index] and not force:
+            return
+
+        self.shard_posts[index] = await self._edit(self.shard_posts[index], content)
+        self._rendered_shards[index] = content
+
+    async def _delete_shards(self, start: int):
+        """
+        Deletes the messages of the shards from start onwards. The caller holds the lock.
+
+        Args:
+            start: The index of the first shard to delete.
+        """
+        while len(self.shard_post_ids) > start:
+            post_id = self.shard_post_ids.pop()
+            post = self.shard_posts.pop() or self.channel.get_partial_message(post_id)
+            self._rendered_shards.pop()
+            await self._delete(post)
+            self.weekly_posts_db.delete_weekly_post(post_id)
+
+    async def _send(self, content: str):
+        """Sends a message to the channel, through the outbox if there is one."""
+        if self.outbox:
+            return await self.outbox.send(self.channel, content)
+        return await self.channel.send(content)
+
+    async def _edit(self, message, content: str):
+        """Edits a message of the board, through the outbox if there is one, and returns the edited message."""
+        if self.outbox:
+            return await self.outbox.edit(message, content=content)
+        return await message.edit(content=content)
+
+    async def _delete(self, message):
+        """Deletes a message of the board, through the outbox if there is one."""
+        if self.outbox:
+            await self.outbox.delete(message)
+        else:
+            await message.delete()
 
     def format_date(self, dt: datetime) -> str:
         """
@@ -1,5 +1,5 @@
 import datetime
-from typing import Optional, Dict
+from typing import Dict, List
 from mysql.connector import errors
 from base_db import BaseDB
 
@@ -25,56 +25,79 @@ class WeeklyPostsDB(BaseDB):
     def _create_weekly_posts_table(self):
         """
         Creates the 'weekly_posts' table if it doesn't already exist.
+
+        The weekly board is split over several messages; each row is one of them, with
+        its position on the board in 'shard' and the team whose board it is in 'team'.
         """
         query = '''
             CREATE TABLE IF NOT EXISTS weekly_posts (
                 post_id BIGINT PRIMARY KEY,
+                shard INT NOT NULL DEFAULT 0,
+                team VARCHAR(64) NOT NULL DEFAULT 'default',
                 timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             );
         '''
         try:
             self.execute_query(query)
+            # Tables created before the board was sharded or shared by several teams
+            self.add_column_if_missing('weekly_posts', 'shard', "INT NOT NULL DEFAULT 0 AFTER post_id")
+            self.add_column_if_missing('weekly_posts', 'team', "VARCHAR(64) NOT NULL DEFAULT 'default' AFTER shard")
         finally:
             self.close()
 
-    def get_weekly_post_data(self) -> Optional[Dict[str, datetime.datetime]]:
+    def get_weekly_post_shards(self, team: str = 'default') -> List[Dict]:
         """
-        Fetches the most recent weekly post data from the 'weekly_posts' table.
+        Fetches the messages of a team's most recent weekly board from the 'weekly_posts' table.
 
-        :return: A dictionary containing the post ID and timestamp, or None if no data exists.
+        :param team: The name of the team.
+        :return: A list of dictionaries with the post ID, shard and timestamp of each message, ordered by shard.
+        """
+        query = """
+            SELECT post_id, shard, timestamp FROM weekly_posts
+            WHERE team = %s AND timestamp = (SELECT MAX(timestamp) FROM weekly_posts WHERE team = %s)
+            ORDER BY shard
         """
-        query = "SELECT post_id, timestamp FROM weekly_posts ORDER BY timestamp DESC LIMIT 1"
-        
+
         if not self.conn.is_connected():
             print("Reconnecting to MySQL")
             self.connect()
 
         c = self.conn.cursor()
         try:
-            c.execute(query)
-            row = c.fetchone()
-
-            if row:
-                return {'post_id': row[0], 'timestamp': row[1]}
-            return None
+            c.execute(query, (team, team))
+            return [{'post_id': row[0], 'shard': row[1], 'timestamp': row[2]} for row in c.fetchall()]
         finally:
             c.close()
             self.close()
 
-    def save_weekly_post_data(self, post_id: int, timestamp: datetime.datetime):
+    def save_weekly_post_data(self, post_id: int, timestamp: datetime.datetime, shard: int = 0, team: str = 'default'):
         """
-        Inserts or updates the weekly post data in the 'weekly_posts' table.
+        Inserts or updates the data of one weekly board message in the 'weekly_posts' table.
 
-        :param post_id: The ID of the weekly post.
+        :param post_id: The ID of the message.
         :param timestamp: The timestamp of the weekly post.
+        :param shard: The position of the message on the board.
+        :param team: The name of the team whose board it is.
         """
         query = """
-            INSERT INTO weekly_posts (post_id, timestamp)
-            VALUES (%s, %s)
-            ON DUPLICATE KEY UPDATE timestamp = %s
+            INSERT INTO weekly_posts (post_id, shard, team, timestamp)
+            VALUES (%s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE shard = %s, timestamp = %s
         """
-        params = (post_id, timestamp, timestamp)
+        params = (post_id, shard, team, timestamp, shard, timestamp)
         try:
             self.execute_query(query, params)
         finally:
             self.close()
+
+    def delete_weekly_post(self, post_id: int):
+        """
+        Deletes the data of a weekly board message that was removed.
+
+        :param post_id: The ID of the message.
+        """
+        query = "DELETE FROM weekly_posts WHERE post_id = %s"
+        try:
+            self.execute_query(query, (post_id,))
+        finally:
+            self.close()
@@ -0,0 +1,108 @@
+from typing import Optional, Dict
+from base_db import BaseDB
+
+class WeeklySummariesDB(BaseDB):
+    """
+    Database class that handles operations related to the 'weekly_summaries' table.
+    """
+
+    def __init__(self, host: str, user: str, password: str, database: str, port: str):
+        """
+        Initializes the WeeklySummariesDB class and creates the 'weekly_summaries' table if it doesn't exist.
+
+        :param host: The MySQL host address.
+        :param user: The MySQL user.
+        :param password: The MySQL password.
+        :param database: The MySQL database name.
+        :param port: The MySQL port number.
+        """
+        super().__init__(host, user, password, database, port)
+        self._create_weekly_summaries_table()
+
+    def _create_weekly_summaries_table(self):
+        """
+        Creates the 'weekly_summaries' table if it doesn't already exist.
+
+        Each row holds the rolling summary of one member's ISO week together with the
+        ID of the newest update folded into it, so later check-ins only need a delta.
+        """
+        query = '''
+            CREATE TABLE IF NOT EXISTS weekly_summaries (
+                discord_id BIGINT,
+                iso_year INT NOT NULL,
+                iso_week INT NOT NULL,
+                summary TEXT NOT NULL,
+                last_update_id INT NOT NULL DEFAULT 0,
+                status_count INT NOT NULL DEFAULT 0,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+                PRIMARY KEY (discord_id, iso_year, iso_week),
+                FOREIGN KEY (discord_id) REFERENCES team_members(discord_id) ON DELETE CASCADE
+            );
+        '''
+        try:
+            self.execute_query(query)
+        finally:
+            self.close()
+
+    def get_summary(self, discord_id: int, iso_year: int, iso_week: int) -> Optional[Dict]:
+        """
+        Fetches the stored summary for a member's ISO week.
+
+        :param discord_id: The Discord ID of the team member.
+        :param iso_year: The ISO year of the week.
+        :param iso_week: The ISO week number.
+        :return: A dictionary with the summary, last_update_id and status_count, or None if nothing is stored.
+        """
+        if not self.conn.is_connected():
+            print("Reconnecting to MySQL")
+            self.connect()
+
+        c = self.conn.cursor(dictionary=True)
+        query = """
+            SELECT summary, last_update_id, status_count FROM weekly_summaries
+            WHERE discord_id = %s AND iso_year = %s AND iso_week = %s
+        """
+        params = (discord_id, iso_year, iso_week)
+        try:
+            c.execute(query, params)
+            return c.fetchone()
+        finally:
+            c.close()
+            self.close()
+
+    def save_summary(self, discord_id: int, iso_year: int, iso_week: int, summary: str, last_update_id: int, status_count: int):
+        """
+        Inserts or updates the summary for a member's ISO week.
+
+        :param discord_id: The Discord ID of the team member.
+        :param iso_year: The ISO year of the week.
+        :param iso_week: The ISO week number.
+        :param summary: The rolling weekly summary.
+        :param last_update_id: The ID of the newest update included in the summary.
+        :param status_count: The number of updates included in the summary.
+        """
+        query = """
+            INSERT INTO weekly_summaries (discord_id, iso_year, iso_week, summary, last_update_id, status_count)
+            VALUES (%s, %s, %s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE summary = %s, last_update_id = %s, status_count = %s
+        """
+        params = (discord_id, iso_year, iso_week, summary, last_update_id, status_count, summary, last_update_id, status_count)
+        try:
+            self.execute_query(query, params)
+        finally:
+            self.close()
+
+    def delete_summary(self, discord_id: int, iso_year: int, iso_week: int):
+        """
+        Deletes the stored summary for a member's ISO week so it is rebuilt on the next request.
+
+        :param discord_id: The Discord ID of the team member.
+        :param iso_year: The ISO year of the week.
+        :param iso_week: The ISO week number.
+        """
+        query = "DELETE FROM weekly_summaries WHERE discord_id = %s AND iso_year = %s AND iso_week = %s"
+        params = (discord_id, iso_year, iso_week)
+        try:
+            self.execute_query(query, params)
+        finally:
+            self.close()
@@ -0,0 +1,182 @@
+import asyncio
+from datetime import datetime, timedelta
+import pytz
+from typing import Awaitable, Callable, List, Optional, Tuple
+from weekly_summaries.weekly_summaries_db import WeeklySummariesDB
+from updates.updates_manager import UpdatesManager
+from team_members.team_member import TeamMember
+
+class WeeklySummaryManager:
+    """
+    Maintains rolling weekly summaries per member and ISO week.
+
+    Summaries are folded forward after every check-in, so a request for a week only
+    needs the updates that arrived since the last refresh, which for a finished week
+    are usually none.
+    """
+
+    def __init__(self, weekly_summaries_db: WeeklySummariesDB, updates_manager: UpdatesManager):
+        """
+        Initializes a new WeeklySummaryManager instance.
+
+        Args:
+            weekly_summaries_db: The WeeklySummariesDB object that handles database operations.
+            updates_manager: The UpdatesManager used to read status updates and call the LLM.
+        """
+        self.weekly_summaries_db = weekly_summaries_db
+        self.updates_manager = updates_manager
+
+    @staticmethod
+    def week_bounds(iso_year: int, iso_week: int) -> Tuple[datetime, datetime]:
+        """
+        Returns the first and last moment of an ISO week as naive local datetimes.
+
+        Args:
+            iso_year: The ISO year of the week.
+            iso_week: The ISO week number.
+
+        Returns:
+            A tuple of the Monday 00:00 and Sunday 23:59:59.999999 of the week.
+        """
+        monday = datetime.fromisocalendar(iso_year, iso_week, 1)
+        sunday = monday + timedelta(days=6)
+        return monday, sunday.replace(hour=23, minute=59, second=59, microsecond=999999)
+
+    @staticmethod
+    def iso_week_for_range(start_date: datetime, end_date: datetime) -> Optional[Tuple[int, int]]:
+        """
+        Returns the ISO week covered by a date range if the range is exactly one Monday-to-Sunday week.
+
+        Args:
+            start_date: The start date of the range.
+            end_date: The end date of the range.
+
+        Returns:
+            An (iso_year, iso_week) tuple, or None if the range is not a single ISO week.
+        """
+        if start_date.weekday() != 0 or end_date.date() != (start_date + timedelta(days=6)).date():
+            return None
+        iso_year, iso_week, _ = start_date.isocalendar()
+        return iso_year, iso_week
+
+    async def refresh_week(self, discord_id: int, iso_year: int, iso_week: int) -> Optional[str]:
+        """
+        Folds any updates newer than the stored summary into the member's summary for the week.
+
+        Args:
+            discord_id: The Discord ID of the member.
+            iso_year: The ISO year of the week.
+            iso_week: The ISO week number.
+
+        Returns:
+            The up-to-date summary, or None if the week has no updates or the model call failed.
+        """
+        start_date, end_date = self.week_bounds(iso_year, iso_week)
+        cached = self.weekly_summaries_db.get_summary(discord_id, iso_year, iso_week)
+        last_update_id = cached['last_update_id'] if cached else 0
+
+        new_statuses = self.updates_manager.get_summarized_statuses_after(discord_id, start_date, end_date, last_update_id)
+        if not new_statuses:
+            return cached['summary'] if cached else None
+
+        previous_summary = cached['summary'] if cached else None
+        summary = await self.updates_manager.summarize_weekly_statuses([status for _, status in new_statuses], previous_summary)
+        if summary is None:
+            # Keep the previous summary; the missing updates are picked up on the next refresh
+            return previous_summary
+
+        status_count = (cached['status_count'] if cached else 0) + len(new_statuses)
+        self.weekly_summaries_db.save_summary(discord_id, iso_year, iso_week, summary, new_statuses[-1][0], status_count)
+        return summary
+
+    async def refresh_current_week(self, discord_id: int, time_zone: str) -> Optional[str]:
+        """
+        Updates the member's summary for their current local week after a check-in.
+
+        Args:
+            discord_id: The Discord ID of the member.
+            time_zone: The time zone of the member.
+
+        Returns:
+            The up-to-date summary for the current week, or None if it could not be built.
+        """
+        iso_year, iso_week, _ = datetime.now(pytz.timezone(time_zone)).isocalendar()
+        return await self.refresh_week(discord_id, iso_year, iso_week)
+
+    async def get_weekly_summary(self, discord_id: int, time_zone: str, start_date: datetime, end_date: datetime) -> str:
+        """
+        Returns the weekly summary for a date range, serving stored summaries where possible.
+
+        A single ISO week, finished or current, is brought up to date with a delta refresh,
+        which only calls the LLM for updates added since the stored summary, e.g. a late
+        status or one a failed refresh missed. Any other range falls back to a full regeneration.
+
+        Args:
+            discord_id: The Discord ID of the member.
+            time_zone: The time zone of the member.
+            start_date: The start date of the date range.
+            end_date: The end date of the date range.
+
+        Returns:
+            The weekly summary.
+        """
+        iso_week = self.iso_week_for_range(start_date, end_date)
+        if iso_week is None:
+            return await self.updates_manager.generate_weekly_summary(discord_id, start_date, end_date)
+
+        iso_year, week = iso_week
+        summary = await self.refresh_week(discord_id, iso_year, week)
+        if summary is None:
+            return await self.updates_manager.generate_weekly_summary(discord_id, start_date, end_date)
+        return summary
+
+    async def generate_team_digest(self, team_members: List[TeamMember], start_date: datetime, end_date: datetime,
+                                   max_concurrency: int = 4,
+                                   on_progress: Optional[Callable[[int, int], Awaitable[None]]] = None) -> str:
+        """
+        Generates every member's weekly summary concurrently and combines them into one digest.
+
+        Args:
+            team_members: The members to include in the digest.
+            start_date: The start date of the date range.
+            end_date: The end date of the date range.
+            max_concurrency: The maximum number of summaries generated at the same time.
+            on_progress: Optional coroutine called with (completed, total) after each member finishes.
+
+        Returns:
+            The combined digest with one section per member, in team order.
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        total = len(team_members)
+        completed = 0
+
+        async def summarize(member: TeamMember) -> str:
+            nonlocal completed
+            async with semaphore:
+                try:
+                    summary = await self.get_weekly_summary(member.discord_id, member.time_zone, start_date, end_date)
+                except Exception as e:
+                    print(f"An error occurred while generating the weekly summary for {member.name}: {e}")
+                    summary = "Error in generating weekly summary"
+            completed += 1
+            if on_progress:
+                await on_progress(completed, total)
+            return summary
+
+        summaries = await asyncio.gather(*(summarize(member) for member in team_members))
+
+        sections = [f"## {member.name}\n{summary}" for member, summary in zip(team_members, summaries)]
+        return '\n\n'.join(sections)
+
+    def invalidate_week_of(self, discord_id: int, timestamp: Optional[datetime]):
+        """
+        Drops the stored summary for the week containing a timestamp, e.g. after a status is deleted.
+
+        Args:
+            discord_id: The Discord ID of the member.
+            timestamp: The local timestamp whose ISO week should be invalidated.
+        """
+        if timestamp is None:
+            return
+        iso_year, iso_week, _ = timestamp.isocalendar()
+        self.weekly_summaries_db.delete_summary(discord_id, iso_year, iso_week)
@@ -0,0 +1,69 @@
+"""Local demonstration of the throughput of worker mode.
+
+Runs a synthetic status request workload with 1 to --max-workers processes. Members are
+split over the processes with member_partition(), as the bot does with WORKER_COUNT, and
+every status request spends --cpu-ms of CPU time (commit parsing and message formatting
+stand-in) plus one call to the stub LLM backend with --llm-latency seconds of latency.
+
+    python worker_demo.py --members 400 --max-workers 4
+"""
+import argparse
+import asyncio
+import hashlib
+import time
+from multiprocessing import Pool
+
+from llm.stub_backend import StubBackend
+from worker_partition import member_partition
+
+def burn_cpu(cpu_ms: float):
+    """Keeps the CPU busy for cpu_ms milliseconds of process time."""
+    deadline = time.process_time() + cpu_ms / 1000
+    digest = b''
+    while time.process_time() < deadline:
+        digest = hashlib.sha256(digest).digest()
+
+async def handle_member(discord_id: int, llm_backend: StubBackend, cpu_ms: float):
+    """Runs the synthetic work of one member's status request."""
+    burn_cpu(cpu_ms)
+    await llm_backend.complete('stub', [{'role': 'user', 'content': f"Summarize the commits of {discord_id}"}])
+
+async def run_partition(discord_ids, llm_latency: float, cpu_ms: float):
+    """Handles a worker's members concurrently, as the scheduler dispatches them."""
+    llm_backend = StubBackend(latency=llm_latency)
+    await asyncio.gather(*(handle_member(discord_id, llm_backend, cpu_ms) for discord_id in discord_ids))
+
+def run_worker(worker_args) -> int:
+    """Entry point of a worker process; returns the number of members it handled."""
+    worker_index, worker_count, discord_ids, llm_latency, cpu_ms = worker_args
+    owned_ids = [discord_id for discord_id in discord_ids if member_partition(discord_id, worker_count) == worker_index]
+    asyncio.run(run_partition(owned_ids, llm_latency, cpu_ms))
+    return len(owned_ids)
+
+def run_workload(worker_count: int, discord_ids, llm_latency: float, cpu_ms: float) -> float:
+    """Runs the workload on worker_count processes and returns the elapsed seconds."""
+    with Pool(worker_count) as pool:
+        start = time.perf_counter()
+        handled = sum(pool.map(run_worker, [(index, worker_count, discord_ids, llm_latency, cpu_ms) for index in range(worker_count)]))
+        elapsed = time.perf_counter() - start
+    assert handled == len(discord_ids)
+    return elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure status request throughput with 1 to N worker processes.")
+    parser.add_argument('--members', type=int, default=400, help="Number of synthetic members.")
+    parser.add_argument('--max-workers', type=int, default=4, help="Largest number of worker processes to try.")
+    parser.add_argument('--cpu-ms', type=float, default=20.0, help="CPU time per status request in milliseconds.")
+    parser.add_argument('--llm-latency', type=float, default=0.5, help="Latency of the stub LLM call in seconds.")
+    args = parser.parse_args()
+
+    discord_ids = [100000000000000000 + number for number in range(args.members)]
+    baseline = None
+    print(f"{args.members} members, {args.cpu_ms} ms CPU and {args.llm_latency} s LLM latency per status request")
+    for worker_count in range(1, args.max_workers + 1):
+        elapsed = run_workload(worker_count, discord_ids, args.llm_latency, args.cpu_ms)
+        baseline = baseline or elapsed
+        print(f"{worker_count} worker(s): {elapsed:.2f} s, {args.members / elapsed:.1f} members/s, speedup {baseline / elapsed:.2f}x")
+
+if __name__ == '__main__':
+    main()
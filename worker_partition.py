@@ -0,0 +1,17 @@
+import hashlib
+
+def member_partition(discord_id: int, worker_count: int) -> int:
+    """Return the index of the worker that handles a member's conversations and harvesting.
+
+    The index is derived from a hash of the Discord ID, so a member stays on the same
+    worker across restarts and as other members join or leave.
+
+    Args:
+        discord_id: The Discord ID of the member.
+        worker_count: The number of workers the members are spread over.
+    """
+    if worker_count <= 1:
+        return 0
+    # Uses other bytes of the digest than the scheduler's dispatch offset, so the two are independent
+    digest = hashlib.sha256(str(discord_id).encode()).digest()
+    return int.from_bytes(digest[8:16], 'big') % worker_count